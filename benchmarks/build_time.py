@@ -0,0 +1,159 @@
+"""Compares the build time of a large generated project with and without the
+build time options of `QtGqlConfig` (precompiled headers / unity builds).
+
+Usage::
+
+    poetry run python -m benchmarks.build_time --types 200 --operations 200 \
+        --cmake-arg=-DCMAKE_PREFIX_PATH=<qt and conan prefix paths>
+
+Requires CMake, Ninja and the dependencies of qtgql (see the README).
+"""
+# typer evaluates the annotations of `main` at runtime, `X | None` needs python 3.10.
+# ruff: noqa: UP006, UP007
+from __future__ import annotations
+
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import attrs
+import rich
+import rich.table
+import typer
+from attr import define
+from qtgqlcodegen.report import parse_ninja_log
+
+from benchmarks.large_project import create_large_project
+
+ROOT = Path(__file__).parent.parent
+console = rich.console.Console()
+
+WRAPPER_CMAKE = """
+cmake_minimum_required(VERSION 3.22.0)
+project(qtgql_build_benchmark LANGUAGES CXX)
+set(CMAKE_CXX_STANDARD 20)
+set(CMAKE_CXX_STANDARD_REQUIRED ON)
+add_subdirectory({root} qtgql)
+add_subdirectory(graphql/__generated__)
+"""
+
+
+@define
+class Variant:
+    name: str
+    precompile_headers: bool = False
+    unity_build_batch_size: int = 0
+
+
+@define
+class BuildResult:
+    variant: Variant
+    # wall clock time of the build.
+    seconds: float
+    # sum of the compile time of the generated objects.
+    cpu_seconds: float
+    objects: int
+
+
+def build_variant(
+    work_dir: Path,
+    variant: Variant,
+    types: int,
+    operations: int,
+    cmake_args: list[str],
+    jobs: int | None,
+) -> BuildResult:
+    project_dir = work_dir / variant.name
+    build_dir = project_dir / "build"
+    create_large_project(
+        project_dir / "graphql",
+        types,
+        operations,
+        precompile_headers=variant.precompile_headers,
+        unity_build_batch_size=variant.unity_build_batch_size,
+    )
+    (project_dir / "CMakeLists.txt").write_text(
+        WRAPPER_CMAKE.format(root=ROOT.resolve().as_posix()),
+        "utf-8",
+    )
+    subprocess.run(
+        ["cmake", "-S", str(project_dir), "-B", str(build_dir), "-G", "Ninja", *cmake_args],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    jobs_args = ["-j", str(jobs)] if jobs else []
+    # the runtime library is not part of the benchmark.
+    subprocess.run(
+        ["cmake", "--build", str(build_dir), "--target", "qtgql", *jobs_args],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    start = time.perf_counter()
+    subprocess.run(
+        ["cmake", "--build", str(build_dir), "--target", "Bench", *jobs_args],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    seconds = time.perf_counter() - start
+    generated = [
+        timing for timing in parse_ninja_log(build_dir / ".ninja_log") if "/Bench" in timing.output
+    ]
+    return BuildResult(
+        variant=variant,
+        seconds=seconds,
+        cpu_seconds=sum(t.seconds for t in generated),
+        objects=len(generated),
+    )
+
+
+def main(
+    types: int = typer.Option(200, help="Object types in the generated schema."),
+    operations: int = typer.Option(200, help="Operations to generate."),
+    unity_batch_size: int = typer.Option(16, help="Batch size of the unity variants."),
+    jobs: Optional[int] = typer.Option(None, help="Parallel build jobs."),
+    cmake_arg: List[str] = typer.Option([], help="Extra arguments for CMake configuration."),
+    keep: bool = typer.Option(False, help="Keep the build directories."),
+) -> None:
+    variants = [
+        Variant("baseline"),
+        Variant("pch", precompile_headers=True),
+        Variant("unity", unity_build_batch_size=unity_batch_size),
+        Variant(
+            "pch_unity",
+            precompile_headers=True,
+            unity_build_batch_size=unity_batch_size,
+        ),
+    ]
+    work_dir = Path(tempfile.mkdtemp(prefix="qtgql_build_benchmark_"))
+    results: list[BuildResult] = []
+    try:
+        for variant in variants:
+            console.print(f"[bold blue]Building {variant.name}...")
+            results.append(build_variant(work_dir, variant, types, operations, cmake_arg, jobs))
+    finally:
+        if not keep:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    baseline = results[0]
+    table = rich.table.Table(
+        title=f"Build time of {types} types / {operations} operations",
+    )
+    for column in ("Variant", "Wall (s)", "Compile (s)", "Objects", "Speedup"):
+        table.add_column(column)
+    for result in results:
+        table.add_row(
+            result.variant.name,
+            f"{result.seconds:.1f}",
+            f"{result.cpu_seconds:.1f}",
+            str(result.objects),
+            f"{baseline.seconds / result.seconds:.2f}x",
+        )
+    console.print(table)
+    console.print_json(data=[attrs.asdict(result) for result in results])
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,307 @@
+"""Builds the generated code of the test cases (and of synthetic large projects)
+and records the compile time, object size and binary size of every generated
+CMake target.
+
+Use it to evaluate the build cost of a change to the templates (or of a
+config option, with `--option <name>=<json value>`)::
+
+    poetry run python -m benchmarks.compile_cost --output before.json \
+        --cmake-arg=-DCMAKE_PREFIX_PATH=<qt and conan prefix paths>
+    # change the templates...
+    poetry run python -m benchmarks.compile_cost --baseline before.json \
+        --cmake-arg=-DCMAKE_PREFIX_PATH=<qt and conan prefix paths>
+
+Requires CMake, Ninja and the dependencies of qtgql (see the README).
+"""
+# typer evaluates the annotations of `main` at runtime, `X | None` needs python 3.10.
+# ruff: noqa: UP006, UP007
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import attrs
+import rich
+import rich.table
+import typer
+from attr import define
+from qtgqlcodegen.config import QtGqlConfig
+from qtgqlcodegen.report import CompileUnitTiming, parse_ninja_log
+from qtgqlcodegen.types import CUSTOM_SCALARS
+
+from benchmarks.build_time import ROOT
+from benchmarks.large_project import large_operations, large_schema
+
+console = rich.console.Console()
+
+WRAPPER_CMAKE = """
+cmake_minimum_required(VERSION 3.22.0)
+project(qtgql_compile_cost LANGUAGES CXX)
+set(CMAKE_CXX_STANDARD 20)
+set(CMAKE_CXX_STANDARD_REQUIRED ON)
+add_subdirectory({root} qtgql)
+"""
+
+# large projects as (types, operations).
+LARGE_PROJECTS = ((50, 50), (200, 200))
+BINARY_SUFFIXES = (".so", ".a", ".dylib", ".dll", ".lib")
+
+
+@define
+class BenchCase:
+    """Schema and operations to generate, the env name is the case name."""
+
+    name: str
+    schema: str
+    operations: str
+    config_options: dict = attrs.Factory(dict)
+
+
+@define
+class TargetCost:
+    name: str
+    compile_seconds: float
+    objects: int
+    object_bytes: int
+    binary_bytes: int
+
+
+@define
+class CaseCost:
+    name: str
+    # wall clock time of building the case.
+    seconds: float
+    targets: list[TargetCost] = attrs.Factory(list)
+
+    @property
+    def compile_seconds(self) -> float:
+        return sum(t.compile_seconds for t in self.targets)
+
+    @property
+    def object_bytes(self) -> int:
+        return sum(t.object_bytes for t in self.targets)
+
+    @property
+    def binary_bytes(self) -> int:
+        return sum(t.binary_bytes for t in self.targets)
+
+
+def testcase_bench_cases(names: list[str]) -> list[BenchCase]:
+    """The test cases of `tests/test_codegen/testcases.py` (all of them if no
+    names are given)."""
+    from tests.test_codegen.testcases import implemented_testcases
+
+    ret = []
+    for testcase in implemented_testcases:
+        if names and testcase.test_name not in names:
+            continue
+        if any(name not in CUSTOM_SCALARS for name in testcase.custom_scalars):
+            # user defined scalars have sources under `tests/gen`.
+            console.print(f"[yellow]Skipping {testcase.test_name} (user defined scalars)")
+            continue
+        ret.append(
+            BenchCase(
+                name=testcase.test_name,
+                schema=testcase.schema.as_str(),
+                operations=testcase.operations,
+                config_options={
+                    "custom_scalars": testcase.custom_scalars,
+                    "deserialize_only_operations": testcase.deserialize_only_operations,
+                    "headless": testcase.headless,
+                    "single_qml_module": testcase.single_qml_module,
+                    "table_driven_deserialization": testcase.table_driven_deserialization,
+                },
+            ),
+        )
+    return ret
+
+
+def large_bench_cases() -> list[BenchCase]:
+    return [
+        BenchCase(
+            name=f"Large{types}x{operations}",
+            schema=large_schema(types),
+            operations=large_operations(types, operations),
+        )
+        for types, operations in LARGE_PROJECTS
+    ]
+
+
+def generate_case(work_dir: Path, case: BenchCase) -> Path:
+    """Generates the case and returns the generated directory."""
+    graphql_dir = work_dir / case.name / "graphql"
+    graphql_dir.mkdir(parents=True)
+    (graphql_dir / "schema.graphql").write_text(case.schema, "utf-8")
+    (graphql_dir / "operations.graphql").write_text(case.operations, "utf-8")
+    config = QtGqlConfig(graphql_dir=graphql_dir, env_name=case.name, **case.config_options)
+    config.generate()
+    return config.generated_dir
+
+
+def target_of(path: str) -> str | None:
+    """CMake puts the objects of a target under `CMakeFiles/<target>.dir/`."""
+    parts = Path(path).parts
+    for i, part in enumerate(parts[:-1]):
+        if part == "CMakeFiles" and parts[i + 1].endswith(".dir"):
+            return parts[i + 1][: -len(".dir")]
+    return None
+
+
+def binary_size(build_dir: Path, target: str) -> int:
+    ret = 0
+    for suffix in BINARY_SUFFIXES:
+        for name in (f"lib{target}{suffix}", f"{target}{suffix}"):
+            for binary in build_dir.rglob(name):
+                ret += binary.stat().st_size
+    return ret
+
+
+def case_of(target: str, cases: list[BenchCase]) -> BenchCase | None:
+    """Targets of a case are prefixed with its env name, the longest name wins
+    (i.e `ListOfScalar` / `ListOfScalarArgument`)."""
+    matches = [case for case in cases if target.startswith(case.name)]
+    return max(matches, key=lambda case: len(case.name)) if matches else None
+
+
+def collect_targets(
+    build_dir: Path,
+    case: BenchCase,
+    cases: list[BenchCase],
+    timings: list[CompileUnitTiming],
+) -> list[TargetCost]:
+    seconds: dict[str, float] = {}
+    objects: dict[str, list[Path]] = {}
+    for timing in timings:
+        target = target_of(timing.output)
+        if target and case_of(target, cases) is case:
+            seconds[target] = seconds.get(target, 0) + timing.seconds
+            objects.setdefault(target, []).append(build_dir / timing.output)
+    return sorted(
+        (
+            TargetCost(
+                name=target,
+                compile_seconds=seconds[target],
+                objects=len(objects[target]),
+                object_bytes=sum(o.stat().st_size for o in objects[target] if o.exists()),
+                binary_bytes=binary_size(build_dir, target),
+            )
+            for target in seconds
+        ),
+        key=lambda t: t.compile_seconds,
+        reverse=True,
+    )
+
+
+def build_cases(
+    work_dir: Path,
+    cases: list[BenchCase],
+    cmake_args: list[str],
+    jobs: int | None,
+) -> list[CaseCost]:
+    """Builds all the cases in a single build tree, so qtgql itself is built
+    once."""
+    build_dir = work_dir / "build"
+    cmake = WRAPPER_CMAKE.format(root=ROOT.resolve().as_posix())
+    for case in cases:
+        generated_dir = generate_case(work_dir, case)
+        cmake += f"add_subdirectory({generated_dir.as_posix()} {case.name})\n"
+    (work_dir / "CMakeLists.txt").write_text(cmake, "utf-8")
+    subprocess.run(
+        ["cmake", "-S", str(work_dir), "-B", str(build_dir), "-G", "Ninja", *cmake_args],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    jobs_args = ["-j", str(jobs)] if jobs else []
+    subprocess.run(
+        ["cmake", "--build", str(build_dir), "--target", "qtgql", *jobs_args],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    ret: list[CaseCost] = []
+    for case in cases:
+        console.print(f"[bold blue]Building {case.name}...")
+        start = time.perf_counter()
+        subprocess.run(
+            ["cmake", "--build", str(build_dir), "--target", case.name, *jobs_args],
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        ret.append(CaseCost(name=case.name, seconds=time.perf_counter() - start))
+    timings = parse_ninja_log(build_dir / ".ninja_log")
+    for cost, case in zip(ret, cases):
+        cost.targets = collect_targets(build_dir, case, cases, timings)
+    return ret
+
+
+def to_json(costs: list[CaseCost]) -> str:
+    ret = []
+    for cost in costs:
+        cost_dict = attrs.asdict(cost)
+        cost_dict["compile_seconds"] = cost.compile_seconds
+        cost_dict["object_bytes"] = cost.object_bytes
+        cost_dict["binary_bytes"] = cost.binary_bytes
+        ret.append(cost_dict)
+    return json.dumps(ret, indent=2)
+
+
+def _delta(value: float, baseline: dict | None, key: str) -> str:
+    if not baseline or not baseline.get(key):
+        return ""
+    return f" ({(value - baseline[key]) / baseline[key]:+.1%})"
+
+
+def print_costs(costs: list[CaseCost], baseline: list[dict] | None) -> None:
+    baseline_by_name = {case["name"]: case for case in baseline or []}
+    table = rich.table.Table(title="Build cost of the generated code")
+    for column in ("Case", "Wall (s)", "Compile (s)", "Objects (KiB)", "Binaries (KiB)"):
+        table.add_column(column)
+    for cost in costs:
+        base = baseline_by_name.get(cost.name)
+        table.add_row(
+            cost.name,
+            f"{cost.seconds:.1f}{_delta(cost.seconds, base, 'seconds')}",
+            f"{cost.compile_seconds:.1f}{_delta(cost.compile_seconds, base, 'compile_seconds')}",
+            f"{cost.object_bytes / 1024:.0f}{_delta(cost.object_bytes, base, 'object_bytes')}",
+            f"{cost.binary_bytes / 1024:.0f}{_delta(cost.binary_bytes, base, 'binary_bytes')}",
+        )
+    console.print(table)
+
+
+def main(
+    testcase: List[str] = typer.Option([], help="Test cases to build (default: all)."),
+    large: bool = typer.Option(True, help="Build the synthetic large projects as well."),
+    jobs: Optional[int] = typer.Option(None, help="Parallel build jobs."),
+    cmake_arg: List[str] = typer.Option([], help="Extra arguments for CMake configuration."),
+    output: Optional[Path] = typer.Option(None, help="Write the results as JSON."),
+    baseline: Optional[Path] = typer.Option(None, help="JSON results to compare with."),
+    option: List[str] = typer.Option(
+        [],
+        help="`QtGqlConfig` option for all the cases as <name>=<json value>.",
+    ),
+    keep: bool = typer.Option(False, help="Keep the build directory."),
+) -> None:
+    cases = testcase_bench_cases(testcase)
+    if large:
+        cases.extend(large_bench_cases())
+    for name, value in (o.split("=", 1) for o in option):
+        for case in cases:
+            case.config_options[name] = json.loads(value)
+    work_dir = Path(tempfile.mkdtemp(prefix="qtgql_compile_cost_"))
+    try:
+        costs = build_cases(work_dir, cases, cmake_arg, jobs)
+    finally:
+        if not keep:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    print_costs(costs, json.loads(baseline.read_text("utf-8")) if baseline else None)
+    if output:
+        output.write_text(to_json(costs), "utf-8")
+
+
+if __name__ == "__main__":
+    typer.run(main)
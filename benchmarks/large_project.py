@@ -0,0 +1,77 @@
+"""A synthetic schema and operations, large enough for the build cost of the
+generated code to dominate."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from qtgqlcodegen.config import QtGqlConfig
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def large_schema(types: int) -> str:
+    ret = [
+        "interface Node {\n  id: ID!\n}",
+    ]
+    for i in range(types):
+        next_type = f"Type{(i + 1) % types}"
+        ret.append(
+            f"type Type{i} implements Node {{\n"
+            "  id: ID!\n"
+            "  name: String!\n"
+            "  count: Int!\n"
+            "  ratio: Float!\n"
+            "  flag: Boolean\n"
+            f"  next: {next_type}\n"
+            f"  items: [{next_type}!]!\n"
+            "}",
+        )
+    root_fields = "\n".join(f"  type{i}(id: ID!): Type{i}" for i in range(types))
+    ret.append(f"type Query {{\n{root_fields}\n}}")
+    return "\n\n".join(ret)
+
+
+def large_operations(types: int, operations: int) -> str:
+    ret = []
+    for i in range(operations):
+        ret.append(
+            f"query Operation{i}($id: ID!) {{\n"
+            f"  type{i % types}(id: $id) {{\n"
+            "    id\n"
+            "    name\n"
+            "    count\n"
+            "    next {\n"
+            "      id\n"
+            "      name\n"
+            "      flag\n"
+            "    }\n"
+            "    items {\n"
+            "      id\n"
+            "      ratio\n"
+            "    }\n"
+            "  }\n"
+            "}",
+        )
+    return "\n\n".join(ret)
+
+
+def create_large_project(
+    graphql_dir: Path,
+    types: int,
+    operations: int,
+    **config_options,
+) -> QtGqlConfig:
+    """Writes the schema and operations to `graphql_dir` and generates them.
+
+    :param config_options: Passed to `QtGqlConfig`.
+    """
+    graphql_dir.mkdir(parents=True, exist_ok=True)
+    (graphql_dir / "schema.graphql").write_text(large_schema(types), "utf-8")
+    (graphql_dir / "operations.graphql").write_text(
+        large_operations(types, operations),
+        "utf-8",
+    )
+    config = QtGqlConfig(graphql_dir=graphql_dir, env_name="Bench", **config_options)
+    config.generate()
+    return config
@@ -0,0 +1,185 @@
+"""Compares the time it takes QML to import the generated types of a large project
+with a QML module per operation and with `QtGqlConfig.single_qml_module`.
+
+Usage::
+
+    poetry run python -m benchmarks.startup_time --types 200 --operations 200 \
+        --cmake-arg=-DCMAKE_PREFIX_PATH=<qt and conan prefix paths>
+
+Requires CMake, Ninja and the dependencies of qtgql (see the README).
+"""
+# typer evaluates the annotations of `main` at runtime, `X | None` needs python 3.10.
+# ruff: noqa: UP006, UP007
+from __future__ import annotations
+
+import shutil
+import statistics
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+import attrs
+import rich
+import rich.table
+import typer
+from attr import define
+
+from benchmarks.build_time import ROOT, WRAPPER_CMAKE
+from benchmarks.large_project import create_large_project
+
+console = rich.console.Console()
+
+STARTUP_CMAKE = """
+find_package(Qt6 REQUIRED COMPONENTS Core Qml)
+add_executable(startup main.cpp)
+target_link_libraries(startup PRIVATE Qt6::Core Qt6::Qml Bench)
+"""
+
+# Prints the milliseconds it took to create a component that imports the
+# generated modules, the import path and QML source are passed as arguments.
+STARTUP_MAIN = """
+#include <QCoreApplication>
+#include <QElapsedTimer>
+#include <QQmlComponent>
+#include <QQmlEngine>
+#include <QTextStream>
+#include <QUrl>
+
+int main(int argc, char *argv[]) {
+  QCoreApplication app(argc, argv);
+  QElapsedTimer timer;
+  timer.start();
+  QQmlEngine engine;
+  engine.addImportPath(app.arguments().at(1));
+  QQmlComponent component(&engine);
+  component.setData(app.arguments().at(2).toUtf8(), QUrl());
+  auto root = component.create();
+  auto elapsed = timer.nsecsElapsed() / 1e6;
+  if (!root) {
+    QTextStream(stderr) << component.errorString();
+    return 1;
+  }
+  QTextStream(stdout) << elapsed;
+  return 0;
+}
+"""
+
+
+@define
+class Variant:
+    name: str
+    single_qml_module: bool = False
+
+
+@define
+class StartupResult:
+    variant: Variant
+    # median of the runs.
+    milliseconds: float
+    runs: list[float] = attrs.Factory(list)
+
+
+def qml_source(variant: Variant, operations: int) -> str:
+    if variant.single_qml_module:
+        imports = ["import GraphQL.Bench"]
+    else:
+        imports = [f"import GraphQL.Bench.Operation{i}" for i in range(operations)]
+    return "\n".join([*imports, "import QtQml", "QtObject {}"])
+
+
+def measure_variant(
+    work_dir: Path,
+    variant: Variant,
+    types: int,
+    operations: int,
+    runs: int,
+    cmake_args: list[str],
+    jobs: int | None,
+) -> StartupResult:
+    project_dir = work_dir / variant.name
+    build_dir = project_dir / "build"
+    create_large_project(
+        project_dir / "graphql",
+        types,
+        operations,
+        single_qml_module=variant.single_qml_module,
+    )
+    (project_dir / "CMakeLists.txt").write_text(
+        WRAPPER_CMAKE.format(root=ROOT.resolve().as_posix()) + STARTUP_CMAKE,
+        "utf-8",
+    )
+    (project_dir / "main.cpp").write_text(STARTUP_MAIN, "utf-8")
+    subprocess.run(
+        ["cmake", "-S", str(project_dir), "-B", str(build_dir), "-G", "Ninja", *cmake_args],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    jobs_args = ["-j", str(jobs)] if jobs else []
+    # builds the QML plugins too, the executable only links their backing libraries.
+    subprocess.run(
+        ["cmake", "--build", str(build_dir), *jobs_args],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    qml = qml_source(variant, operations)
+    timings = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [str(build_dir / "startup"), str(build_dir / "qml"), qml],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        timings.append(float(proc.stdout))
+    return StartupResult(
+        variant=variant,
+        milliseconds=statistics.median(timings),
+        runs=timings,
+    )
+
+
+def main(
+    types: int = typer.Option(200, help="Object types in the generated schema."),
+    operations: int = typer.Option(200, help="Operations to generate."),
+    runs: int = typer.Option(10, help="Process launches per variant."),
+    jobs: Optional[int] = typer.Option(None, help="Parallel build jobs."),
+    cmake_arg: List[str] = typer.Option([], help="Extra arguments for CMake configuration."),
+    keep: bool = typer.Option(False, help="Keep the build directories."),
+) -> None:
+    variants = [
+        Variant("module_per_operation"),
+        Variant("single_qml_module", single_qml_module=True),
+    ]
+    work_dir = Path(tempfile.mkdtemp(prefix="qtgql_startup_benchmark_"))
+    results: list[StartupResult] = []
+    try:
+        for variant in variants:
+            console.print(f"[bold blue]Building {variant.name}...")
+            results.append(
+                measure_variant(work_dir, variant, types, operations, runs, cmake_arg, jobs),
+            )
+    finally:
+        if not keep:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    baseline = results[0]
+    table = rich.table.Table(
+        title=f"QML import time of {types} types / {operations} operations ({runs} runs)",
+    )
+    for column in ("Variant", "Median (ms)", "Min (ms)", "Max (ms)", "Speedup"):
+        table.add_column(column)
+    for result in results:
+        table.add_row(
+            result.variant.name,
+            f"{result.milliseconds:.1f}",
+            f"{min(result.runs):.1f}",
+            f"{max(result.runs):.1f}",
+            f"{baseline.milliseconds / result.milliseconds:.2f}x",
+        )
+    console.print(table)
+    console.print_json(data=[attrs.asdict(result) for result in results])
+
+
+if __name__ == "__main__":
+    typer.run(main)
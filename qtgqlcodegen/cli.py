@@ -4,9 +4,10 @@ import glob
 import importlib.util
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 import rich
+import rich.table
 import typer
 
 import qtgqlcodegen
@@ -67,6 +68,70 @@ def gen() -> None:
     )
 
 
+@app.command()
+def report(
+    # typer evaluates the annotations at runtime, `X | None` needs python 3.10.
+    ninja_log: Optional[Path] = typer.Option(  # noqa: UP007
+        None,
+        help="`.ninja_log` of a build of the generated sources, adds compile time per operation.",
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print the report as JSON."),
+    types: int = typer.Option(
+        5, help="How many of the biggest narrowed types to show per operation."
+    ),
+) -> None:
+    """Reports the size (and optionally compile time) of the generated code per operation."""
+    config = _get_config()
+    generation_report = config.report(ninja_log)
+    if as_json:
+        console.print_json(generation_report.to_json())
+        return
+
+    table = rich.table.Table(title=f"Generated code for {config.env_name}")
+    for column in (
+        "Operation / narrowed type",
+        "Lines",
+        "Classes",
+        "Signals",
+        "Connections",
+        "Deserializers",
+        "Updaters",
+        "Compile time (s)",
+    ):
+        table.add_column(column)
+    rows = generation_report.sorted_by_cost()
+    if generation_report.fragments:
+        rows.append(generation_report.fragments)
+    for op in rows:
+        compile_seconds = op.compile_seconds
+        table.add_row(
+            f"[bold]{op.name}",
+            str(op.lines),
+            str(op.classes),
+            str(op.signals),
+            str(op.connections),
+            str(op.deserializers),
+            str(op.updaters),
+            f"{compile_seconds:.2f}" if compile_seconds is not None else "-",
+        )
+        for t in op.narrowed_types[:types]:
+            table.add_row(
+                f"  {t.name}",
+                str(t.lines),
+                "1",
+                str(t.signals),
+                str(t.connections),
+                str(t.deserializers),
+                str(t.updaters),
+                "",
+            )
+    console.print(table)
+    console.print(
+        f"[bold blue]schema: {generation_report.schema_lines} lines, "
+        f"total: {generation_report.total_lines} lines",
+    )
+
+
 @app.command()
 def hotreload():  # pragma: no cover
     raise NotImplementedError
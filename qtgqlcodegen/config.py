@@ -5,6 +5,7 @@ import graphql
 from attrs import Factory, define
 
 from qtgqlcodegen.generator import SchemaGenerator
+from qtgqlcodegen.report import GenerationReport
 from qtgqlcodegen.schema.definitions import CustomScalarMap
 from qtgqlcodegen.types import CUSTOM_SCALARS
 
@@ -37,6 +38,113 @@ class QtGqlConfig:
     """The name of the directory that qtgql will create and dump the generated
     sources."""
 
+    deserialize_only_operations: set[str] = Factory(set)
+    """Names of operations that would be generated without update paths.
+
+    Use this for operations that are executed once and never refreshed (or mutations
+    whose result is only read), their proxy types won't observe the concrete types
+    and every response would create new proxy objects.
+    This results in smaller code and faster compilation.
+    """
+
+    table_driven_deserialization: bool = False
+    """Whether the fields of the narrowed types are deserialized and updated by a
+    generic engine (`qtgql::bases::tables`) that reads constexpr field tables,
+    instead of code that is generated per field.
+
+    Object, interface and union fields (and lists of them) dispatch to the
+    deserializers / updaters of their narrowed types by the type id. Lists of
+    scalars and fields with arguments are still generated per field.
+
+    This results in smaller binaries and faster compilation for a small dispatch cost.
+    """
+
+    lazy_deserialization: bool = False
+    """Whether the scalar, enum and custom scalar fields of the concrete types keep
+    their raw JSON value (implicitly shared, not copied) and are converted on first
+    access by their getters.
+
+    Updates of fields that weren't read yet only replace the raw value.
+    Fields of object types (and lists of them) without arguments are deserialized
+    on first access too, unless their subtree has nodes or uses operation variables;
+    a proxy reads them when it is constructed unless `lazy_proxies` is on (lists are
+    read anyway, their models need their size).
+    Root fields and fields of interfaces or unions are deserialized eagerly, so are
+    all child objects with `skip_unchanged_subtrees`.
+    This takes precedence over `table_driven_deserialization` for these fields.
+    """
+
+    skip_unchanged_subtrees: bool = False
+    """Whether the updaters of root types and node types remember a structural hash
+    of the data they were updated from and skip it entirely when the same data is
+    received again and no instance of that subtree changed since (i.e polling a
+    query that rarely changes).
+
+    Hashing costs an extra pass over the response. Types whose selections use
+    operation variables are always updated.
+    """
+
+    lazy_proxies: bool = False
+    """Whether the proxies of nested objects, interfaces, unions and the items of
+    their lists are created on first access instead of when the parent proxy is
+    constructed.
+
+    Lazily created proxies are still owned by the parent proxy and share its
+    operation, they are destroyed with it (or when their row is removed) like
+    eagerly created ones. Proxies are not released once QML stops using them:
+    QML holds them by raw pointers, there is no reference count to tell when
+    that happens.
+    """
+
+    args_cache_size: int = 0
+    """How many values of a field with arguments are kept by each concrete instance
+    (i.e every pagination cursor of a field on the root type adds a value), if
+    greater than zero the least recently used values are evicted.
+
+    Values of arguments that live operations use are never evicted, so the bound
+    is exceeded while more operations use different arguments of the same field.
+    """
+
+    args_cache_sizes: dict[str, int] = Factory(dict)
+    """Overrides `args_cache_size` per field, keys are `"<Type>.<field>"` of the
+    type (or interface) that declares the field."""
+
+    keep_unused_schema_types: bool = False
+    """Whether to generate all the types of the schema.
+
+    By default only the object types, interfaces, fields, enums and input objects
+    that are reachable from the operations are generated in `schema.hpp`.
+    """
+
+    precompile_headers: bool = False
+    """Whether the generated targets should precompile the Qt and qtgql headers
+    that every generated source includes (`target_precompile_headers`)."""
+
+    unity_build_batch_size: int = 0
+    """If greater than zero the generated targets are built as unity (jumbo)
+    builds combining up to this many sources per translation unit.
+
+    This mostly helps the schema target that has a source per type.
+    """
+
+    single_qml_module: bool = False
+    """Whether to generate a single QML module (and library) for the whole
+    environment instead of a module per operation.
+
+    Apps with many operations load one QML plugin instead of one per operation,
+    import it with `import GraphQL.<env_name>`.
+    The narrowed types are registered as anonymous QML types.
+    """
+
+    headless: bool = False
+    """Whether to generate also a plain C++ variant of the operations under
+    `headless/` (CMake target `<env_name>headless`).
+
+    The headless types are plain structs (no QObjects, signals or moc) that
+    are deserialized on every response and the operations are executed directly
+    on a network layer, use this for non UI consumers.
+    """
+
     @cached_property
     def schema_path(self) -> Path:
         return self.graphql_dir / "schema.graphql"
@@ -68,6 +176,15 @@ class QtGqlConfig:
     def generate(self) -> None:
         self._evaluator.dump()
 
+    def report(self, ninja_log: Path | None = None) -> GenerationReport:
+        """Reports the size of the generated code per operation and per
+        narrowed type.
+
+        :param ninja_log: `.ninja_log` of a build of the generated sources,
+            used to attach compile time for each operation.
+        """
+        return self._evaluator.report(ninja_log)
+
     def __attrs_post_init__(self):
         if self.custom_scalars != CUSTOM_SCALARS:
             self.custom_scalars.update(CUSTOM_SCALARS)
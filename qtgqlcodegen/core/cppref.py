@@ -67,3 +67,4 @@ class QtGqlTypes:
     ListModelABC = QtGqlBasesNs().ns_add("ListModelABC")
     NodeInterfaceABC = QtGqlBasesNs().ns_add("NodeInterfaceABC")
     ObjectTypeABC = QtGqlBasesNs().ns_add("ObjectTypeABC")
+    OperationHandlerABC = QtGqlBasesNs().ns_add("OperationHandlerABC")
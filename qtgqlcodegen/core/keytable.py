@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from attr import define
+
+# seeds to try per table size before falling back to linear probing.
+MAX_SEED = 16
+# table sizes are tried up to `MAX_LOAD_FACTOR * len(keys) + 1`.
+MAX_LOAD_FACTOR = 2
+# sizes that would have more collisions than this (on average) are not tried,
+# a perfect hash of them is very unlikely (i.e many keys).
+MAX_EXPECTED_COLLISIONS = 4
+UINT32_MASK = 0xFFFFFFFF
+FNV_OFFSET_BASIS = 0x811C9DC5
+FNV_PRIME = 0x01000193
+
+
+def fnv1a(key: str) -> int:
+    ret = FNV_OFFSET_BASIS
+    for c in key:
+        ret = ((ret ^ ord(c)) * FNV_PRIME) & UINT32_MASK
+    return ret
+
+
+def mix(seed: int, hashed: int) -> int:
+    """Seeds a hash of a key (murmur3 finalizer)."""
+    ret = hashed ^ seed
+    ret ^= ret >> 16
+    ret = (ret * 0x85EBCA6B) & UINT32_MASK
+    ret ^= ret >> 13
+    ret = (ret * 0xC2B2AE35) & UINT32_MASK
+    return ret ^ (ret >> 16)
+
+
+def key_hash(seed: int, key: str) -> int:
+    """Must be kept in sync with `qtgql::bases::keys::key_hash`."""
+    return mix(seed, fnv1a(key))
+
+
+@define
+class KeyTable:
+    """Static keys of a JSON object and a hash table (computed here) that maps
+    an incoming key to its index, so deserializers can match the keys of an
+    object with a single pass over it.
+
+    See `qtgql::bases::keys::KeyTable`.
+    """
+
+    keys: tuple[str, ...]
+    seed: int
+    # index of the key at each bucket (-1 if empty), collisions are probed linearly.
+    buckets: tuple[int, ...]
+
+    @classmethod
+    def create(cls, keys: tuple[str, ...]) -> KeyTable:
+        """Looks for a seed without collisions (a perfect hash), there is always
+        at least one empty bucket, so lookups of unknown keys terminate."""
+        hashes = tuple(fnv1a(key) for key in keys)
+        if len(set(hashes)) == len(keys):
+            n = len(keys)
+            for size in range(n + 1, n * MAX_LOAD_FACTOR + 2):
+                if n * (n - 1) > MAX_EXPECTED_COLLISIONS * 2 * size:
+                    continue
+                for seed in range(MAX_SEED):
+                    if cls._is_perfect(hashes, seed, size):
+                        return cls._fill(keys, seed, size)
+        return cls._fill(keys, 0, len(keys) * 2 + 1)
+
+    @staticmethod
+    def _is_perfect(hashes: tuple[int, ...], seed: int, size: int) -> bool:
+        taken: set[int] = set()
+        for hashed in hashes:
+            bucket = mix(seed, hashed) % size
+            if bucket in taken:
+                return False
+            taken.add(bucket)
+        return True
+
+    @classmethod
+    def _fill(cls, keys: tuple[str, ...], seed: int, size: int) -> KeyTable:
+        buckets = [-1] * size
+        for index, key in enumerate(keys):
+            bucket = key_hash(seed, key) % size
+            while buckets[bucket] != -1:
+                bucket = (bucket + 1) % size
+            buckets[bucket] = index
+        return cls(keys=keys, seed=seed, buckets=tuple(buckets))
+
+    def index_of(self, key: str) -> int:
+        return self.keys.index(key)
+
+    @property
+    def cpp_type(self) -> str:
+        return f"qtgql::bases::keys::KeyTable<{len(self.keys)}, {len(self.buckets)}>"
+
+    @property
+    def cpp_initializer(self) -> str:
+        keys = ", ".join(f'QLatin1StringView("{key}")' for key in self.keys)
+        buckets = ", ".join(str(bucket) for bucket in self.buckets)
+        return f"{{{{{keys}}}, {self.seed}, {{{buckets}}}}}"
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import warnings
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, cast
 
 import jinja2
 from attrs import define
@@ -21,6 +21,11 @@ template_env: Environment = Environment(
 )
 
 
+def template_macro(template: jinja2.Template, name: str) -> Callable[..., str]:
+    """A macro that a template defines (`{% macro name(...) %}`), rendered by calling it."""
+    return cast(Callable[..., str], getattr(template.module, name))
+
+
 def debug_jinja(obj: Any) -> None:  # pragma: no cover
     warnings.warn("jinja debug is called", stacklevel=2)
     return obj
@@ -69,6 +74,30 @@ class CmakeTemplateContext:
     def target_name(self) -> str:
         return self.config.env_name
 
+    @property
+    def precompiled_headers(self) -> list[str]:
+        """Headers included by every generated source (and available to every
+        generated target)."""
+        return [
+            "<memory>",
+            "<QObject>",
+            "<QJsonObject>",
+            "<QJsonArray>",
+            "<qtgql/bases/bases.hpp>",
+        ]
+
+    @property
+    def targets(self) -> list[str]:
+        """Suffixes (after the env target name) of the targets that compile
+        generated sources."""
+        if self.config.single_qml_module:
+            return [""]
+        ret = ["schema"]
+        if fragments := self.generation_output.fragments:
+            ret.append(fragments.context.ns)
+        ret.extend(op.name for op in self.generation_output.operations)
+        return ret
+
 
 def cmake_template(context: CmakeTemplateContext) -> str:
     return CMAKE_TEMPLATE.render(context=context)
@@ -2,43 +2,94 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import attrs
 import graphql
 from attr import define
 
 from qtgqlcodegen.core.exceptions import QtGqlException
 from qtgqlcodegen.core.template import CmakeTemplateContext, cmake_template
+from qtgqlcodegen.headless.template import (
+    HEADLESS_NS,
+    HeadlessOperationTemplateContext,
+    headless_operation_template,
+    headless_schema_template,
+)
 from qtgqlcodegen.operation.evaluation import evaluate_operations
-from qtgqlcodegen.operation.template import OperationTemplateContext
+from qtgqlcodegen.operation.template import (
+    FragmentsTemplateContext,
+    OperationTemplateContext,
+)
+from qtgqlcodegen.report import GenerationReport, create_report
 from qtgqlcodegen.schema.evaluation import evaluate_schema
 from qtgqlcodegen.schema.template import (
     SchemaTemplateContext,
+    SchemaTypeTemplateContext,
+    fragments_cpp_template,
+    fragments_hpp_template,
     operation_cpp_template,
     operation_hpp_template,
+    schema_common_template_hpp,
+    schema_type_template_cpp,
+    schema_type_template_hpp,
     schema_types_template_hpp,
 )
-from qtgqlcodegen.types import BuiltinScalars
+from qtgqlcodegen.schema.usage import collect_schema_usage
+from qtgqlcodegen.types import SCHEMA_TYPES_DIR, SHARED_TYPES_NS, BuiltinScalars
 from qtgqlcodegen.utils import FileSpec
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from qtgqlcodegen.config import QtGqlConfig
+    from qtgqlcodegen.operation.definitions import (
+        QtGqlFragmentsDefinition,
+        QtGqlOperationDefinition,
+    )
+
+
+@define
+class SchemaOutput:
+    """`schema.hpp` includes all the types, each concrete type has its own
+    header and source under `schema/`."""
+
+    sources: list[FileSpec]
+    context: SchemaTemplateContext
 
 
 @define
 class OperationOutput:
     name: str
     sources: list[FileSpec]
+    context: OperationTemplateContext
+
+
+@define
+class FragmentsOutput:
+    """Narrowed types that are shared by the operations."""
+
+    sources: list[FileSpec]
+    context: FragmentsTemplateContext
 
 
 @define
 class GenerationOutput:
-    schema: FileSpec
+    schema: SchemaOutput
     operations: list[OperationOutput]
+    fragments: FragmentsOutput | None = None
+    # plain C++ sources, see `QtGqlConfig.headless`.
+    headless: list[FileSpec] = attrs.Factory(list)
 
     def dump(self) -> None:
-        self.schema.dump()
+        for source in self.schema.sources:
+            source.dump()
+        if self.fragments:
+            for source in self.fragments.sources:
+                source.dump()
         for op in self.operations:
             for source in op.sources:
                 source.dump()
+        for source in self.headless:
+            source.dump()
 
 
 class SchemaGenerator:
@@ -48,40 +99,134 @@ class SchemaGenerator:
         self.schema_type_info = evaluate_schema(schema, self.config.custom_scalars)
 
     def generate(self) -> GenerationOutput:
-        operations = self._generate_operations()
+        operations, fragments = self._generate_operations()
+        enums = list(self.schema_type_info.enums.values())
+        types = [
+            t
+            for name, t in self.schema_type_info.object_types.items()
+            if name not in BuiltinScalars.keys
+        ]
+        interfaces = list(self.schema_type_info.interfaces.values())
+        input_objects = list(self.schema_type_info.input_objects.values())
+        usage = None
+        if not self.config.keep_unused_schema_types:
+            usage = collect_schema_usage(
+                [op.context.operation for op in operations],
+                fragments.context.fragments if fragments else None,
+            )
+            enums = [e for e in enums if usage.uses_enum(e)]
+            types = [t for t in types if usage.uses_type(t)]
+            interfaces = [i for i in interfaces if usage.uses_type(i)]
+            input_objects = [i for i in input_objects if usage.uses_input_object(i)]
         context = SchemaTemplateContext(
-            enums=list(self.schema_type_info.enums.values()),
-            types=[
-                t
-                for name, t in self.schema_type_info.object_types.items()
-                if name not in BuiltinScalars.keys
-            ],
-            interfaces=list(self.schema_type_info.interfaces.values()),
-            input_objects=list(self.schema_type_info.input_objects.values()),
+            enums=enums,
+            types=types,
+            interfaces=interfaces,
+            input_objects=input_objects,
             config=self.config,
+            usage=usage,
         )
-        schema_hpp = FileSpec(
-            content=schema_types_template_hpp(context),
-            path=self.config.generated_dir / "schema.hpp",
-        )
-
         return GenerationOutput(
-            schema=schema_hpp,
+            schema=self._generate_schema(context),
             operations=operations,
+            fragments=fragments,
+            headless=self._generate_headless(
+                context,
+                [op.context.operation for op in operations],
+            )
+            if self.config.headless
+            else [],
         )
 
-    def _generate_operations(self) -> list[OperationOutput]:
+    def _generate_schema(self, context: SchemaTemplateContext) -> SchemaOutput:
+        types_dir = self.config.generated_dir / SCHEMA_TYPES_DIR
+        sources = [
+            FileSpec(
+                content=schema_types_template_hpp(context),
+                path=self.config.generated_dir / "schema.hpp",
+            ),
+            FileSpec(
+                content=schema_common_template_hpp(context),
+                path=types_dir / context.common_header,
+            ),
+        ]
+        for t in (*context.interfaces, *context.types):
+            type_context = SchemaTypeTemplateContext(schema=context, type=t)
+            sources.extend(
+                (
+                    FileSpec(
+                        content=schema_type_template_hpp(type_context),
+                        path=types_dir / f"{t.name}.hpp",
+                    ),
+                    FileSpec(
+                        content=schema_type_template_cpp(type_context),
+                        path=types_dir / f"{t.name}.cpp",
+                    ),
+                ),
+            )
+        return SchemaOutput(sources=sources, context=context)
+
+    def _generate_headless(
+        self,
+        schema_context: SchemaTemplateContext,
+        operations: list[QtGqlOperationDefinition],
+    ) -> list[FileSpec]:
+        headless_dir = self.config.generated_dir / HEADLESS_NS
+        ret = [
+            FileSpec(
+                content=headless_schema_template(schema_context),
+                path=headless_dir / "schema.hpp",
+            ),
+        ]
+        for operation in operations:
+            context = HeadlessOperationTemplateContext(operation=operation, config=self.config)
+            ret.append(
+                FileSpec(
+                    content=headless_operation_template(context),
+                    path=headless_dir / f"{operation.name}.hpp",
+                ),
+            )
+        return ret
+
+    def _generate_fragments(self, fragments: QtGqlFragmentsDefinition) -> FragmentsOutput | None:
+        if not fragments:
+            return None
+        context = FragmentsTemplateContext(fragments=fragments, config=self.config)
+        return FragmentsOutput(
+            sources=[
+                FileSpec(
+                    content=fragments_hpp_template(context=context),
+                    path=self.config.generated_dir / f"{SHARED_TYPES_NS}.hpp",
+                ),
+                FileSpec(
+                    content=fragments_cpp_template(context=context),
+                    path=self.config.generated_dir / f"{SHARED_TYPES_NS}.cpp",
+                ),
+            ],
+            context=context,
+        )
+
+    def _generate_operations(self) -> tuple[list[OperationOutput], FragmentsOutput | None]:
         operations_document = graphql.parse(self.config.operations_dir.read_text("utf-8"))
         # validate the operation against the static schema
         if errors := graphql.validate(self.gql_schema, operations_document):
             raise QtGqlException([error.formatted for error in errors])
 
-        operations = evaluate_operations(operations_document, self.schema_type_info)
+        operations, fragments = evaluate_operations(operations_document, self.schema_type_info)
+        if unknown := self.config.deserialize_only_operations.difference(operations.keys()):
+            raise QtGqlException(
+                f"Deserialize-only operations {sorted(unknown)} are not defined.",
+            )
         ret: list[OperationOutput] = []
         for op_name, op in operations.items():
+            if op_name.lower() == SHARED_TYPES_NS:
+                raise QtGqlException(
+                    f"Operation name {op_name} is reserved for the types generated for fragments.",
+                )
             context = OperationTemplateContext(
                 operation=op,
                 config=self.config,
+                deserialize_only=op_name in self.config.deserialize_only_operations,
             )
 
             ret.append(
@@ -97,10 +242,14 @@ class SchemaGenerator:
                             path=self.config.generated_dir / f"{op_name}.cpp",
                         ),
                     ],
+                    context=context,
                 ),
             )
 
-        return ret
+        return ret, self._generate_fragments(fragments)
+
+    def report(self, ninja_log: Path | None = None) -> GenerationReport:
+        return create_report(self.generate(), self.config, ninja_log)
 
     def dump(self):
         generation_output = self.generate()
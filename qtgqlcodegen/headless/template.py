@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from attr import define
+
+from qtgqlcodegen.core.keytable import KeyTable
+from qtgqlcodegen.core.template import template_env
+
+if TYPE_CHECKING:
+    from qtgqlcodegen.config import QtGqlConfig
+    from qtgqlcodegen.operation.definitions import QtGqlOperationDefinition
+    from qtgqlcodegen.schema.template import SchemaTemplateContext
+    from qtgqlcodegen.types import QtGqlQueriedObjectType, QtGqlTypeABC
+
+# directory (inside the generated dir) and namespace of the headless target.
+HEADLESS_NS = "headless"
+
+
+def headless_type_name(t: QtGqlTypeABC) -> str:
+    """The C++ (value) type of a queried field in the headless target.
+
+    Interfaces and unions are variants of their choices.
+    """
+    if model := t.is_model:
+        ret = f"std::vector<{headless_type_name(model.of_type)}>"
+    elif obj := t.is_queried_object_type:
+        ret = obj.name
+    elif narrowed := t.is_queried_interface or t.is_queried_union:
+        ret = f"std::variant<{', '.join(choice.name for choice in narrowed.choices)}>"
+    else:
+        ret = t.type_name()  # scalars and enums
+    # optionals forward the accessors above to the type they wrap.
+    return f"std::optional<{ret}>" if t.is_optional else ret
+
+
+def _collect_object_types(
+    t: QtGqlTypeABC,
+    ret: dict[str, QtGqlQueriedObjectType],
+) -> None:
+    if model := t.is_model:
+        _collect_object_types(model.of_type, ret)
+    elif narrowed := t.is_queried_interface or t.is_queried_union:
+        for choice in narrowed.choices:
+            _collect_object_types(choice, ret)
+    elif (obj := t.is_queried_object_type) and obj.name not in ret:
+        for field in obj.fields:
+            _collect_object_types(field.type, ret)
+        # types are held by value, dependencies must be defined first.
+        ret[obj.name] = obj
+
+
+@define(slots=False)
+class HeadlessOperationTemplateContext:
+    operation: QtGqlOperationDefinition
+    config: QtGqlConfig
+
+    @property
+    def ns(self) -> str:
+        return self.operation.name.lower()
+
+    @property
+    def object_types(self) -> list[QtGqlQueriedObjectType]:
+        """All the object types reachable from the root type (including the
+        ones shared by fragments), ordered by their dependencies."""
+        ret: dict[str, QtGqlQueriedObjectType] = {}
+        _collect_object_types(self.operation.root_type, ret)
+        return list(ret.values())
+
+    @staticmethod
+    def json_keys(t: QtGqlQueriedObjectType) -> KeyTable:
+        """`__typename` and the selected fields, in that order."""
+        return KeyTable.create(("__typename", *(f.name for f in t.fields)))
+
+
+template_env.globals.update(headless_type_name=headless_type_name)
+HEADLESS_SCHEMA_TEMPLATE = template_env.get_template("headless/schema.jinja.hpp")
+HEADLESS_OPERATION_TEMPLATE = template_env.get_template("headless/operation.jinja.hpp")
+
+
+def headless_schema_template(context: SchemaTemplateContext) -> str:
+    return HEADLESS_SCHEMA_TEMPLATE.render(context=context)
+
+
+def headless_operation_template(context: HeadlessOperationTemplateContext) -> str:
+    return HEADLESS_OPERATION_TEMPLATE.render(context=context)
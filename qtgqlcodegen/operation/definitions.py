@@ -26,12 +26,44 @@ if TYPE_CHECKING:
         QtGqlTypeABC,
     )
 
+    # the concrete type name and the name, type structure and variable uses of each field.
+    ObjectStructureKey = tuple[str, tuple[tuple[str, str, tuple[tuple[int, str], ...]], ...]]
+
 
 @attrs.define(slots=False, repr=False)
-class OperationTypeInfo:
-    schema_type_info: SchemaTypeInfo
+class NarrowedTypesRegistry:
     narrowed_types_map: dict[str, QtGqlQueriedObjectType] = attrs.Factory(dict)
     narrowed_interfaces_map: dict[str, QtGqlQueriedInterface] = attrs.Factory(dict)
+    # used to reuse types with structurally identical selections.
+    structures_map: dict[ObjectStructureKey, QtGqlQueriedObjectType] = attrs.Factory(dict)
+
+
+@attrs.define(slots=False, repr=False)
+class QtGqlFragmentsDefinition(NarrowedTypesRegistry):
+    """Narrowed types generated for fragments that don't use operation
+    variables.
+
+    These are generated once and shared by all the operations that use
+    the fragment.
+    """
+
+    @property
+    def narrowed_types(self) -> tuple[QtGqlQueriedObjectType, ...]:
+        return tuple(self.narrowed_types_map.values())
+
+    @property
+    def interfaces(self) -> tuple[QtGqlQueriedInterface, ...]:
+        return tuple(self.narrowed_interfaces_map.values())
+
+    def __bool__(self) -> bool:
+        return bool(self.narrowed_types_map or self.narrowed_interfaces_map)
+
+
+@attrs.define(slots=False, repr=False)
+class OperationTypeInfo(NarrowedTypesRegistry):
+    schema_type_info: SchemaTypeInfo = attrs.field(kw_only=True)
+    shared_types: QtGqlFragmentsDefinition = attrs.Factory(QtGqlFragmentsDefinition)
+    uses_shared_types: bool = False
     variables: list[QtGqlVariableDefinition] = attrs.Factory(list)
     used_fragments: HashAbleDict[str, gql_lang.FragmentDefinitionNode] = attrs.Factory(HashAbleDict)
     available_fragments: HashAbleDict[str, gql_lang.FragmentDefinitionNode] = attrs.Factory(
@@ -61,6 +93,11 @@ class QtGqlQueriedField:
     def variable_builder_name(self) -> str:
         return f"build_args_for_{self.name}"
 
+    def args_memo_name(self, parent: QtGqlQueriedObjectType) -> str:
+        """Member of the operation that keeps the arguments built by the builder of
+        this field in `parent`."""
+        return f"qtgql_args_{parent.name}_{self.name}"
+
     @property
     def name(self) -> str:
         return self.concrete.name
@@ -74,11 +111,13 @@ class QtGqlQueriedField:
 class QtGqlOperationDefinition:
     operation_def: gql_def.OperationDefinitionNode
     root_type: QtGqlQueriedObjectType
-    root_field: QtGqlQueriedField
+    # each root field is a property of the root type (the operation's `data`).
+    root_fields: tuple[QtGqlQueriedField, ...]
     variables: list[QtGqlVariableDefinition] = attrs.Factory(list)
     narrowed_types: tuple[QtGqlQueriedObjectType, ...] = attrs.Factory(tuple)
     interfaces: tuple[QtGqlQueriedInterface, ...] = attrs.Factory(tuple)
     used_fragments: tuple[gql_lang.FragmentDefinitionNode, ...] = attrs.Factory(tuple)
+    uses_shared_types: bool = False
 
     @property
     def generated_variables_type(self) -> str:
@@ -10,6 +10,7 @@ from qtgqlcodegen.core.graphql_ref import (
     SelectionsSet,
     is_field_node,
     is_fragment_definition_node,
+    is_fragment_spread_node,
     is_inline_fragment,
     is_list_node,
     is_named_type_node,
@@ -17,13 +18,15 @@ from qtgqlcodegen.core.graphql_ref import (
     is_operation_def_node,
 )
 from qtgqlcodegen.operation.definitions import (
+    NarrowedTypesRegistry,
     OperationTypeInfo,
+    QtGqlFragmentsDefinition,
     QtGqlOperationDefinition,
     QtGqlQueriedField,
     QtGqlVariableUse,
 )
 from qtgqlcodegen.operation.selections_injection import inject_required_selections
-from qtgqlcodegen.operation.utils import unwrap_frag_spreads
+from qtgqlcodegen.operation.utils import fragment_uses_variables, unwrap_frag_spreads
 from qtgqlcodegen.schema.definitions import (
     QtGqlFieldDefinition,
     QtGqlVariableDefinition,
@@ -42,6 +45,7 @@ from qtgqlcodegen.types import (
 from qtgqlcodegen.utils import HashAbleDict, require
 
 if TYPE_CHECKING:
+    from qtgqlcodegen.operation.definitions import ObjectStructureKey
     from qtgqlcodegen.types import QtGqlObjectType, QtGqlTypeABC
 
 
@@ -111,14 +115,25 @@ def _evaluate_selection_set_type(
     concrete_type: QtGqlTypeABC,
     selection_set_node: SelectionsSet | None,
     path: str,
+    shared: bool,
 ) -> QtGqlTypeABC:
     ret: QtGqlTypeABC | None = None
+    if selection_set_node and (
+        fragment := _get_shareable_fragment(type_info, concrete_type, selection_set_node)
+    ):
+        # evaluate from the fragment root so that every operation
+        # spreading it would end up with the same types.
+        path = fragment.name.value
+        shared = True
+        type_info.uses_shared_types = True
+
     if lst := concrete_type.is_model:
         ret = _evaluate_list(
             type_info=type_info,
             concrete=lst,
             selection_set=selection_set_node,
             path=path,
+            shared=shared,
         )
     elif not selection_set_node:
         # these types have no selections
@@ -135,6 +150,8 @@ def _evaluate_selection_set_type(
             concrete=obj_type,
             selection_set=selection_set_node,
             path=path,
+            shared=shared,
+            reuse_structure=True,
         )
 
     elif interface := concrete_type.is_interface:
@@ -143,6 +160,7 @@ def _evaluate_selection_set_type(
             concrete=interface,
             selection_set=selection_set_node,
             path=path,
+            shared=shared,
         )
     elif is_union := concrete_type.is_union:
         ret = _evaluate_union(
@@ -150,6 +168,7 @@ def _evaluate_selection_set_type(
             concrete=is_union,
             selection_set=selection_set_node,
             path=path,
+            shared=shared,
         )
 
     if not ret:  # pragma: no cover
@@ -166,6 +185,7 @@ def _evaluate_field(
     field_node: gql_lang.FieldNode,
     path: str,
     origin: QtGqlObjectType,
+    shared: bool,
 ) -> QtGqlQueriedField:
     path += concrete_field.name
     selection_set = None if not field_node.selection_set else field_node.selection_set.selections
@@ -175,6 +195,7 @@ def _evaluate_field(
             concrete_field.type,
             selection_set,
             path,
+            shared,
         ),
         concrete=concrete_field,
         variable_uses=_evaluate_variable_uses(type_info, concrete_field, field_node.arguments),
@@ -188,6 +209,7 @@ def _evaluate_list(
     concrete: QtGqlList,
     selection_set: SelectionsSet | None,
     path: str,
+    shared: bool,
 ) -> QtGqlList:
     return QtGqlList(
         of_type=_evaluate_selection_set_type(
@@ -195,6 +217,7 @@ def _evaluate_list(
             concrete_type=concrete.of_type,
             selection_set_node=selection_set,
             path=path,
+            shared=shared,
         ),
     )
 
@@ -204,6 +227,7 @@ def _evaluate_union(
     concrete: QtGqlUnion,
     selection_set: SelectionsSet,
     path: str,
+    shared: bool,
 ) -> QtGqlQueriedUnion:
     choices: dict[str, QtGqlQueriedObjectType] = {}
 
@@ -220,6 +244,8 @@ def _evaluate_union(
             concrete=resolved_type,
             selection_set=fragment.selection_set.selections,
             path=path,
+            shared=shared,
+            reuse_structure=True,
         )
 
     return QtGqlQueriedUnion(
@@ -272,25 +298,110 @@ def _create_name_for_path(
     return f"{concrete.name}__{path}"
 
 
+def _get_registry(type_info: OperationTypeInfo, shared: bool) -> NarrowedTypesRegistry:
+    return type_info.shared_types if shared else type_info
+
+
+def _get_shareable_fragment(
+    type_info: OperationTypeInfo,
+    concrete: QtGqlTypeABC,
+    selection_set: SelectionsSet,
+) -> gql_lang.FragmentDefinitionNode | None:
+    """A selection set can use a shared type if it is only a spread of a
+    fragment on this type, i.e `user {...UserFragment}`.
+
+    Fields that were injected alongside the spread (`id`, `__typename`)
+    are ignored if the fragment selects them as well.
+    """
+    if model := concrete.is_model:
+        concrete = model.of_type
+    object_type = concrete.is_object_type or concrete.is_interface
+    if not object_type:
+        return None
+
+    spreads = [spread for node in selection_set if (spread := is_fragment_spread_node(node))]
+    if len(spreads) != 1:
+        return None
+
+    fragment = type_info.available_fragments[spreads[0].name.value]
+    if fragment.type_condition.name.value != object_type.name:
+        return None
+
+    fragment_fields = {
+        field.name.value
+        for node in unwrap_frag_spreads(type_info.available_fragments, (spreads[0],)).selection_set
+        if (field := is_field_node(node))
+    }
+    for node in selection_set:
+        if is_fragment_spread_node(node):
+            continue
+        field_node = is_field_node(node)
+        if not field_node or field_node.selection_set:
+            return None
+        if not is_type_name_selection(field_node) and field_node.name.value not in fragment_fields:
+            return None
+
+    # fragments that use operation variables must read them from the operation.
+    if fragment_uses_variables(type_info.available_fragments, fragment):
+        return None
+    return fragment
+
+
+def _structure_key(type_: QtGqlTypeABC) -> str:
+    if model := type_.is_model:
+        ret = f"list<{_structure_key(model.of_type)}>"
+    elif union := type_.is_queried_union:
+        ret = f"union<{','.join(choice.type_name() for choice in union.choices)}>"
+    else:
+        ret = type_.type_name()
+    return f"optional<{ret}>" if type_.is_optional else ret
+
+
+def _object_structure_key(
+    concrete: QtGqlObjectType,
+    fields: dict[str, QtGqlQueriedField],
+) -> ObjectStructureKey:
+    """Narrowed objects with the same key would generate the same code."""
+    return concrete.name, tuple(
+        (
+            name,
+            _structure_key(field.type),
+            tuple((use.argument[0], use.variable.name) for use in field.variable_uses),
+        )
+        for name, field in fields.items()
+    )
+
+
 def _create_objects_for_interface(
     type_info: OperationTypeInfo,
     raw_selections_map: dict[str, list[gql_lang.FieldNode]],
     interface: QtGqlInterface,
     path: str,
+    shared: bool,
 ) -> list[QtGqlQueriedObjectType]:
     choices: list[QtGqlQueriedObjectType] = []
+    generic_implementations: list[QtGqlObjectType] = []
     # dispatch fragmented fields where they are needed.
     for resolve_able in interface.implementations.values():
         if concrete_choice := resolve_able.is_object_type:
             selections_for_obj: list[gql_lang.FieldNode] = []
+            has_specific_selections = False
             # collect selections from parent interfaces.
             for base in concrete_choice.interfaces_raw:
                 if selections_for_base := raw_selections_map.get(base.name, None):
                     selections_for_obj.extend(selections_for_base)
+                    if base is not interface:
+                        has_specific_selections = True
 
             # collect selections from the object itself.
             if choice_fields := raw_selections_map.get(concrete_choice.name, None):
                 selections_for_obj.extend(choice_fields)
+                has_specific_selections = True
+
+            if not has_specific_selections:
+                # would be handled by the generic type.
+                generic_implementations.append(concrete_choice)
+                continue
 
             # This could probably be more optimized though, currently
             # this would suffice to reduce complexity.
@@ -299,16 +410,73 @@ def _create_objects_for_interface(
                 concrete=concrete_choice,
                 selection_set=tuple(selections_for_obj),
                 path=path,
+                shared=shared,
+                # these are bound to their base interface.
+                reuse_structure=False,
             )
             choices.append(obj)
+
+    if generic_implementations:
+        # must be the last choice since it is the fallback when resolving a type name.
+        choices.append(
+            _evaluate_generic_implementation(
+                type_info,
+                interface,
+                raw_selections_map[interface.name],
+                tuple(generic_implementations),
+                path,
+                shared,
+            ),
+        )
     return choices
 
 
+def _evaluate_generic_implementation(
+    type_info: OperationTypeInfo,
+    interface: QtGqlInterface,
+    selections: list[gql_lang.FieldNode],
+    implementations: tuple[QtGqlObjectType, ...],
+    path: str,
+    shared: bool,
+) -> QtGqlQueriedObjectType:
+    """Implementations that have no specific selections in this operation
+    are all narrowed by the same type.
+
+    The concrete of this type is the interface itself and it only
+    dispatches `__typename` to construct the right implementation.
+    """
+    registry = _get_registry(type_info, shared)
+    name = f"{_create_name_for_path(interface, path)}__generic"
+    if ret := registry.narrowed_types_map.get(name, None):
+        return ret
+
+    ret = QtGqlQueriedObjectType(
+        name=name,
+        concrete=interface,
+        fields_dict={
+            field.name.value: _evaluate_field(
+                type_info=type_info,
+                concrete_field=interface.fields_dict[field.name.value],
+                path=path,
+                field_node=field,
+                origin=interface,
+                shared=shared,
+            )
+            for field in selections
+        },
+        shared=shared,
+        implementations=implementations,
+    )
+    registry.narrowed_types_map[name] = ret
+    return ret
+
+
 def _evaluate_interface(
     type_info: OperationTypeInfo,
     concrete: QtGqlInterface,
     selection_set: SelectionsSet,
     path: str,  # current path in the query tree.
+    shared: bool,  # whether this type would be shared across operations.
 ) -> QtGqlQueriedInterface:
     unwrapped_selections = unwrap_frag_spreads(type_info.available_fragments, selection_set)
     type_info.used_fragments.update(unwrapped_selections.used_fragments)
@@ -320,7 +488,13 @@ def _evaluate_interface(
         selection_set,
         {},
     )
-    choices = _create_objects_for_interface(type_info, raw_selections_map, concrete, path)
+    choices = _create_objects_for_interface(
+        type_info,
+        raw_selections_map,
+        concrete,
+        path,
+        shared,
+    )
     name = _create_name_for_path(concrete, path)
 
     fields_for_interface = {
@@ -330,20 +504,25 @@ def _evaluate_interface(
             path=path,
             field_node=field,
             origin=concrete,
+            shared=shared,
         )
         for field in raw_selections_map[concrete.name]
     }
+    registry = _get_registry(type_info, shared)
+    if ret := registry.narrowed_interfaces_map.get(name, None):
+        return ret
 
     ret = QtGqlQueriedInterface(
         name=name,
         concrete=concrete,
         choices=choices,
         fields_dict=fields_for_interface,
+        shared=shared,
     )
     for choice in choices:
         choice.base_interface = ret
 
-    type_info.narrowed_interfaces_map[name] = ret
+    registry.narrowed_interfaces_map[name] = ret
     return ret
 
 
@@ -352,8 +531,11 @@ def _evaluate_object_type(
     concrete: QtGqlObjectType,
     selection_set: SelectionsSet,
     path: str,  # current path in the query tree.
+    shared: bool,  # whether this type would be shared across operations.
+    reuse_structure: bool,  # whether a type with the same selections can be used instead.
 ) -> QtGqlQueriedObjectType:
-    assert not type_info.narrowed_types_map.get(concrete.name, None), "object already evaluated"
+    registry = _get_registry(type_info, shared)
+    assert not registry.narrowed_types_map.get(concrete.name, None), "object already evaluated"
     unwrapped_selections = unwrap_frag_spreads(type_info.available_fragments, selection_set)
     type_info.used_fragments.update(unwrapped_selections.used_fragments)
     selection_set = unwrapped_selections.selection_set
@@ -370,18 +552,26 @@ def _evaluate_object_type(
                 field_node=f_node,
                 path=path,
                 origin=concrete,
+                shared=shared,
             )
 
     name = _create_name_for_path(concrete, path)
-    if ret := type_info.narrowed_types_map.get(name, None):
+    if ret := registry.narrowed_types_map.get(name, None):
+        return ret
+
+    structure = _object_structure_key(concrete, fields)
+    if reuse_structure and (ret := registry.structures_map.get(structure, None)):
         return ret
 
     ret = QtGqlQueriedObjectType(
         name=name,
         concrete=concrete,
         fields_dict=fields,
+        shared=shared,
     )
-    type_info.narrowed_types_map[name] = ret
+    registry.narrowed_types_map[name] = ret
+    if reuse_structure:
+        registry.structures_map[structure] = ret
     return ret
 
 
@@ -389,6 +579,7 @@ def _evaluate_operation(
     operation: OperationDefinitionNode,
     schema_type_info: SchemaTypeInfo,
     raw_fragments: HashAbleDict[str, gql_lang.FragmentDefinitionNode],
+    shared_types: QtGqlFragmentsDefinition,
 ) -> QtGqlOperationDefinition:
     """Each operation generates a whole new "proxy" schema. That schema will
     contain only the fields that are currently queried. The way we do that is
@@ -398,8 +589,16 @@ def _evaluate_operation(
     - Each proxy object contains only the fields that was queried for this field in the tree.
 
     And because of that, one object type (at the concrete schema) might have many proxy objects.
+
+    Selections that are only a spread of a fragment (that doesn't use operation variables)
+    are evaluated into `shared_types` so that all the operations using this fragment would
+    share the same proxy objects.
     """
-    type_info = OperationTypeInfo(schema_type_info, available_fragments=raw_fragments)
+    type_info = OperationTypeInfo(
+        schema_type_info=schema_type_info,
+        available_fragments=raw_fragments,
+        shared_types=shared_types,
+    )
     # input variables
     if variables_def := operation.variable_definitions:
         for var in variables_def:
@@ -413,17 +612,18 @@ def _evaluate_operation(
         concrete=root_type,
         selection_set=selections.selections,
         path="",
+        shared=False,
+        reuse_structure=False,
     )
-    assert len(root_proxy_type.fields) == 1
-    root_field = root_proxy_type.fields[0]
     return QtGqlOperationDefinition(
-        root_field=root_field,
+        root_fields=tuple(root_proxy_type.fields),
         root_type=root_proxy_type,
         operation_def=operation,
         variables=type_info.variables,
         narrowed_types=tuple(type_info.narrowed_types_map.values()),
         interfaces=tuple(type_info.narrowed_interfaces_map.values()),
         used_fragments=tuple(type_info.used_fragments.values()),
+        uses_shared_types=type_info.uses_shared_types,
     )
 
 
@@ -437,6 +637,7 @@ class _OperationsVisitor(visitor.Visitor):
         self.schema_type_info = type_info
         self.raw_fragments = fragments
         self.operations: dict[str, QtGqlOperationDefinition] = {}
+        self.shared_types = QtGqlFragmentsDefinition()
 
     def enter_operation_definition(self, node: graphql.Node, *args, **kwargs) -> None:
         if operation := is_operation_def_node(node):
@@ -450,6 +651,7 @@ class _OperationsVisitor(visitor.Visitor):
                     operation,
                     self.schema_type_info,
                     self.raw_fragments,
+                    self.shared_types,
                 )
 
 
@@ -471,10 +673,13 @@ class _FragmentsVisitor(visitor.Visitor):
 def evaluate_operations(
     operations_document: graphql.DocumentNode,
     type_info: SchemaTypeInfo,
-) -> dict[str, QtGqlOperationDefinition]:
+) -> tuple[dict[str, QtGqlOperationDefinition], QtGqlFragmentsDefinition]:
+    """
+    :return: The operations and the types they share (generated for their fragments).
+    """
     fragment_visitor = _FragmentsVisitor(type_info)
     graphql.visit(operations_document, fragment_visitor)
     operation_visitor = _OperationsVisitor(type_info, fragment_visitor.fragments)
     graphql.visit(operations_document, operation_visitor)
     assert operation_visitor.operations
-    return operation_visitor.operations
+    return operation_visitor.operations, operation_visitor.shared_types
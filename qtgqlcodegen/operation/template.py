@@ -1,15 +1,124 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar
+from functools import cached_property
+from typing import TYPE_CHECKING, ClassVar, Iterable
 
 from attr import define
 
 from qtgqlcodegen.core.cppref import QtGqlTypes
-from qtgqlcodegen.core.template import template_env
+from qtgqlcodegen.core.template import template_env, template_macro
+from qtgqlcodegen.schema.usage import collect_schema_usage
+from qtgqlcodegen.types import SCHEMA_TYPES_DIR, SHARED_TYPES_NS
 
 if TYPE_CHECKING:
     from qtgqlcodegen.config import QtGqlConfig
-    from qtgqlcodegen.operation.definitions import QtGqlOperationDefinition
+    from qtgqlcodegen.operation.definitions import (
+        QtGqlFragmentsDefinition,
+        QtGqlOperationDefinition,
+        QtGqlQueriedField,
+    )
+    from qtgqlcodegen.types import QtGqlQueriedInterface, QtGqlQueriedObjectType, QtGqlTypeABC
+
+
+def _has_nodes(t: QtGqlTypeABC) -> bool:
+    """Whether this narrowed type (or any of its children) is a node."""
+    if model := t.is_model:
+        return _has_nodes(model.of_type)
+    if narrowed := t.is_queried_interface or t.is_queried_union:
+        return any(_has_nodes(choice) for choice in narrowed.choices)
+    if obj := t.is_queried_object_type:
+        return obj.implements_node or any(_has_nodes(f.type) for f in obj.fields)
+    return False
+
+
+def lazy_object(config: QtGqlConfig, f: QtGqlQueriedField) -> QtGqlQueriedObjectType | None:
+    """The narrowed type of an object field (or list of objects) that is
+    deserialized on first access, see `QtGqlConfig.lazy_deserialization`.
+
+    Nodes must be cached once they are received and operation variables might
+    change before the field is read, so only subtrees without them are
+    deferred.
+    """
+    if not config.lazy_deserialization or config.skip_unchanged_subtrees or f.concrete.arguments:
+        return None
+    t = model.of_type if (model := f.type.is_model) else f.type
+    obj = t.is_queried_object_type
+    # the generic type of an interface is held as the interface.
+    if obj and not obj.implementations and not _has_nodes(obj) and not _uses_variables(obj):
+        return obj
+    return None
+
+
+def is_lazy_field(config: QtGqlConfig, f: QtGqlQueriedField) -> bool:
+    if not config.lazy_deserialization:
+        return False
+    return f.concrete.is_leaf or lazy_object(config, f) is not None
+
+
+def _is_table_object(t: QtGqlTypeABC) -> bool:
+    """Object types, interfaces and unions (or lists of them)."""
+    if model := t.is_model:
+        t = model.of_type
+    return bool(t.is_queried_object_type or t.is_queried_interface or t.is_queried_union)
+
+
+def is_table_field(config: QtGqlConfig, f: QtGqlQueriedField) -> bool:
+    if not config.table_driven_deserialization or is_lazy_field(config, f):
+        return False
+    return f.concrete.is_leaf or (not f.concrete.arguments and _is_table_object(f.type))
+
+
+def _uses_variables(t: QtGqlTypeABC) -> bool:
+    """Whether a field of this narrowed type (or of its children) uses operation
+    variables."""
+    if model := t.is_model:
+        return _uses_variables(model.of_type)
+    if narrowed := t.is_queried_interface or t.is_queried_union:
+        return any(_uses_variables(choice) for choice in narrowed.choices)
+    if obj := t.is_queried_object_type:
+        return any(f.variable_uses or _uses_variables(f.type) for f in obj.fields)
+    return False
+
+
+def skips_unchanged(config: QtGqlConfig, t: QtGqlQueriedObjectType) -> bool:
+    """Whether the updater of this type skips data it was already updated from,
+    see `QtGqlConfig.skip_unchanged_subtrees`.
+
+    The same data might be stored elsewhere if the variables changed, so types
+    that use them are always updated.
+    """
+    return (
+        config.skip_unchanged_subtrees
+        and (t.concrete.is_root or t.implements_node)
+        and not _uses_variables(t)
+    )
+
+
+def list_model_types(
+    env_name: str,
+    ns: str,
+    narrowed_types: Iterable[QtGqlQueriedObjectType],
+) -> list[str]:
+    """Fully qualified `ListModelABC` specializations of the models of these narrowed types
+    that are instantiated by the sources of `ns` (along with the proxy types).
+
+    Models of shared types are instantiated by the fragments sources and models of
+    scalars and unions by qtgql itself.
+    """
+    ret: set[str] = set()
+    for t in narrowed_types:
+        for f in t.fields:
+            model = f.type.is_model
+            if not model:
+                continue
+            # a queried interface is a queried object type as well.
+            of_type = model.of_type.is_queried_object_type or model.of_type.is_queried_interface
+            if not of_type:
+                continue
+            if of_type.shared != (ns == SHARED_TYPES_NS):
+                continue
+            ret.add(f"{QtGqlTypes.ListModelABC.name}<{env_name}::{ns}::{of_type.name} *>")
+    return sorted(ret)
 
 
 @define(slots=False)
@@ -17,6 +126,8 @@ class OperationTemplateContext:
     operation: QtGqlOperationDefinition
     config: QtGqlConfig
     debug: bool = False
+    # generate only deserializers (no update paths), see `QtGqlConfig.deserialize_only_operations`.
+    deserialize_only: bool = False
     qtgql_types: ClassVar[type[QtGqlTypes]] = QtGqlTypes
 
     @property
@@ -27,11 +138,153 @@ class OperationTemplateContext:
     def schema_ns(self) -> str:
         return self.config.env_name
 
+    @property
+    def header(self) -> str:
+        return f"{self.operation.name}.hpp"
+
     @property
     def export_macro(self) -> str:
         # see https://doc.qt.io/qt-6/sharedlibrary.html
         return f"QTGQL_{self.schema_ns}_{self.ns}".upper()
 
+    @property
+    def operation_type(self) -> str:
+        """The type of the operation pointer the narrowed types hold."""
+        return self.operation.name
+
+    @cached_property
+    def schema_includes(self) -> list[str]:
+        """Headers of the concrete types this operation uses."""
+        usage = collect_schema_usage([self.operation], None)
+        return [f"{SCHEMA_TYPES_DIR}/{name}.hpp" for name in sorted(usage.object_types)]
+
+    @cached_property
+    def list_model_types(self) -> list[str]:
+        """Declared `extern` by the header, they are instantiated once by the source."""
+        return list_model_types(
+            self.config.env_name,
+            self.ns,
+            (*self.operation.interfaces, *self.operation.narrowed_types),
+        )
+
+    def generates_updater(self, t: QtGqlQueriedObjectType) -> bool:
+        """Deserialize-only operations still fill the root instance and nodes
+        that are already cached by other operations."""
+        return not self.deserialize_only or t.concrete.is_root or t.implements_node
+
+    def is_table_field(self, f: QtGqlQueriedField) -> bool:
+        """Whether the field is (de)serialized by the field table of its type, see
+        `QtGqlConfig.table_driven_deserialization`."""
+        return is_table_field(self.config, f)
+
+    def table_fields(self, t: QtGqlQueriedObjectType) -> tuple[QtGqlQueriedField, ...]:
+        return tuple(f for f in t.fields if self.is_table_field(f))
+
+    def skips_unchanged(self, t: QtGqlQueriedObjectType) -> bool:
+        return skips_unchanged(self.config, t)
+
+    def is_lazy_field(self, f: QtGqlQueriedField) -> bool:
+        return is_lazy_field(self.config, f)
+
+    def lazy_object(self, f: QtGqlQueriedField) -> QtGqlQueriedObjectType | None:
+        return lazy_object(self.config, f)
+
+
+@define(slots=False)
+class FragmentsTemplateContext:
+    fragments: QtGqlFragmentsDefinition
+    config: QtGqlConfig
+    debug: bool = False
+    qtgql_types: ClassVar[type[QtGqlTypes]] = QtGqlTypes
+
+    @property
+    def ns(self) -> str:
+        return SHARED_TYPES_NS
+
+    @property
+    def schema_ns(self) -> str:
+        return self.config.env_name
+
+    @property
+    def header(self) -> str:
+        return f"{SHARED_TYPES_NS}.hpp"
+
+    @property
+    def export_macro(self) -> str:
+        return f"QTGQL_{self.schema_ns}_{self.ns}".upper()
+
+    @property
+    def operation_type(self) -> str:
+        # shared types can't use operation variables, they only pass the operation around.
+        return self.qtgql_types.OperationHandlerABC.name
+
+    @property
+    def deserialize_only(self) -> bool:
+        # shared types might be used by operations that track updates.
+        return False
+
+    @cached_property
+    def schema_includes(self) -> list[str]:
+        usage = collect_schema_usage([], self.fragments)
+        return [f"{SCHEMA_TYPES_DIR}/{name}.hpp" for name in sorted(usage.object_types)]
+
+    @cached_property
+    def list_model_types(self) -> list[str]:
+        return list_model_types(
+            self.config.env_name,
+            self.ns,
+            (*self.fragments.interfaces, *self.fragments.narrowed_types),
+        )
+
+    def generates_updater(self, t: QtGqlQueriedObjectType) -> bool:
+        return True
+
+    def is_table_field(self, f: QtGqlQueriedField) -> bool:
+        return is_table_field(self.config, f)
+
+    def table_fields(self, t: QtGqlQueriedObjectType) -> tuple[QtGqlQueriedField, ...]:
+        return tuple(f for f in t.fields if self.is_table_field(f))
+
+    def skips_unchanged(self, t: QtGqlQueriedObjectType) -> bool:
+        return skips_unchanged(self.config, t)
+
+    def is_lazy_field(self, f: QtGqlQueriedField) -> bool:
+        return is_lazy_field(self.config, f)
+
+    def lazy_object(self, f: QtGqlQueriedField) -> QtGqlQueriedObjectType | None:
+        return lazy_object(self.config, f)
+
 
 OPERATION_HPP_TEMPLATE = template_env.get_template("operation.jinja.hpp")
 OPERATION_CPP_TEMPLATE = template_env.get_template("operation.jinja.cpp")
+FRAGMENTS_HPP_TEMPLATE = template_env.get_template("fragments.jinja.hpp")
+FRAGMENTS_CPP_TEMPLATE = template_env.get_template("fragments.jinja.cpp")
+NARROWED_TYPE_DECLARATION_MACROS = template_env.get_template(
+    "macros/narrowed_type_declaration.jinja.hpp",
+)
+NARROWED_TYPE_DEFINITION_MACROS = template_env.get_template(
+    "macros/narrowed_type_definition.jinja.cpp",
+)
+
+
+def narrowed_object_sources(
+    context: OperationTemplateContext | FragmentsTemplateContext,
+    t: QtGqlQueriedObjectType,
+) -> str:
+    """Renders only the code generated for this narrowed object type (declaration and definition)."""
+    declaration = template_macro(NARROWED_TYPE_DECLARATION_MACROS, "narrowed_object_declaration")
+    definition = template_macro(NARROWED_TYPE_DEFINITION_MACROS, "narrowed_object_definition")
+    return "\n".join((declaration(t, context), definition(t, context)))
+
+
+def narrowed_interface_sources(
+    context: OperationTemplateContext | FragmentsTemplateContext,
+    t: QtGqlQueriedInterface,
+) -> str:
+    """Renders only the code generated for this narrowed interface (declaration and deserializer)."""
+    declaration = template_macro(NARROWED_TYPE_DECLARATION_MACROS, "narrowed_interface_declaration")
+    deserializer = template_macro(
+        NARROWED_TYPE_DEFINITION_MACROS,
+        "interface_deserializer_definition",
+    )
+    return "\n".join((declaration(t, context), deserializer(t, context)))
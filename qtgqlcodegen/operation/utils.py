@@ -4,13 +4,15 @@ import functools
 from typing import TYPE_CHECKING
 
 import attrs
+import graphql
 from attr import define
+from graphql.language import visitor
 
 from qtgqlcodegen.core.graphql_ref import (
     SelectionsSet,
     is_fragment_spread_node,
 )
-from qtgqlcodegen.utils import HashAbleDict, _replace_tuple_item
+from qtgqlcodegen.utils import HashAbleDict, _replace_tuple_item, require
 
 if TYPE_CHECKING:
     from graphql.language import ast as gql_lang
@@ -60,3 +62,33 @@ def unwrap_frag_spreads(
             ret.selection_set = _replace_tuple_item(ret.selection_set, i, frag_selections)
             ret.used_fragments.update(used_by_frag)
     return ret
+
+
+class _VariablesVisitor(visitor.Visitor):
+    def __init__(self):
+        super().__init__()
+        self.uses_variables = False
+        self.fragment_spreads: list[str] = []
+
+    def enter_variable(self, node: graphql.Node, *args, **kwargs) -> None:
+        self.uses_variables = True
+
+    def enter_fragment_spread(self, node: graphql.Node, *args, **kwargs) -> None:
+        self.fragment_spreads.append(require(is_fragment_spread_node(node)).name.value)
+
+
+@functools.lru_cache(None)
+def fragment_uses_variables(
+    available_fragments: HashAbleDict[str, gql_lang.FragmentDefinitionNode],
+    frag: gql_lang.FragmentDefinitionNode,
+) -> bool:
+    """Whether this fragment (or any fragment it spreads) uses operation
+    variables."""
+    variables_visitor = _VariablesVisitor()
+    graphql.visit(frag, variables_visitor)
+    if variables_visitor.uses_variables:
+        return True
+    return any(
+        fragment_uses_variables(available_fragments, available_fragments[spread])
+        for spread in variables_visitor.fragment_spreads
+    )
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Iterable
+
+import attrs
+from attr import define
+
+from qtgqlcodegen.operation.template import (
+    narrowed_interface_sources,
+    narrowed_object_sources,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from qtgqlcodegen.config import QtGqlConfig
+    from qtgqlcodegen.generator import FragmentsOutput, GenerationOutput, OperationOutput
+    from qtgqlcodegen.operation.template import (
+        FragmentsTemplateContext,
+        OperationTemplateContext,
+    )
+    from qtgqlcodegen.types import QtGqlQueriedInterface, QtGqlQueriedObjectType
+    from qtgqlcodegen.utils import FileSpec
+
+# signals / connections that every operation has regardless of its selections.
+# The operation handler has `dataChanged` and the `Use<Operation>` QML wrapper
+# re-emits the four signals of the handler it wraps.
+OPERATION_HANDLER_SIGNALS = 1
+QML_WRAPPER_SIGNALS = 4
+QML_WRAPPER_CONNECTIONS = 4
+# the operation handler and its `Use<Operation>` QML wrapper.
+OPERATION_CLASSES = 2
+
+
+def count_lines(content: str) -> int:
+    """Counts non-empty lines, the templates leave a lot of whitespace that
+    the compiler doesn't care about."""
+    return len([line for line in content.splitlines() if line.strip()])
+
+
+@define
+class NarrowedTypeReport:
+    """Generated code attributed to a single narrowed (proxy) type."""
+
+    name: str
+    concrete: str
+    lines: int
+    fields: int
+    signals: int
+    connections: int
+    deserializers: int
+    updaters: int
+
+
+@define
+class CompileUnitTiming:
+    """Compile time of an object file as recorded by the build tool."""
+
+    output: str
+    seconds: float
+
+
+@define
+class OperationReport:
+    name: str
+    lines: int
+    classes: int
+    signals: int
+    connections: int
+    deserializers: int
+    updaters: int
+    narrowed_types: list[NarrowedTypeReport] = attrs.Factory(list)
+    compile_units: list[CompileUnitTiming] = attrs.Factory(list)
+
+    @property
+    def compile_seconds(self) -> float | None:
+        if not self.compile_units:
+            return None
+        return sum(unit.seconds for unit in self.compile_units)
+
+
+@define
+class GenerationReport:
+    """Size and (optionally) compile cost of the generated sources, per
+    operation and per narrowed type.
+
+    Use this to find the operations that bloat the build.
+    """
+
+    schema_lines: int
+    operations: list[OperationReport]
+    # types shared by the operations (generated for fragments).
+    fragments: OperationReport | None = None
+
+    @property
+    def total_lines(self) -> int:
+        ret = self.schema_lines + sum(op.lines for op in self.operations)
+        if self.fragments:
+            ret += self.fragments.lines
+        return ret
+
+    def sorted_by_cost(self) -> list[OperationReport]:
+        """Operations sorted by compile time if it was measured, otherwise by
+        generated lines."""
+        return sorted(
+            self.operations,
+            key=lambda op: (op.compile_seconds or 0, op.lines),
+            reverse=True,
+        )
+
+    def to_json(self) -> str:
+        ret = attrs.asdict(self)
+        for op, op_dict in zip(self.operations, ret["operations"]):
+            op_dict["compile_seconds"] = op.compile_seconds
+        if self.fragments:
+            ret["fragments"]["compile_seconds"] = self.fragments.compile_seconds
+        ret["total_lines"] = self.total_lines
+        return json.dumps(ret, indent=2)
+
+
+def _report_narrowed_types(
+    context: OperationTemplateContext | FragmentsTemplateContext,
+    interfaces: Iterable[QtGqlQueriedInterface],
+    narrowed_types: Iterable[QtGqlQueriedObjectType],
+) -> list[NarrowedTypeReport]:
+    narrowed: list[NarrowedTypeReport] = []
+    for interface in interfaces:
+        narrowed.append(
+            NarrowedTypeReport(
+                name=interface.name,
+                concrete=interface.concrete.name,
+                lines=count_lines(narrowed_interface_sources(context, interface)),
+                fields=len(interface.fields),
+                signals=len(interface.fields),
+                connections=0,
+                deserializers=1,
+                updaters=0,
+            ),
+        )
+    for t in narrowed_types:
+        narrowed.append(
+            NarrowedTypeReport(
+                name=t.name,
+                concrete=t.concrete.name,
+                lines=count_lines(narrowed_object_sources(context, t)),
+                fields=len(t.fields),
+                signals=len(t.fields),
+                connections=0 if context.deserialize_only else len(t.fields),
+                deserializers=0 if t.concrete.is_root else 1,
+                updaters=1 if context.generates_updater(t) else 0,
+            ),
+        )
+    return sorted(narrowed, key=lambda t: t.lines, reverse=True)
+
+
+def _report_operation(op_output: OperationOutput) -> OperationReport:
+    operation = op_output.context.operation
+    narrowed = _report_narrowed_types(
+        op_output.context,
+        operation.interfaces,
+        operation.narrowed_types,
+    )
+    return OperationReport(
+        name=op_output.name,
+        lines=sum(count_lines(source.content) for source in op_output.sources),
+        classes=len(narrowed) + OPERATION_CLASSES,
+        signals=sum(t.signals for t in narrowed) + OPERATION_HANDLER_SIGNALS + QML_WRAPPER_SIGNALS,
+        connections=sum(t.connections for t in narrowed) + QML_WRAPPER_CONNECTIONS,
+        deserializers=sum(t.deserializers for t in narrowed),
+        updaters=sum(t.updaters for t in narrowed),
+        narrowed_types=narrowed,
+    )
+
+
+def _report_fragments(fragments_output: FragmentsOutput) -> OperationReport:
+    context = fragments_output.context
+    narrowed = _report_narrowed_types(
+        context,
+        context.fragments.interfaces,
+        context.fragments.narrowed_types,
+    )
+    return OperationReport(
+        name=context.ns,
+        lines=sum(count_lines(source.content) for source in fragments_output.sources),
+        classes=len(narrowed),
+        signals=sum(t.signals for t in narrowed),
+        connections=sum(t.connections for t in narrowed),
+        deserializers=sum(t.deserializers for t in narrowed),
+        updaters=sum(t.updaters for t in narrowed),
+        narrowed_types=narrowed,
+    )
+
+
+def parse_ninja_log(ninja_log: Path) -> list[CompileUnitTiming]:
+    """Parses a `.ninja_log` (v5) file.
+
+    Each line is `start_ms end_ms mtime output hash` separated by tabs. When an output
+    was built several times only the latest build is kept.
+    """
+    timings: dict[str, CompileUnitTiming] = {}
+    for line in ninja_log.read_text("utf-8").splitlines():
+        if line.startswith("#"):
+            continue
+        parts = line.split("\t")
+        if len(parts) < 4:  # pragma: no cover
+            continue
+        start, end, _, output = parts[:4]
+        if not output.endswith((".o", ".obj")):
+            continue
+        timings[output] = CompileUnitTiming(
+            output=output,
+            seconds=(int(end) - int(start)) / 1000,
+        )
+    return list(timings.values())
+
+
+def _attach_compile_timings(
+    report: OperationReport,
+    sources: Iterable[FileSpec],
+    timings: list[CompileUnitTiming],
+    generated_dir: Path,
+    target_name: str | None,
+) -> None:
+    # CMake names the object of a source after its path relative to the generated
+    # `CMakeLists.txt`, `CMakeFiles/<target>.dir/<source>.o`.
+    objects: list[str] = []
+    for source in sources:
+        if source.path.suffix == ".cpp":
+            relative = source.path.relative_to(generated_dir).as_posix()
+            objects.extend((f".dir/{relative}.o", f".dir/{relative}.obj"))
+    # the other units of a target of its own (moc and qml registration) are its
+    # cost as well.
+    target_dir = f"/{target_name}.dir/" if target_name else None
+    report.compile_units = [
+        t
+        for t in timings
+        if t.output.endswith(tuple(objects)) or (target_dir and target_dir in t.output)
+    ]
+
+
+def create_report(
+    generation_output: GenerationOutput,
+    config: QtGqlConfig,
+    ninja_log: Path | None = None,
+) -> GenerationReport:
+    """
+    :param generation_output: The sources to report on.
+    :param config: Used to resolve the objects and CMake targets of the operations.
+    :param ninja_log: `.ninja_log` of a build of the generated sources,
+        if provided compile times would be attached to each operation.
+    """
+    operations = [_report_operation(op) for op in generation_output.operations]
+    fragments = (
+        _report_fragments(generation_output.fragments) if generation_output.fragments else None
+    )
+    if ninja_log:
+        timings = parse_ninja_log(ninja_log)
+        reported: list[tuple[OperationReport, list[FileSpec]]] = [
+            (op, op_output.sources)
+            for op, op_output in zip(operations, generation_output.operations)
+        ]
+        if fragments and generation_output.fragments:
+            reported.append((fragments, generation_output.fragments.sources))
+        for op, sources in reported:
+            # with a single module all the sources share a target.
+            target_name = None if config.single_qml_module else f"{config.env_name}{op.name}"
+            _attach_compile_timings(op, sources, timings, config.generated_dir, target_name)
+
+    return GenerationReport(
+        schema_lines=sum(
+            count_lines(source.content) for source in generation_output.schema.sources
+        ),
+        operations=operations,
+        fragments=fragments,
+    )
@@ -59,7 +59,7 @@ class QtGqlFieldDefinition(BaseQtGqlFieldDefinition):
 
     @property
     def arguments_type(self) -> str:
-        return "QJsonObject"
+        return "qtgql::bases::ArgsKey"
 
     def index_for_argument(self, arg: str) -> int:
         return self.arguments.index(self.arguments_dict[arg])
@@ -97,6 +97,24 @@ class QtGqlFieldDefinition(BaseQtGqlFieldDefinition):
             return "{}"
         return self.type.default_value
 
+    @cached_property
+    def is_leaf(self) -> bool:
+        """Scalars, enums and custom scalars that are not cached by arguments."""
+        if self.arguments:
+            return False
+        if scalar := self.type.is_builtin_scalar:
+            return not scalar.is_void
+        return bool(self.type.is_enum or self.type.is_custom_scalar)
+
+    @property
+    def from_json(self) -> str:
+        """Converts the JSON value of a leaf field to its member type, see
+        `qtgql::bases::tables`."""
+        tables = "qtgql::bases::tables"
+        if enum := self.type.is_enum:
+            return f"{tables}::enum_from_json<{enum.namespaced_name}, Enums::{enum.map_name}>"
+        return f"{tables}::from_json<{self.type.type_name()}>"
+
 
 EnumMap: TypeAlias = "dict[str, QtGqlEnumDefinition]"
 ObjectTypeMap: TypeAlias = "dict[str, QtGqlObjectType]"
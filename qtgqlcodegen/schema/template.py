@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from attr import define
 
+from qtgqlcodegen.core.keytable import KeyTable
 from qtgqlcodegen.core.template import template_env
 from qtgqlcodegen.operation.template import (
+    FRAGMENTS_CPP_TEMPLATE,
+    FRAGMENTS_HPP_TEMPLATE,
     OPERATION_CPP_TEMPLATE,
     OPERATION_HPP_TEMPLATE,
+    FragmentsTemplateContext,
     OperationTemplateContext,
 )
 
 if TYPE_CHECKING:
     from qtgqlcodegen.config import QtGqlConfig
+    from qtgqlcodegen.schema.definitions import QtGqlFieldDefinition
+    from qtgqlcodegen.schema.usage import SchemaUsage
     from qtgqlcodegen.types import (
         QtGqlEnumDefinition,
         QtGqlInputObject,
@@ -21,13 +28,20 @@ if TYPE_CHECKING:
     )
 
 
-@define
+@define(slots=False)
 class SchemaTemplateContext:
     enums: list[QtGqlEnumDefinition]
     types: list[QtGqlObjectType]
     interfaces: list[QtGqlInterface]
     input_objects: list[QtGqlInputObject]
     config: QtGqlConfig
+    # if set only the fields used by the operations are generated.
+    usage: SchemaUsage | None = None
+
+    def fields_of(self, t: QtGqlObjectType) -> tuple[QtGqlFieldDefinition, ...]:
+        if self.usage:
+            return self.usage.used_fields(t)
+        return t.unique_fields
 
     @property
     def dependencies(self) -> list[str]:
@@ -48,11 +62,51 @@ class SchemaTemplateContext:
     def export_macro(self) -> str:
         return f"QTGQL_{self.config.env_name}_SCHEMA_EXPORT"
 
+    @property
+    def common_header(self) -> str:
+        """Enums, input objects and forward references, included by every type
+        header."""
+        return "_common.hpp"
+
+    @cached_property
+    def type_ids(self) -> KeyTable:
+        """The id of an object type is the index of its name."""
+        return KeyTable.create(tuple(t.name for t in self.types))
+
+
+@define
+class SchemaTypeTemplateContext:
+    """A single concrete type (object type or interface), each is generated in
+    its own header and source."""
+
+    schema: SchemaTemplateContext
+    type: QtGqlObjectType
+
+    @property
+    def fields(self) -> tuple[QtGqlFieldDefinition, ...]:
+        return self.schema.fields_of(self.type)
+
+    def args_cache_size(self, f: QtGqlFieldDefinition) -> int:
+        config = self.schema.config
+        return config.args_cache_sizes.get(f"{self.type.name}.{f.name}", config.args_cache_size)
+
 
 def schema_types_template_hpp(context: SchemaTemplateContext) -> str:
     return SCHEMA_HPP_TEMPLATE.render(context=context)
 
 
+def schema_common_template_hpp(context: SchemaTemplateContext) -> str:
+    return SCHEMA_COMMON_HPP_TEMPLATE.render(context=context)
+
+
+def schema_type_template_hpp(context: SchemaTypeTemplateContext) -> str:
+    return SCHEMA_TYPE_HPP_TEMPLATE.render(context=context)
+
+
+def schema_type_template_cpp(context: SchemaTypeTemplateContext) -> str:
+    return SCHEMA_TYPE_CPP_TEMPLATE.render(context=context)
+
+
 def operation_hpp_template(context: OperationTemplateContext) -> str:
     return OPERATION_HPP_TEMPLATE.render(context=context)
 
@@ -61,4 +115,15 @@ def operation_cpp_template(context: OperationTemplateContext) -> str:
     return OPERATION_CPP_TEMPLATE.render(context=context)
 
 
+def fragments_hpp_template(context: FragmentsTemplateContext) -> str:
+    return FRAGMENTS_HPP_TEMPLATE.render(context=context)
+
+
+def fragments_cpp_template(context: FragmentsTemplateContext) -> str:
+    return FRAGMENTS_CPP_TEMPLATE.render(context=context)
+
+
 SCHEMA_HPP_TEMPLATE = template_env.get_template("schema.jinja.hpp")
+SCHEMA_COMMON_HPP_TEMPLATE = template_env.get_template("schema/common.jinja.hpp")
+SCHEMA_TYPE_HPP_TEMPLATE = template_env.get_template("schema/type.jinja.hpp")
+SCHEMA_TYPE_CPP_TEMPLATE = template_env.get_template("schema/type.jinja.cpp")
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, Iterable
+
+import attrs
+from attr import define
+
+if TYPE_CHECKING:
+    from qtgqlcodegen.operation.definitions import (
+        QtGqlFragmentsDefinition,
+        QtGqlOperationDefinition,
+    )
+    from qtgqlcodegen.schema.definitions import QtGqlFieldDefinition
+    from qtgqlcodegen.types import (
+        QtGqlEnumDefinition,
+        QtGqlInputObject,
+        QtGqlInterface,
+        QtGqlObjectType,
+        QtGqlQueriedObjectType,
+        QtGqlTypeABC,
+    )
+
+
+@define(slots=False)
+class SchemaUsage:
+    """The parts of the schema that are reachable from the operations.
+
+    Only these are generated in `schema.hpp` (unless
+    `QtGqlConfig.keep_unused_schema_types` is set).
+    """
+
+    # object types and interfaces.
+    object_types: set[str] = attrs.Factory(set)
+    # concrete type name -> names of the used fields, a field that is declared
+    # by an interface is marked on the interface as well.
+    fields: defaultdict[str, set[str]] = attrs.Factory(lambda: defaultdict(set))
+    enums: set[str] = attrs.Factory(set)
+    input_objects: set[str] = attrs.Factory(set)
+    # ids of the narrowed types that were already visited.
+    visited: set[int] = attrs.Factory(set)
+
+    def uses_type(self, t: QtGqlObjectType | QtGqlInterface) -> bool:
+        return t.name in self.object_types
+
+    def uses_enum(self, enum: QtGqlEnumDefinition) -> bool:
+        return enum.name in self.enums
+
+    def uses_input_object(self, input_object: QtGqlInputObject) -> bool:
+        return input_object.name in self.input_objects
+
+    def used_fields(self, t: QtGqlObjectType) -> tuple[QtGqlFieldDefinition, ...]:
+        used = self.fields[t.name]
+        return tuple(f for f in t.unique_fields if f.name in used)
+
+
+def _mark_field(usage: SchemaUsage, concrete: QtGqlObjectType, name: str) -> None:
+    usage.fields[concrete.name].add(name)
+    for base in concrete.interfaces_raw:
+        if name in base.fields_dict:
+            _mark_field(usage, base, name)
+
+
+def _mark_object_type(usage: SchemaUsage, concrete: QtGqlObjectType) -> None:
+    if concrete.name in usage.object_types:
+        return
+    usage.object_types.add(concrete.name)
+    for base in concrete.interfaces_raw:
+        _mark_object_type(usage, base)
+    interface = concrete.is_interface
+    if concrete.implements_node or (interface and interface.is_node_interface):
+        # `NodeInterfaceABC::get_id` is pure virtual.
+        _mark_field(usage, concrete, "id")
+
+
+def _visit_input_type(usage: SchemaUsage, type_: QtGqlTypeABC) -> None:
+    if lst := type_.is_input_list:
+        _visit_input_type(usage, lst.of_type)
+    elif enum := type_.is_enum:
+        usage.enums.add(enum.name)
+    elif input_object := type_.is_input_object_type:
+        if input_object.name in usage.input_objects:
+            return
+        usage.input_objects.add(input_object.name)
+        for f in input_object.fields:
+            _visit_input_type(usage, f.type)
+
+
+def _visit_queried_type(usage: SchemaUsage, type_: QtGqlTypeABC) -> None:
+    if lst := type_.is_model:
+        _visit_queried_type(usage, lst.of_type)
+    elif enum := type_.is_enum:
+        usage.enums.add(enum.name)
+    elif union := type_.is_queried_union:
+        for choice in union.choices:
+            _visit_narrowed_type(usage, choice)
+    elif interface := type_.is_queried_interface:
+        _visit_narrowed_type(usage, interface)
+        for choice in interface.choices:
+            _visit_narrowed_type(usage, choice)
+    elif obj := type_.is_queried_object_type:
+        _visit_narrowed_type(usage, obj)
+
+
+def _visit_narrowed_type(usage: SchemaUsage, t: QtGqlQueriedObjectType) -> None:
+    if id(t) in usage.visited:
+        return
+    usage.visited.add(id(t))
+    _mark_object_type(usage, t.concrete)
+    for impl in t.implementations:
+        _mark_object_type(usage, impl)
+    for f in t.fields:
+        _mark_object_type(usage, f.origin)
+        _mark_field(usage, f.origin, f.name)
+        _mark_field(usage, t.concrete, f.name)
+        _visit_queried_type(usage, f.type)
+
+
+def collect_schema_usage(
+    operations: Iterable[QtGqlOperationDefinition],
+    fragments: QtGqlFragmentsDefinition | None,
+) -> SchemaUsage:
+    usage = SchemaUsage()
+    for operation in operations:
+        for var in operation.variables:
+            _visit_input_type(usage, var.type)
+        _visit_narrowed_type(usage, operation.root_type)
+        for t in (*operation.narrowed_types, *operation.interfaces):
+            _visit_narrowed_type(usage, t)
+    if fragments:
+        for t in (*fragments.narrowed_types, *fragments.interfaces):
+            _visit_narrowed_type(usage, t)
+    return usage
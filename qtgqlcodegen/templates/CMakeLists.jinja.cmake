@@ -24,16 +24,68 @@ endif()
 # see https://doc.qt.io/qt-6/qt-cmake-policy-qtp0001.html
 qt_policy(SET QTP0001 NEW)
 
+{% if context.config.single_qml_module -%}
+# All the generated sources in a single QML module (and library), see `QtGqlConfig.single_qml_module`.
+qt_add_qml_module(${EnvTarget}
+        URI GraphQL.${EnvTarget}
+        OUTPUT_DIRECTORY ${QTGQL_QML_PLUGIN_DIRECTORY}
+        SOURCES
+        {% for filespec in context.generation_output.schema.sources -%}
+        👉 filespec.path.as_posix() 👈
+        {% endfor -%}
+        {% if context.generation_output.fragments -%}
+        {% for filespec in context.generation_output.fragments.sources -%}
+        👉 filespec.path.as_posix() 👈
+        {% endfor -%}
+        {% endif -%}
+        {% for operation in context.generation_output.operations -%}
+        {% for filespec in operation.sources -%}
+        👉 filespec.path.as_posix() 👈
+        {% endfor -%}
+        {% endfor -%}
+        )
+
+target_link_libraries(${EnvTarget} PUBLIC
+        Qt::CorePrivate
+        Qt::QuickPrivate
+        Qt::QmlPrivate
+        qtgql::qtgql
+        )
+target_compile_definitions(${EnvTarget} PRIVATE 👉 context.config.shared_lib_export_definition 👈)
+{%- else -%}
 add_library(${EnvTarget}schema
-        schema.hpp
+        {% for filespec in context.generation_output.schema.sources -%}
+        👉 filespec.path.as_posix() 👈
+        {% endfor -%}
         )
 target_link_libraries(${EnvTarget}schema
         PUBLIC
-        Qt::Core
+        Qt6::Core
         qtgql::qtgql
         )
 
 target_compile_definitions(${EnvTarget}schema PRIVATE 👉 context.config.shared_lib_export_definition 👈)
+{% set fragments = context.generation_output.fragments -%}
+{% if fragments %}
+# Narrowed types of fragments, shared by all the operations.
+qt_add_qml_module(${EnvTarget}👉 fragments.context.ns 👈
+        URI GraphQL.${EnvTarget}.👉 fragments.context.ns 👈
+        OUTPUT_DIRECTORY ${QTGQL_QML_PLUGIN_DIRECTORY}/👉 fragments.context.ns 👈
+        SOURCES
+        {% for filespec in fragments.sources -%}
+        👉 filespec.path.as_posix() 👈
+        {% endfor -%}
+        )
+
+target_link_libraries(${EnvTarget}👉 fragments.context.ns 👈 PUBLIC
+        Qt::CorePrivate
+        Qt::QuickPrivate
+        Qt::QmlPrivate
+        ${EnvTarget}schema
+        qtgql::qtgql
+        )
+target_compile_definitions(${EnvTarget}👉 fragments.context.ns 👈 PRIVATE 👉 context.config.shared_lib_export_definition 👈)
+{% endif %}
 {% for operation in context.generation_output.operations -%}
 qt_add_qml_module(${EnvTarget}👉 operation.name 👈
         URI GraphQL.${EnvTarget}.👉 operation.name 👈
@@ -49,6 +101,9 @@ target_link_libraries(${EnvTarget}👉 operation.name 👈 PUBLIC
         Qt::QuickPrivate
         Qt::QmlPrivate
         ${EnvTarget}schema
+        {% if fragments -%}
+        ${EnvTarget}👉 fragments.context.ns 👈
+        {% endif -%}
         qtgql::qtgql
         )
 target_compile_definitions(${EnvTarget}👉 operation.name 👈 PRIVATE 👉 context.config.shared_lib_export_definition 👈)
@@ -62,7 +117,49 @@ target_link_libraries(
     Qt6::Core
     qtgql::qtgql
     ${EnvTarget}schema
+    {% if fragments -%}
+    ${EnvTarget}👉 fragments.context.ns 👈
+    {% endif -%}
     {% for operation in context.generation_output.operations -%}
     ${EnvTarget}👉 operation.name 👈
     {% endfor %}
 )
+{%- endif %}
+{%- if context.config.precompile_headers or context.config.unity_build_batch_size %}
+
+# Build time optimizations, see `QtGqlConfig.precompile_headers` and `QtGqlConfig.unity_build_batch_size`.
+foreach(target
+        {% for target in context.targets -%}
+        ${EnvTarget}👉 target 👈
+        {% endfor -%}
+        )
+    {% if context.config.precompile_headers -%}
+    target_precompile_headers(${target} PRIVATE
+            {% for header in context.precompiled_headers -%}
+            👉 header 👈
+            {% endfor -%}
+            )
+    {% endif -%}
+    {% if context.config.unity_build_batch_size -%}
+    set_target_properties(${target} PROPERTIES
+            UNITY_BUILD ON
+            UNITY_BUILD_BATCH_SIZE 👉 context.config.unity_build_batch_size 👈
+            )
+    {%- endif %}
+endforeach()
+{%- endif %}
+{%- if context.generation_output.headless %}
+
+# Plain C++ types and clients of the operations (no QObjects / moc).
+add_library(${EnvTarget}headless INTERFACE)
+target_sources(${EnvTarget}headless
+        INTERFACE
+        {% for filespec in context.generation_output.headless -%}
+        👉 filespec.path.as_posix() 👈
+        {% endfor -%}
+        )
+target_link_libraries(${EnvTarget}headless INTERFACE
+        Qt6::Core
+        qtgql::qtgql
+        )
+{%- endif %}
\ No newline at end of file
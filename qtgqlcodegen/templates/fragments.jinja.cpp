@@ -0,0 +1,17 @@
+{%- from "macros/narrowed_type_definition.jinja.cpp" import  interface_deserializer_definition, narrowed_object_definition -%}
+{%- from "macros/extern_list_models.jinja.hpp" import  list_models_instantiation -%}
+
+#include "./fragments.hpp"
+
+namespace 👉 context.config.env_name 👈::👉context.ns👈{
+
+// Interfaces
+{% for interface in context.fragments.interfaces -%}
+👉 interface_deserializer_definition(interface, context) 👈
+{% endfor %}
+
+{% for t in context.fragments.narrowed_types -%}
+👉 narrowed_object_definition(t, context) 👈
+{% endfor %}
+}
+👉- list_models_instantiation(context) 👈
@@ -0,0 +1,49 @@
+{%- from "macros/narrowed_type_declaration.jinja.hpp" import  narrowed_interface_declaration, narrowed_object_declaration -%}
+{%- from "macros/extern_list_models.jinja.hpp" import  extern_list_models -%}
+#pragma once
+{% for include in context.schema_includes -%}
+#include "./👉 include 👈"
+{% endfor -%}
+#include <qtgql/bases/bases.hpp>
+#include <QObject>
+#include <QtQml/qqmlregistration.h>
+
+#if defined(👉context.config.shared_lib_export_definition 👈)
+#define 👉context.export_macro👈 Q_DECL_EXPORT
+#else
+#define 👉context.export_macro👈 Q_DECL_IMPORT
+#endif
+
+{# // Narrowed types of fragments, these are shared by all the operations using the fragment. -#}
+namespace 👉 context.config.env_name 👈::👉context.ns👈{
+
+namespace deserializers{
+{% for t in context.fragments.narrowed_types -%}
+std::shared_ptr<👉 t.concrete.name 👈> des_👉 t.name 👈(const QJsonObject& data, const 👉 context.operation_type 👈 * operation);
+{% endfor -%}
+{% for t in context.fragments.interfaces -%}
+std::shared_ptr<👉 t.concrete.name 👈> des_👉 t.name 👈(const QJsonObject& data, const 👉 context.operation_type 👈 * operation);
+{% endfor -%}
+};
+
+namespace updaters{
+{% for t in context.fragments.narrowed_types -%}
+void update_👉 t.name 👈(👉 t.concrete.member_type_arg 👈 inst, const QJsonObject &data, const 👉 context.operation_type 👈 * operation);
+{% endfor -%}
+};
+
+// ------------ Forward declarations ------------
+{% for t in context.fragments.narrowed_types -%}
+class 👉 t.name 👈;
+{% endfor %}
+
+// ------------ Narrowed Interfaces ------------
+{% for t in context.fragments.interfaces -%}
+👉 narrowed_interface_declaration(t, context) 👈
+{% endfor %}
+// ------------ Narrowed Object types ------------
+{% for t in context.fragments.narrowed_types %}
+👉 narrowed_object_declaration(t, context) 👈
+{% endfor %}
+};
+👉- extern_list_models(context) 👈
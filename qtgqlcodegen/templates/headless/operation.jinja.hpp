@@ -0,0 +1,55 @@
+{%- from "macros/operation_variables.jinja.hpp" import  operation_variables -%}
+#pragma once
+#include "./schema.hpp"
+#include <variant>
+
+{# // Plain C++ types of the operation (no QObjects), each response is deserialized to a new instance. -#}
+namespace 👉 context.config.env_name 👈::headless::👉context.ns👈{
+
+{% for t in context.object_types %}
+struct 👉 t.name 👈{
+QString __typename;
+{% for f in t.fields -%}
+👉 headless_type_name(f.type) 👈 👉 f.name 👈 = {};
+{% endfor %}
+{% if not t.concrete.is_root -%}
+using qtgql_type_ids = TypeIds;
+[[nodiscard]] static bool qtgql_matches(int type_id){
+{% if t.implementations -%}
+    return true; {# // generic type of the implementations without specific selections. #}
+{% else -%}
+    return type_id == TypeIds::👉 t.concrete.name 👈;
+{% endif -%}
+}
+{% endif %}
+{% set json_keys = context.json_keys(t) -%}
+static constexpr 👉 json_keys.cpp_type 👈 qtgql_keys👉 json_keys.cpp_initializer 👈;
+[[nodiscard]] static 👉 t.name 👈 from_json(const QJsonValue & value){
+    const auto qtgql__json = qtgql::bases::keys::extract(value.toObject(), qtgql_keys);
+    👉 t.name 👈 ret;
+    ret.__typename = qtgql__json[0].toString();
+    {% for f in t.fields -%}
+    ret.👉 f.name 👈 = qtgql::headless::deserialize<decltype(ret.👉 f.name 👈)>(qtgql__json[👉 json_keys.index_of(f.name) 👈]);
+    {% endfor -%}
+    return ret;
+}
+};
+{% endfor %}
+
+👉 operation_variables(context.operation) 👈
+
+class 👉 context.operation.name 👈: public qtgql::headless::OperationHandler<👉 context.operation.root_type.name 👈>{
+public:
+👉 context.operation.name 👈(): qtgql::headless::OperationHandler<👉 context.operation.root_type.name 👈>(qtgql::bases::GraphQLMessage(
+        {%- for line in context.operation.query.splitlines() %}"👉 line 👈"{% endfor -%}
+        )){};
+
+QTGQL_STATIC_MAKE_SHARED(👉 context.operation.name 👈)
+
+{% if context.operation.variables %}
+void set_variables(const 👉 context.operation.generated_variables_type 👈 & vars){
+    set_vars(vars.to_json());
+}
+{% endif %}
+};
+};
@@ -0,0 +1,45 @@
+{%- from "macros/input_object_definition.jinja.hpp" import input_object_definition -%}
+{%- from "macros/type_ids.jinja.hpp" import type_ids -%}
+#pragma once
+#include <QJsonObject>
+#include <QJsonArray>
+#include <memory>
+#include <optional>
+#include <vector>
+
+#include <qtgql/headless/headless.hpp>
+{% for dep in context.dependencies -%}
+👉 dep 👈
+{% endfor %}
+
+{# // Plain C++ types of the schema that are used by the headless operations (no QObjects). -#}
+namespace 👉 context.config.env_name 👈::headless{
+{% if context.enums %}
+// ---------- Enums ----------
+namespace Enums{
+{% for enum in context.enums %}
+enum 👉enum.name👈{
+{% for member in enum.members -%}
+👉member.name👈 = 👉member.index👈,
+{% endfor %}
+};
+struct 👉enum.map_name👈{
+static constexpr 👉 enum.members_table.cpp_type 👈 members👉 enum.members_table.cpp_initializer 👈;
+    GraphQLEnum_MACRO(👉enum.name👈)
+};
+{# // found by ADL when deserializing. -#}
+inline 👉enum.name👈 qtgql_enum_by_name(👉enum.name👈, const QString & name){
+    return 👉enum.map_name👈::by_name(name);
+}
+
+{% endfor %}
+};
+{% endif %}
+
+// ---------- INPUT OBJECTS ----------
+{% for type in context.input_objects -%}
+👉 input_object_definition(type) 👈
+{% endfor %}
+
+👉 type_ids(context) 👈
+}
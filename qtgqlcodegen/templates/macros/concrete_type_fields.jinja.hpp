@@ -1,46 +1,27 @@
-{% macro concrete_type_fields(type) -%}
-public:
-{% for f in type.unique_fields -%}
-{% set f_member_type -%}
+{% macro concrete_field_member_type(f, cache_size) -%}
 {% if f.arguments -%}
-std::unordered_map<👉f.arguments_type👈, 👉f.type.member_type👈, qtgql::bases::tools::QJsonValueHasher>
+qtgql::bases::ArgsCache<👉f.type.member_type👈, 👉 cache_size 👈>
 {% else -%}
 👉f.type.member_type👈
 {% endif -%}
-{%- endset -%}
-👉 f_member_type 👈 👉 f.private_name 👈 = 👉 f.default_value 👈;
+{% endmacro -%}
+
+{% macro concrete_type_fields(type, fields, context) -%}
+public:
+{% for f in fields -%}
+👉 concrete_field_member_type(f, context.args_cache_size(f)) 👈 👉 f.private_name 👈 = 👉 f.default_value 👈;
 {% endfor %}
 signals:
-{%for f in type.unique_fields -%}
+{%for f in fields -%}
 void 👉 f.signal_name 👈();
 {% endfor %}
 
 public:
-{%for f in type.unique_fields %}
+{%for f in fields %}
 [[nodiscard]] const 👉 f.type.fget_type 👈 &👉 f.getter_name 👈(
 {%- if f.arguments -%}const 👉 f.arguments_type 👈 & args {% endif -%}
-) {%- if f.type.getter_is_constable -%}const{% endif %}{
-{%- if f.arguments -%}
-{% set f_private_name %}👉 f.private_name 👈.at(args){% endset %}
-{% else -%}
-{% set f_private_name %}👉 f.private_name 👈{% endset %}
-{% endif -%}
-{% if f.is_custom_scalar -%}
-return 👉 f_private_name 👈;
-{% else -%}
-return 👉 f_private_name 👈;
-{% endif -%}
-}
-void 👉 f.setter_name 👈(👉 f.type.member_type_arg 👈 v{% if f.arguments %}, const 👉 f.arguments_type 👈 & args {% endif %})
-{
-{%- if f.arguments -%}
-{% set f_private_name %}👉 f.private_name 👈[args]{% endset %}
-{% else -%}
-{% set f_private_name %}👉 f.private_name 👈{% endset %}
-{% endif -%}
-👉 f_private_name 👈 = v;
-emit 👉 f.signal_name 👈();
-};
+) {%- if f.type.getter_is_constable -%}const{% endif %};
+void 👉 f.setter_name 👈(👉 f.type.member_type_arg 👈 v{% if f.arguments %}, const 👉 f.arguments_type 👈 & args {% endif %});
 {% endfor %}
 {% if type.implements_node -%}
 public:
@@ -54,3 +35,42 @@ static std::optional<std::shared_ptr<👉 type.name 👈>> get_node(const QStrin
 {% endif %}
 {% endmacro -%}
 
+{% macro concrete_type_fields_definition(type, fields, lazy=False, watched=False) -%}
+{%for f in fields %}
+const 👉 f.type.fget_type 👈 &👉 type.name 👈::👉 f.getter_name 👈(
+{%- if f.arguments -%}const 👉 f.arguments_type 👈 & args {% endif -%}
+) {%- if f.type.getter_is_constable -%}const{% endif %}{
+{%- if lazy and f.is_leaf %}
+if (auto raw = qtgql_pending.take(&👉 f.private_name 👈)){
+    {#- converted on first access, that's not a change so there is no signal. -#}
+    const_cast<👉 type.name 👈 *>(this)->👉 f.private_name 👈 = qtgql::bases::lazy::materialize<👉 f.type.member_type 👈>(*raw, 👉 f.from_json 👈);
+}
+{% elif lazy and not watched and not f.arguments and (f.type.is_object_type or (f.type.is_model and f.type.of_type.is_object_type)) %}
+{# deserialized on first access if it was deferred (see `lazy_object`). -#}
+qtgql_pending.load(&👉 f.private_name 👈);
+{% endif -%}
+{%- if f.arguments %}
+return 👉 f.private_name 👈.at(args);
+{% else %}
+return 👉 f.private_name 👈;
+{% endif -%}
+}
+
+void 👉 type.name 👈::👉 f.setter_name 👈(👉 f.type.member_type_arg 👈 v{% if f.arguments %}, const 👉 f.arguments_type 👈 & args {% endif %})
+{
+{%- if f.arguments %}
+👉 f.private_name 👈[args] = v;
+{% else %}
+👉 f.private_name 👈 = v;
+{% endif -%}
+{% if lazy and not f.arguments -%}
+{#- the raw value (if any) is outdated. -#}
+qtgql_pending.take(&👉 f.private_name 👈);
+{% endif -%}
+{% if watched -%}
+qtgql_watchers.notify();
+{% endif -%}
+emit 👉 f.signal_name 👈();
+}
+{% endfor %}
+{% endmacro -%}
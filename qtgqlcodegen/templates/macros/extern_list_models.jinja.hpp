@@ -0,0 +1,19 @@
+{% macro extern_list_models(context) -%}
+{% if context.list_model_types %}
+
+// Instantiated once by the source of these proxy types.
+{% for t in context.list_model_types -%}
+extern template class 👉 context.export_macro 👈 👉 t 👈;
+{% endfor -%}
+{% endif -%}
+{% endmacro -%}
+
+{% macro list_models_instantiation(context) -%}
+{% if context.list_model_types %}
+
+// The list models of these proxy types, every other source declares them `extern`.
+{% for t in context.list_model_types -%}
+template class 👉 context.export_macro 👈 👉 t 👈;
+{% endfor -%}
+{% endif -%}
+{% endmacro -%}
@@ -0,0 +1,33 @@
+{% macro choices(f, element_type, context) -%}
+{% set tables = "qtgql::bases::tables" -%}
+{% set narrowed = f.type.is_model.of_type if f.type.is_model else f.type -%}
+{% set dispatch = narrowed.is_queried_interface or narrowed.is_queried_union -%}
+{# `Choices`: the choices and `by_name` for interfaces and unions. -#}
+{{{% for choice in (narrowed.choices if dispatch else [narrowed]) -%}
+👉 tables 👈::Choice<👉 element_type 👈, 👉 context.operation_type 👈>{👉 "TypeIds::" ~ choice.concrete.name if not choice.implementations else tables ~ "::OTHER_TYPES" 👈, &👉 tables 👈::deserialize_as<👉 element_type 👈, 👉 context.operation_type 👈, &👉 choice.deserializer_name 👈>, {% if context.generates_updater(choice) %}&👉 tables 👈::update_as<👉 element_type 👈, 👉 choice.concrete.name 👈, 👉 context.operation_type 👈, &👉 choice.updater_name 👈, 👉 "true" if choice.implements_node else "false" 👈>{% else %}nullptr{% endif %}}👉 ", " if not loop.last 👈
+{%- endfor -%}
+}{% if dispatch %}, &TypeIds::by_name{% endif %}}
+{%- endmacro %}
+{% macro field_table(t, context) -%}
+{% set tables = "qtgql::bases::tables" -%}
+namespace field_tables{
+constexpr auto 👉 t.name 👈 = std::make_tuple(
+{% for f in context.table_fields(t) -%}
+{% set flags -%}
+👉 tables 👈::👉 "NULLABLE" if f.type.is_optional else "NONE" 👈
+{%- if f.is_root %} | 👉 tables 👈::ROOT{% endif %}
+{%- endset -%}
+{% if f.concrete.is_leaf -%}
+👉 tables 👈::LeafField<👉 t.concrete.name 👈, 👉 f.type.member_type 👈>{👉 t.json_keys.index_of(f.name) 👈, &👉 t.concrete.name 👈::👉 f.private_name 👈, &👉 t.concrete.name 👈::👉 f.concrete.setter_name 👈, 👉 f.concrete.from_json 👈, 👉 flags 👈}
+{%- elif f.type.is_model -%}
+{% set choices_count = f.type.of_type.choices | length if (f.type.of_type.is_queried_interface or f.type.of_type.is_queried_union) else 1 -%}
+👉 tables 👈::ObjectListField<👉 t.concrete.name 👈, 👉 f.concrete.type.member_type 👈, 👉 context.operation_type 👈, 👉 choices_count 👈>{👉 t.json_keys.index_of(f.name) 👈, &👉 t.concrete.name 👈::👉 f.concrete.setter_name 👈, 👉 choices(f, f.concrete.type.of_type.member_type, context) 👈, 👉 flags 👈}
+{%- else -%}
+{% set choices_count = f.type.choices | length if (f.type.is_queried_interface or f.type.is_queried_union) else 1 -%}
+👉 tables 👈::ObjectField<👉 t.concrete.name 👈, 👉 f.concrete.type.member_type 👈, 👉 context.operation_type 👈, 👉 choices_count 👈>{👉 t.json_keys.index_of(f.name) 👈, &👉 t.concrete.name 👈::👉 f.private_name 👈, &👉 t.concrete.name 👈::👉 f.concrete.setter_name 👈, 👉 choices(f, f.concrete.type.member_type, context) 👈, 👉 flags 👈}
+{%- endif -%}
+👉 "," if not loop.last 👈
+{% endfor -%}
+);
+}
+{%- endmacro %}
@@ -1,8 +1,36 @@
 {%- from "macros/iterate_type_condition.jinja.hpp" import  iterate_type_condition -%}
-{% macro initialize_proxy_field(parent_type, field, operation_pointer = "operation") -%}
+{% macro initialize_proxy_field(parent_type, field, operation_pointer = "operation", lazy = False) -%}
+{% if lazy and (field.type.is_queried_object_type or field.type.is_queried_interface or field.type.is_queried_union) -%}
+{#- created by the getter on first access. -#}
+{% elif lazy and field.type.is_model and not field.type.of_type.is_builtin_scalar -%}
+{#- the elements are created when they are first accessed. -#}
+👉field.private_name👈 = new qtgql::bases::ListModelABC<👉 field.type.of_type.property_type 👈>(this, m_inst->👉field.concrete.getter_name 👈(
+{%- if field.cached_by_args -%}👉 parent_type.name 👈::👉field.variable_builder_name 👈(👉 operation_pointer 👈){%- endif -%}
+).size(), [this](std::size_t i) -> 👉 field.type.of_type.property_type 👈 {
+    auto operation = m_operation;
+    const auto &node = m_inst->👉field.concrete.getter_name 👈(
+    {%- if field.cached_by_args -%}👉 parent_type.name 👈::👉field.variable_builder_name 👈(operation){%- endif -%}
+    ).at(i);
+    {% if field.type.of_type.is_queried_object_type -%}
+    return new 👉field.type.of_type.type_name()👈(operation, node);
+    {% else -%}
+    {% for choice in field.type.of_type.choices -%}
+    {% set do_on_meets -%}
+    return qobject_cast<👉 field.type.of_type.property_type 👈>(new 👉choice.type_name()👈(operation, std::static_pointer_cast<👉 choice.concrete.name 👈>(node)));
+    {% endset -%}
+    👉iterate_type_condition(choice, "node->qtgql_type_id()", "node->__typename()", do_on_meets, loop)👈
+    {% endfor %}
+    {% endif -%}
+});
+{% if field.type.is_keyed -%}
+👉field.private_name👈->set_keys(qtgql::bases::node_keys(m_inst->👉field.concrete.getter_name 👈(
+{%- if field.cached_by_args -%}👉 parent_type.name 👈::👉field.variable_builder_name 👈(👉 operation_pointer 👈){%- endif -%}
+)));
+{% endif -%}
+{% else -%}
 
 {% if field.cached_by_args -%}
-auto args_for_👉field.name 👈 = 👉 parent_type.name 👈::👉field.variable_builder_name 👈( 👉 operation_pointer 👈);
+const auto &args_for_👉field.name 👈 = 👉 parent_type.name 👈::👉field.variable_builder_name 👈( 👉 operation_pointer 👈);
 {%set instance_of_concrete -%}
 m_inst->👉field.concrete.getter_name 👈(args_for_👉field.name 👈)
 {% endset -%}
@@ -20,36 +48,43 @@ if (👉 instance_of_concrete 👈){
 👉field.private_name👈 = new 👉field.type.type_name()👈(👉operation_pointer👈, 👉 instance_of_concrete 👈);
 {% elif field.type.is_model and not field.type.of_type.is_builtin_scalar %}
     {% if  field.type.is_model.of_type.is_queried_object_type %}
-    auto init_vec_👉 field.name 👈 =  std::vector<👉field.type.of_type.name👈*>();
-    for (const auto & node: 👉 instance_of_concrete 👈){
-    init_vec_👉 field.name 👈.push_back(new 👉field.type.of_type.name👈(👉operation_pointer👈, node));
+    const auto &concrete_👉field.name👈 = 👉 instance_of_concrete 👈;
+    auto init_vec_👉 field.name 👈 =  std::vector<👉field.type.of_type.property_type👈>();
+    init_vec_👉 field.name 👈.reserve(concrete_👉field.name👈.size());
+    for (const auto & node: concrete_👉field.name👈){
+    init_vec_👉 field.name 👈.push_back(new 👉field.type.of_type.type_name()👈(👉operation_pointer👈, node));
     }
     👉field.private_name👈 = new qtgql::bases::ListModelABC<👉 field.type.of_type.property_type 👈>(this, std::move(init_vec_👉 field.name 👈));
+    {% if field.type.is_keyed -%}
+    👉field.private_name👈->set_keys(qtgql::bases::node_keys(concrete_👉field.name👈));
+    {% endif -%}
     {% elif field.type.is_model.of_type.is_queried_union or field.type.is_model.of_type.is_queried_interface%}
+    const auto &concrete_👉field.name👈 = 👉 instance_of_concrete 👈;
     auto init_vec_👉 field.name 👈 =  std::vector<👉field.type.of_type.property_type👈>();
-    for (const auto & node: 👉 instance_of_concrete 👈){
-        auto 👉field.name👈_typename = node->__typename();
-        {%set type_cond -%}👉field.name👈_typename{% endset -%}
+    init_vec_👉 field.name 👈.reserve(concrete_👉field.name👈.size());
+    for (const auto & node: concrete_👉field.name👈){
         {% for choice in field.type.of_type.choices -%}
         {% set do_on_meets -%}
         init_vec_👉 field.name 👈.push_back(qobject_cast<👉 field.type.of_type.property_type 👈>(new 👉choice.type_name()👈(👉operation_pointer👈, std::static_pointer_cast<👉 choice.concrete.name 👈>(node))));
         {% endset -%}
-        👉iterate_type_condition(choice,type_cond, do_on_meets, loop)👈
+        👉iterate_type_condition(choice, "node->qtgql_type_id()", "node->__typename()", do_on_meets, loop)👈
         {% endfor %}
     }
     👉field.private_name👈 = new qtgql::bases::ListModelABC<👉 field.type.of_type.property_type 👈>(this, std::move(init_vec_👉 field.name 👈));
+    {% if field.type.is_keyed -%}
+    👉field.private_name👈->set_keys(qtgql::bases::node_keys(concrete_👉field.name👈));
+    {% endif -%}
     {% else %}
     not implemented
     {% endif %}
 {% elif field.type.is_queried_interface or  field.type.is_queried_union %}
 auto concrete_👉field.name👈 = 👉 instance_of_concrete 👈;
-auto 👉field.name👈_typename = concrete_👉field.name👈->__typename();
-{%set type_cond -%}👉field.name👈_typename{% endset -%}
 {% for choice in field.type.choices -%}
 {% set do_on_meets -%}
 👉field.private_name👈 = qobject_cast<👉 field.type.property_type 👈>(new 👉choice.type_name()👈(👉operation_pointer👈, std::static_pointer_cast<👉 choice.concrete.name 👈>(concrete_👉field.name👈)));
 {% endset -%}
-👉iterate_type_condition(choice,type_cond, do_on_meets, loop)👈
+👉iterate_type_condition(choice, "concrete_" ~ field.name ~ "->qtgql_type_id()", "concrete_" ~ field.name ~ "->__typename()", do_on_meets, loop)👈
 {% endfor %}
 {% endif -%}
+{% endif -%}
 {% endmacro -%}
\ No newline at end of file
@@ -0,0 +1,31 @@
+{%- from "macros/serialize_input_variable.jinja.hpp" import  serialize_input_variable -%}
+{% macro input_object_definition(type) -%}
+/*
+ * 👉 type.docstring 👈
+ */
+struct 👉type.name👈{
+
+public:
+{% for arg in type.fields -%}
+{% if arg.type.is_optional -%}
+std::optional<👉 arg.type.type_name() 👈> 👉 arg.name 👈 = {};
+{% else -%}
+👉 arg.type.type_name() 👈 👉 arg.name 👈;
+{% endif -%}
+{% endfor -%}
+[[nodiscard]] QJsonObject to_json() const{
+    auto __ret = QJsonObject();
+    {% for arg in type.fields -%}
+    👉serialize_input_variable("__ret", arg, attr_name=arg.name, json_name=arg.name)👈
+    {% endfor -%}
+    return __ret;
+}
+
+template<typename... Args>
+static 👉type.type_name()👈 create(Args... args){
+    return std::make_shared<👉type.name👈>(args...);
+}
+
+
+};
+{%- endmacro %}
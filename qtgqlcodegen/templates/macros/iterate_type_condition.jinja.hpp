@@ -1,16 +1,24 @@
-{% macro iterate_type_condition(choice, type_cond, do_on_meets, loop) -%}
+{% macro iterate_type_condition(choice, type_id, type_name, do_on_meets, loop) -%}
+{# // switches on the type id, `type_name` is used only for the error of an unknown type. -#}
 {% if loop.first -%}
-if (👉type_cond👈 == "👉choice.concrete.name👈"){
+switch (👉type_id👈){
+{% endif -%}
+{% if choice.implementations -%}
+{#- generic type of implementations without specific selections, always the last choice. -#}
+default:{
     👉 do_on_meets 👈
 }
 {% else -%}
-else if (👉type_cond👈 == "👉choice.concrete.name👈"){
+case TypeIds::👉choice.concrete.name👈:{
     👉 do_on_meets 👈
+    break;
 }
 {% endif -%}
 {% if loop.last -%}
-else{
-    throw qtgql::exceptions::InterfaceDeserializationError({👉type_cond👈.toStdString()});
+{% if not choice.implementations -%}
+default:
+    throw qtgql::exceptions::InterfaceDeserializationError({👉type_name👈.toStdString()});
+{% endif -%}
 }
 {% endif -%}
-{% endmacro -%}
\ No newline at end of file
+{% endmacro -%}
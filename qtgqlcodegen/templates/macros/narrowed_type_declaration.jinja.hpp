@@ -0,0 +1,53 @@
+{%- from "macros/proxy_type_fields.jinja.hpp" import  proxy_type_fields -%}
+{% macro narrowed_interface_declaration(t, context) -%}
+class 👉context.export_macro👈  👉 t.name 👈: public 👉 context.qtgql_types.ObjectTypeABC.name 👈{
+
+👉 proxy_type_fields(t, context) 👈
+public:
+    using 👉 context.qtgql_types.ObjectTypeABC.name 👈::👉 context.qtgql_types.ObjectTypeABC.last 👈;
+{% for f in t.fields -%}
+[[nodiscard]] inline virtual const 👉 f.type.property_type 👈  👉 f.concrete.getter_name 👈() const {
+throw qtgql::exceptions::InterfaceDirectAccessError("👉t.concrete.name👈");
+}
+{% endfor %}
+};
+{%- endmacro %}
+
+{% macro narrowed_object_declaration(t, context) -%}
+class 👉context.export_macro👈  👉 t.name 👈: public 👉 context.qtgql_types.ObjectTypeABC.name if not t.base_interface else t.base_interface.name 👈{
+
+👉context.operation_type👈* m_operation;
+
+👉 proxy_type_fields(t, context) 👈
+public:
+// args builders
+{%for f in t.fields_with_args -%}
+static const 👉 f.concrete.arguments_type 👈 & 👉 f.variable_builder_name 👈(const 👉context.operation_type👈* operation);
+{% endfor %}
+
+👉 t.name 👈(👉 context.operation_type 👈 * operation, const std::shared_ptr<👉 t.concrete.name 👈> &inst);
+{% if not context.deserialize_only -%}
+{% if  not t.concrete.is_root -%}
+void qtgql_replace_concrete(const std::shared_ptr<👉 t.concrete.name 👈> & new_inst);
+{% endif %}
+protected:
+    void _qtgql_connect_signals();
+{% endif -%}
+public:
+{% for f in t.fields -%}
+[[nodiscard]] const 👉 f.type.property_type 👈 👉 f.concrete.getter_name 👈() const;
+{% endfor -%}
+// fields with custom getters
+{% for f in t.fields_with_custom_getter -%}
+[[nodiscard]] const 👉 f.type.proxy_cpp_type 👈 & 👉 f.concrete.getter_name 👈_cpp() const;
+{% endfor -%}
+
+public:
+[[nodiscard]] const QString & __typename() const final{
+    return m_inst->__typename();
+}
+[[nodiscard]] int qtgql_type_id() const final{
+    return m_inst->qtgql_type_id();
+}
+};
+{%- endmacro %}
@@ -0,0 +1,290 @@
+{%- from "macros/initialize_proxy_field.jinja.hpp" import initialize_proxy_field -%}
+{%- from "macros/deserialize_concrete_field.jinja.hpp" import  deserialize_concrete_field -%}
+{%- from "macros/update_concrete_field.jinja.hpp" import  update_concrete_field -%}
+{%- from "macros/update_proxy_field.jinja.cpp" import  update_proxy_field -%}
+{%- from "macros/iterate_type_condition.jinja.hpp" import  iterate_type_condition -%}
+{%- from "macros/serialize_input_variable.jinja.hpp" import  serialize_input_variable -%}
+{%- from "macros/field_table.jinja.cpp" import  field_table -%}
+{% macro lazy_loader(f, context) -%}
+{% if not f.concrete.is_leaf -%}
+, &qtgql::bases::lazy::load<👉 f.concrete.type.member_type 👈, &👉 context.lazy_object(f).deserializer_name 👈>
+{%- endif %}
+{%- endmacro %}
+{% macro interface_deserializer_definition(interface, context) -%}
+std::shared_ptr<👉 interface.concrete.name 👈> 👉 interface.deserializer_name 👈(const QJsonObject& data, const 👉 context.operation_type 👈 * operation){
+auto type_name = data.value(qtgql::bases::keys::TYPENAME).toString();
+{% for choice in interface.choices -%}
+{% set do_on_meets -%}
+{% if interface.concrete.implements_node %}
+auto cached_maybe = 👉 interface.concrete.name 👈::get_node(data.value(qtgql::bases::keys::ID).toString());
+if(cached_maybe.has_value()){
+auto node = cached_maybe.value();
+👉 interface.updater_name 👈(node, data, operation);
+return std::static_pointer_cast<👉 interface.concrete.name 👈>(node);
+}
+{% endif -%}
+return std::static_pointer_cast<👉 interface.concrete.name 👈>(👉 choice.deserializer_name 👈(data, operation));
+{% endset -%}
+👉iterate_type_condition(choice, "TypeIds::by_name(type_name)", "type_name", do_on_meets, loop)👈
+{% endfor -%}
+throw qtgql::exceptions::InterfaceDeserializationError(type_name.toStdString());
+}
+{%- endmacro %}
+
+{% macro narrowed_object_definition(t, context) -%}
+// Constructor
+{% set base_name -%}
+👉 context.qtgql_types.ObjectTypeABC.last if not t.base_interface else t.base_interface.name 👈
+{% endset -%}
+👉 t.name 👈::👉 t.name 👈(👉 context.operation_type 👈 * operation, const std::shared_ptr<👉 t.concrete.name 👈> &inst)
+: m_inst{inst}, 👉 base_name 👈::👉 base_name 👈(operation)
+{
+    m_operation = operation;
+    {%- for field in t.fields -%}
+    👉 initialize_proxy_field(t, field, lazy=context.config.lazy_proxies) 👈
+    {% endfor -%}
+    {% if not context.deserialize_only -%}
+    _qtgql_connect_signals();
+    {% endif -%}
+}
+
+{% if not context.deserialize_only -%}
+void 👉 t.name 👈::_qtgql_connect_signals(){
+{# connecting signals here, when the concrete changed it will be mirrored here. -#}
+auto m_inst_ptr = m_inst.get();
+Q_ASSERT_X(m_inst_ptr, __FILE__, "Tried to instantiate a proxy object with an empty pointer!");
+{% for field in t.fields -%}
+connect(m_inst_ptr, &👉context.schema_ns👈::👉t.concrete.name👈::👉 field.concrete.signal_name 👈, this,
+[&](){
+👉update_proxy_field(t, field, lazy=context.config.lazy_proxies)👈
+});
+{% endfor -%}
+};
+{% endif %}
+
+namespace field_keys{
+constexpr 👉 t.json_keys.cpp_type 👈 👉 t.name 👈👉 t.json_keys.cpp_initializer 👈;
+}
+{% if context.table_fields(t) -%}
+👉 field_table(t, context) 👈
+{% endif -%}
+// Deserialzier
+{% if not t.concrete.is_root %}
+std::shared_ptr<👉 t.concrete.name 👈> 👉 t.deserializer_name 👈(const QJsonObject& data, const 👉 context.operation_type 👈 * operation){
+if (data.isEmpty()){
+    return {};
+}
+{% if t.implementations %}
+{#- generic type of an interface, the concrete is the interface itself. -#}
+{% if t.implements_node %}
+auto cached_maybe = 👉 t.concrete.name 👈::ENV_CACHE()->get_node(data.value(qtgql::bases::keys::ID).toString());
+if(cached_maybe.has_value()){
+    auto node = std::static_pointer_cast<👉 t.concrete.name 👈>(cached_maybe.value());
+    👉 t.updater_name 👈(node, data, operation);
+    return node;
+}
+{% endif -%}
+std::shared_ptr<👉 t.concrete.name 👈> inst;
+auto type_name = data.value(qtgql::bases::keys::TYPENAME).toString();
+switch (TypeIds::by_name(type_name)){
+{% for impl in t.implementations -%}
+case TypeIds::👉 impl.name 👈:
+    inst = 👉 impl.name 👈::shared();
+    break;
+{% endfor -%}
+default:
+    throw qtgql::exceptions::InterfaceDeserializationError(type_name.toStdString());
+}
+{% else %}
+{% if t.concrete.implements_node %}
+auto cached_maybe = 👉 t.concrete.name 👈::get_node(data.value(qtgql::bases::keys::ID).toString());
+if(cached_maybe.has_value()){
+    auto node = cached_maybe.value();
+    👉 t.updater_name 👈(node, data, operation);
+    return node;
+}
+{% endif -%}
+auto inst = 👉 t.concrete.name 👈::shared();
+{% endif %}
+{% if t.fields -%}
+const auto qtgql__json = qtgql::bases::keys::extract(data, field_keys::👉 t.name 👈);
+{% endif -%}
+{% if context.table_fields(t) -%}
+qtgql::bases::tables::deserialize_fields(inst.get(), qtgql__json, operation, field_tables::👉 t.name 👈);
+{% endif -%}
+{% for f in t.fields if not context.is_table_field(f) -%}
+{% if context.is_lazy_field(f) -%}
+{#- converted when it is first read. -#}
+inst->qtgql_pending.defer(&inst->👉 f.private_name 👈, qtgql__json[👉 t.json_keys.index_of(f.name) 👈]👉 lazy_loader(f, context) 👈);
+{% else -%}
+👉deserialize_concrete_field(t, f)👈
+{% endif -%}
+{% endfor %}
+{% if t.implements_node %}
+👉 t.concrete.name 👈::ENV_CACHE()->add_node(inst);
+{% endif %}
+{% if context.config.skip_unchanged_subtrees -%}
+qtgql::bases::subtrees::watch(inst->qtgql_watchers);
+{% endif -%}
+return inst;
+};
+{% endif %}
+
+{% if context.generates_updater(t) %}
+// Updater
+void 👉 t.updater_name 👈(👉 t.concrete.member_type_arg 👈 inst, const QJsonObject &data, const 👉 context.operation_type 👈 * operation)
+{
+{% if context.skips_unchanged(t) -%}
+{#- identifies this updater in the update records of the instance. -#}
+static const char qtgql__updater_key = 0;
+const qtgql::bases::subtrees::Scope qtgql__scope(data);
+if (qtgql__scope.unchanged(inst->qtgql_update_records, &qtgql__updater_key)){
+    return;
+}
+{% endif -%}
+{% if t.fields -%}
+const auto qtgql__json = qtgql::bases::keys::extract(data, field_keys::👉 t.name 👈);
+{% endif -%}
+{% if context.table_fields(t) -%}
+qtgql::bases::tables::👉 "deserialize_fields" if context.deserialize_only else "update_fields" 👈(inst.get(), qtgql__json, operation, field_tables::👉 t.name 👈);
+{% endif -%}
+{%for f in t.fields if not context.is_table_field(f) -%}
+{% if context.is_lazy_field(f) -%}
+{#- not read yet, only the raw value is replaced. -#}
+if (!inst->qtgql_pending.replace(&inst->👉 f.private_name 👈, qtgql__json[👉 t.json_keys.index_of(f.name) 👈]👉 lazy_loader(f, context) 👈)){
+{% if not f.concrete.is_leaf and not context.deserialize_only -%}
+{#- deferred by other selections, the instance is updated. -#}
+inst->qtgql_pending.load(&inst->👉 f.private_name 👈);
+{% endif -%}
+{% endif -%}
+{% if context.deserialize_only -%}
+{#- nothing observes the previous values, just set the new ones. -#}
+👉deserialize_concrete_field(t, f)👈
+{% else -%}
+👉update_concrete_field(t, f,f.concrete, private_name=f.private_name, operation_pointer="operation", watched=context.config.skip_unchanged_subtrees)👈
+{% endif -%}
+{% if context.is_lazy_field(f) -%}
+}
+{% if context.config.skip_unchanged_subtrees -%}
+else {
+inst->qtgql_watchers.notify();
+}
+{% endif -%}
+{% endif -%}
+{% endfor %}
+{% if context.config.skip_unchanged_subtrees -%}
+qtgql::bases::subtrees::watch(inst->qtgql_watchers);
+{% endif -%}
+{% if context.skips_unchanged(t) -%}
+qtgql__scope.remember(inst->qtgql_update_records, &qtgql__updater_key);
+{% endif -%}
+};
+{% endif %}
+
+
+
+// 👉 t.name 👈 Getters
+{%for f in t.fields -%}
+[[nodiscard]] const 👉 f.type.property_type 👈  👉 t.name 👈::👉 f.concrete.getter_name 👈() const {
+{% if f.type.is_model and f.type.of_type.is_builtin_scalar -%}
+return m_inst->👉 f.concrete.getter_name 👈(
+        {% if f.cached_by_args -%}
+        👉f.variable_builder_name 👈(m_operation)
+        {% endif -%}
+        ).get();
+{% elif f.type.is_queried_object_type or f.type.is_queried_interface or f.type.is_queried_union or f.type.is_model  -%}
+{% if context.config.lazy_proxies and not f.type.is_model -%}
+if (!👉f.private_name👈){
+    👉 initialize_proxy_field(t, f, operation_pointer="m_operation") 👈
+}
+{% endif -%}
+return 👉f.private_name👈;
+{% elif f.type.is_custom_scalar %}
+    {%- set value_or_null -%}
+    m_inst->👉 f.concrete.getter_name 👈(
+    {%- if f.cached_by_args -%}
+    👉f.variable_builder_name 👈(m_operation)
+    {% endif -%}
+    )
+    {%- endset -%}
+    {% if f.type.is_optional -%}
+    const auto &ret = 👉 value_or_null 👈;
+    if (ret)
+    return ret->to_qt();
+    else
+    return 👉f.type.default_value_for_proxy 👈;
+    {% else -%}
+    return 👉 value_or_null 👈->to_qt();
+    {% endif -%}
+{% else -%}
+    {%- set value_or_null -%}
+    m_inst->👉 f.concrete.getter_name 👈(
+    {%- if f.cached_by_args -%}
+    👉f.variable_builder_name 👈(m_operation)
+    {% endif -%}
+    );
+    {%- endset -%}
+    {% if f.type.is_optional -%}
+    const auto &ret = 👉 value_or_null 👈
+    if (ret)
+        return *ret;
+    else
+        return 👉f.type.default_value_for_proxy 👈;
+    {% else -%}
+    return *👉 value_or_null 👈;
+    {% endif -%}
+{%- endif -%}
+};
+{% endfor %}
+// 👉 t.name 👈 custom getters
+{% for f in t.fields_with_custom_getter -%}
+[[nodiscard]] const 👉 f.type.proxy_cpp_type 👈 & 👉 t.name 👈::👉 f.concrete.getter_name 👈_cpp() const {
+    return m_inst->👉 f.concrete.getter_name 👈(
+    {%- if f.cached_by_args -%}
+    👉f.variable_builder_name 👈(m_operation)
+    {% endif -%}
+    );
+}
+{% endfor -%}
+
+// args builders
+{%for f in t.fields_with_args -%}
+const 👉 f.concrete.arguments_type 👈 & 👉 t.name 👈::👉 f.variable_builder_name 👈(const 👉context.operation_type👈* operation){
+    {% if f.variable_uses -%}
+    return operation->👉 f.args_memo_name(t) 👈.get(operation->vars_version(), [operation](){
+        QJsonObject qtgql__ret;
+        {%for var_use in f.variable_uses -%}
+        {% set arg_attr_name -%} operation->vars_inst.👉 var_use.variable.name 👈 {% endset -%}
+        👉serialize_input_variable("qtgql__ret", var_use.variable, attr_name=arg_attr_name, json_name=var_use.argument[1].name)👈
+        {% endfor -%}
+        return 👉 f.concrete.arguments_type 👈(std::move(qtgql__ret));
+    });
+    {% else -%}
+    {#- doesn't depend on the variables, pinned for good. -#}
+    static qtgql::bases::MemoizedArgs qtgql__memo;
+    return qtgql__memo.get(1, [](){ return 👉 f.concrete.arguments_type 👈(QJsonObject()); });
+    {% endif -%}
+}
+{% endfor %}
+
+{% if not t.concrete.is_root and not context.deserialize_only -%}
+void 👉 t.name 👈::qtgql_replace_concrete(const std::shared_ptr<👉 t.concrete.name 👈> & new_inst){
+    if (new_inst == m_inst){
+    return;
+    }
+    m_inst->disconnect(this);
+    {% for field in t.fields -%}
+    {% if context.is_lazy_field(field) -%}
+    {#- the getters convert the raw values. -#}
+    if(m_inst->👉 field.concrete.getter_name 👈() != new_inst->👉 field.concrete.getter_name 👈()){
+    {% else -%}
+    if(m_inst->👉 field.private_name 👈 != new_inst->👉 field.private_name 👈){
+    {% endif -%}
+    👉update_proxy_field(t, field, lazy=context.config.lazy_proxies)👈
+    };
+    {% endfor -%}
+    m_inst = new_inst;
+    _qtgql_connect_signals();
+};
+{% endif -%}
+{%- endmacro %}
@@ -0,0 +1,20 @@
+{%- from "macros/serialize_input_variable.jinja.hpp" import  serialize_input_variable -%}
+{% macro operation_variables(operation) -%}
+struct 👉 operation.generated_variables_type 👈{
+{% for var in operation.variables -%}
+{% if var.type.is_optional -%}
+std::optional<👉 var.type.type_name() 👈> 👉 var.name 👈 = {};
+{% else -%}
+👉 var.type.type_name() 👈 👉 var.name 👈;
+{% endif -%}
+{% endfor -%}
+    QJsonObject to_json() const{
+    QJsonObject __ret;
+    {% for var in operation.variables -%}
+    👉 serialize_input_variable("__ret", var, attr_name=var.name, json_name=var.name) 👈
+    {% endfor -%}
+    return __ret;
+    }
+
+};
+{%- endmacro %}
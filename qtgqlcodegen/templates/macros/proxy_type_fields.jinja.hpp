@@ -1,7 +1,11 @@
 {% macro proxy_type_fields(t, context) -%}
 Q_OBJECT
+{% if context.config.single_qml_module -%}
+QML_ANONYMOUS
+{% else -%}
 QML_ELEMENT
 QML_UNCREATABLE("QtGql does not supports instantiation via qml")
+{% endif -%}
 Q_PROPERTY(QString  __typeName READ __typename CONSTANT)
 
 {% for f in t.fields -%}
@@ -15,7 +19,7 @@ void 👉 f.concrete.signal_name 👈();
 protected:
 std::shared_ptr<👉context.schema_ns👈::👉 t.concrete.name 👈> m_inst;
 {% for ref_field in t.references -%}
-👉ref_field.type.property_type👈 👉ref_field.private_name👈 = {};
+{% if context.config.lazy_proxies %}mutable {% endif %}👉ref_field.type.property_type👈 👉ref_field.private_name👈 = {};
 {% endfor %}
 {%- for model_field in t.models -%}
 👉 model_field.type.property_type 👈 👉model_field.private_name👈;
@@ -0,0 +1,19 @@
+{% macro type_ids(context) -%}
+{% set keys = context.type_ids -%}
+// ---------- Type ids ----------
+{# // compact ids of the object types, `__typename` is mapped to its id with a single hashed lookup. -#}
+struct TypeIds{
+{% if context.types -%}
+enum : int{
+{% for type in context.types -%}
+👉 type.name 👈 = 👉 loop.index0 👈,
+{% endfor -%}
+};
+{% endif -%}
+static constexpr 👉 keys.cpp_type 👈 keys👉 keys.cpp_initializer 👈;
+// -1 for types that are not generated.
+[[nodiscard]] static int by_name(QAnyStringView type_name){
+    return keys.index_of(type_name);
+}
+};
+{%- endmacro %}
@@ -1,8 +1,11 @@
 {%- from "macros/deserialize_concrete_field.jinja.hpp" import  deserialize_concrete_field -%}
 {%- from "macros/iterate_type_condition.jinja.hpp" import  iterate_type_condition -%}
-{% macro update_concrete_field(parent_proxy_type, proxy_field,f_concrete, private_name, operation_pointer="operation") -%}
+{% macro update_concrete_field(parent_proxy_type, proxy_field,f_concrete, private_name, operation_pointer="operation", watched=False) -%}
+{% set value -%}
+qtgql__json[👉 parent_proxy_type.json_keys.index_of(proxy_field.name) 👈]
+{%- endset %}
 {% if proxy_field.variable_uses  -%}
-👉f_concrete.arguments_type👈 👉private_name👈_args = 👉 parent_proxy_type.name 👈::👉proxy_field.variable_builder_name 👈(👉 operation_pointer 👈);
+const 👉f_concrete.arguments_type👈 &👉private_name👈_args = 👉 parent_proxy_type.name 👈::👉proxy_field.variable_builder_name 👈(👉 operation_pointer 👈);
 {% endif %}
 {%- set current -%}
 {% if proxy_field.variable_uses  -%}
@@ -29,28 +32,36 @@ if (!👉current👈)
 }
 else
 {% endif -%}
-if (!data.value("👉f_concrete.name👈").isNull()){
+if (!👉 value 👈.isNull()){
 {% if proxy_field.type.is_builtin_scalar -%}
     {% if proxy_field.type.is_void -%}
     /* deliberately empty */
     {% else -%}
-    auto new_👉f_concrete.name👈 = std::make_shared<👉f_concrete.type.type_name()👈>(data.value("👉f_concrete.name👈").👉 proxy_field.type.is_builtin_scalar.from_json_convertor 👈);
-    auto old_👉f_concrete.name👈 = 👉current👈;
-    if ({% if proxy_field.type.is_optional or parent_proxy_type.implements_node -%}!old_👉f_concrete.name👈 || {% endif -%} *old_👉f_concrete.name👈 != *new_👉f_concrete.name👈){
+    const 👉f_concrete.type.type_name()👈 new_👉f_concrete.name👈 = 👉 value 👈.👉 proxy_field.type.is_builtin_scalar.from_json_convertor 👈;
+    const auto &old_👉f_concrete.name👈 = 👉current👈;
+    {# an empty `std::optional` differs from any value. -#}
+    if (old_👉f_concrete.name👈 != new_👉f_concrete.name👈){
         👉 setter_name 👈(new_👉f_concrete.name👈 👉 setter_end 👈);
     }
     {% endif -%}
+{% elif proxy_field.type.is_custom_scalar and proxy_field.type.value_semantic %}
+if (!👉current👈 || !👉current👈->raw_equals(👉 value 👈)){
+    auto new_👉f_concrete.name👈 = 👉 proxy_field.type.type_name() 👈::from_json(👉 value 👈);
+    if (👉current👈 != new_👉f_concrete.name👈){
+        👉 setter_name 👈(new_👉f_concrete.name👈 👉 setter_end 👈);
+    }
+}
 {% elif proxy_field.type.is_custom_scalar %}
 auto new_👉proxy_field.name👈 = std::make_shared<👉 proxy_field.type.type_name() 👈>();
-new_👉proxy_field.name👈->deserialize(data.value("👉f_concrete.name👈"));
+new_👉proxy_field.name👈->deserialize(👉 value 👈);
 auto old_👉f_concrete.name👈 = 👉current👈;
-if ({% if proxy_field.type.is_optional or parent_proxy_type.implements_node -%}!👉current👈 || {% endif %}*👉current👈 != *new_👉proxy_field.name👈){
+if (!👉current👈 || *👉current👈 != *new_👉proxy_field.name👈){
 👉 setter_name 👈(new_👉f_concrete.name👈 👉 setter_end 👈);
 }
 {% elif proxy_field.type.is_queried_object_type %}
-    auto 👉f_concrete.name👈_data = data.value("👉f_concrete.name👈").toObject();
+    auto 👉f_concrete.name👈_data = 👉 value 👈.toObject();
     {% if f_concrete.implements_node %}
-    if (👉current👈 && *👉current👈->get_id() == 👉f_concrete.name👈_data.value("id").toString()){
+    if (👉current👈 && *👉current👈->get_id() == 👉f_concrete.name👈_data.value(qtgql::bases::keys::ID).toString()){
     👉proxy_field.type.updater_name👈(👉current👈, 👉f_concrete.name👈_data,  👉operation_pointer👈);
     }
     else{
@@ -61,49 +72,58 @@ if ({% if proxy_field.type.is_optional or parent_proxy_type.implements_node -%}!
     {% endif %}
 {% elif proxy_field.type.is_model %}
     {% if proxy_field.type.of_type.is_builtin_scalar %}
-    auto 👉f_concrete.name👈_data = data.value("👉f_concrete.name👈").toArray();
-    auto new_len = 👉f_concrete.name👈_data.size();
-    auto prev_len = 👉current👈->rowCount();
-    if (new_len < prev_len){
-        👉current👈->removeRows(prev_len - 1, prev_len - new_len);
+    const auto 👉f_concrete.name👈_data = 👉 value 👈.toArray();
+    std::vector<👉proxy_field.type.of_type.type_name()👈> 👉f_concrete.name👈_new_vec;
+    👉f_concrete.name👈_new_vec.reserve(👉f_concrete.name👈_data.size());
+    for (const auto& node: 👉f_concrete.name👈_data){
+        👉f_concrete.name👈_new_vec.push_back(node.👉 f_concrete.type.of_type.from_json_convertor 👈);
     }
-    for (int  i = 0; i < 👉f_concrete.name👈_data.size(); i++){
-        auto node_data = 👉f_concrete.name👈_data.at(i).👉 f_concrete.type.of_type.from_json_convertor 👈;
-        if (i >= prev_len){
-            👉current👈->append(node_data);
-        } else if (node_data != 👉current👈->get(i)){
-            👉current👈->replace(i, node_data);
-        }
+    {% if watched -%}
+    {#- the model is changed in place, not by a setter. -#}
+    if (👉current👈->assign(std::move(👉f_concrete.name👈_new_vec))){
+        inst->qtgql_watchers.notify();
     }
+    {% else -%}
+    👉current👈->assign(std::move(👉f_concrete.name👈_new_vec));
+    {% endif -%}
 
 
 {% else %}
     👉deserialize_concrete_field(parent_proxy_type, proxy_field)👈
     {% endif %}
 {% elif proxy_field.type.is_enum %}
-auto new_👉f_concrete.name👈= std::make_shared<👉proxy_field.type.namespaced_name👈>(Enums::👉proxy_field.type.map_name👈::by_name(data.value("👉proxy_field.name👈").toString()));
+auto new_👉f_concrete.name👈= std::make_shared<👉proxy_field.type.namespaced_name👈>(Enums::👉proxy_field.type.map_name👈::by_name(👉 value 👈.toString()));
 if (*👉current👈 != *new_👉f_concrete.name👈){
 👉 setter_name 👈(new_👉f_concrete.name👈 👉 setter_end 👈);
 }
 {% elif proxy_field.type.is_queried_interface or proxy_field.type.is_queried_union %}
-auto 👉f_concrete.name👈_data = data.value("👉f_concrete.name👈").toObject();
-auto 👉f_concrete.name👈_typename  = 👉f_concrete.name👈_data.value("__typename").toString();
+auto 👉f_concrete.name👈_data = 👉 value 👈.toObject();
+auto 👉f_concrete.name👈_typename  = 👉f_concrete.name👈_data.value(qtgql::bases::keys::TYPENAME).toString();
+auto 👉f_concrete.name👈_type_id = TypeIds::by_name(👉f_concrete.name👈_typename);
 {%set type_cond -%}👉f_concrete.name👈_typename{% endset -%}
 {% for choice in proxy_field.type.choices %}
 {% set do_on_meets -%}
 {% if choice.implements_node %}
 auto 👉f_concrete.name👈_casted = std::static_pointer_cast<👉choice.concrete.name👈>(👉current👈);
-if (👉current👈 && *👉f_concrete.name👈_casted->get_id() == 👉f_concrete.name👈_data.value("id").toString()){
+if (👉current👈 && *👉f_concrete.name👈_casted->get_id() == 👉f_concrete.name👈_data.value(qtgql::bases::keys::ID).toString()){
 👉choice.updater_name👈(👉f_concrete.name👈_casted, 👉f_concrete.name👈_data,  👉operation_pointer👈);
 }
 else{
 👉 setter_name 👈(👉choice.deserializer_name👈(👉proxy_field.name👈_data, 👉operation_pointer👈) 👉 setter_end 👈);
 }
+{% elif choice.implementations %}
+{#- the generic type is used for several implementations, the type might have changed. -#}
+if (👉current👈 && 👉current👈->qtgql_type_id() == 👉f_concrete.name👈_type_id){
+👉choice.updater_name👈(std::static_pointer_cast<👉choice.concrete.name👈>(👉current👈), 👉f_concrete.name👈_data,  👉operation_pointer👈);
+}
+else{
+👉 setter_name 👈(👉choice.deserializer_name👈(👉f_concrete.name👈_data, 👉operation_pointer👈) 👉 setter_end 👈);
+}
 {% else %}
 👉choice.updater_name👈(std::static_pointer_cast<👉choice.concrete.name👈>(👉current👈), 👉f_concrete.name👈_data,  👉operation_pointer👈);
 {% endif %}
 {% endset -%}
-👉iterate_type_condition(choice,type_cond, do_on_meets, loop)👈
+👉iterate_type_condition(choice, f_concrete.name ~ "_type_id", type_cond, do_on_meets, loop)👈
 {% endfor %}
 {% else %}
 throw qtgql::exceptions::NotImplementedError({"👉proxy_field.type.__class__.__name__👈 is not supporting updates ATM"});
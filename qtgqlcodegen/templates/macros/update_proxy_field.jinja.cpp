@@ -1,7 +1,7 @@
 {%- from "macros/iterate_type_condition.jinja.hpp" import  iterate_type_condition -%}
-{% macro update_proxy_field(parent_type, field, operation) -%}
+{% macro update_proxy_field(parent_type, field, lazy = False) -%}
 {% if field.cached_by_args -%}
-auto args_for_👉field.name 👈 = 👉 parent_type.name 👈::👉field.variable_builder_name 👈(m_operation);
+const auto &args_for_👉field.name 👈 = 👉 parent_type.name 👈::👉field.variable_builder_name 👈(m_operation);
 {% set new_concrete -%}
 m_inst->👉field.concrete.getter_name👈(args_for_👉field.name 👈)
 {%- endset -%}
@@ -13,80 +13,117 @@ m_inst->👉field.concrete.getter_name👈()
 
 
 auto operation = m_operation;
-{% if field.type.is_model and not field.type.of_type.is_builtin_scalar -%}
-    auto new_data = 👉new_concrete👈;
-    auto new_len = new_data.size();
+{% if field.type.is_model and field.type.is_keyed -%}
+    const auto &new_data = 👉new_concrete👈;
+    👉field.private_name👈->sync(qtgql::bases::node_keys(new_data), [&](std::size_t i) -> 👉 field.type.of_type.property_type 👈 {
+    {% if lazy -%}
+        return nullptr;
+    {% else -%}
+        const auto &concrete = new_data.at(i);
+        {% if field.type.of_type.is_queried_object_type -%}
+        return new 👉field.type.of_type.type_name()👈(operation, concrete);
+        {% else -%}
+        {% for choice in field.type.of_type.choices -%}
+        {% set do_on_meets -%}
+        return qobject_cast<👉 field.type.of_type.property_type 👈>(new 👉choice.type_name()👈(operation, std::static_pointer_cast<👉 choice.concrete.name 👈>(concrete)));
+        {% endset -%}
+        👉iterate_type_condition(choice, "concrete->qtgql_type_id()", "concrete->__typename()", do_on_meets, loop)👈
+        {% endfor %}
+        {% endif -%}
+    {% endif -%}
+    });
+{% elif field.type.is_model and not field.type.of_type.is_builtin_scalar -%}
+    const auto &new_data = 👉new_concrete👈;
+    int new_len = new_data.size();
     auto prev_len = 👉field.private_name👈->rowCount();
-    if (new_len < prev_len){
-        👉field.private_name👈->removeRows(new_len, prev_len - new_len);
-    }
+    {# the proxies of the removed rows are owned by this proxy. #}
+    👉field.private_name👈->truncate(new_len);
+    {# rows past the previous length are inserted at once. -#}
+    std::vector<👉 field.type.of_type.property_type 👈> qtgql__appended;
+    qtgql__appended.reserve(std::max(new_len - prev_len, 0));
     for (int i = 0; i < new_len; i++){
         const auto& concrete = new_data.at(i);
     {% if field.type.of_type.is_queried_object_type -%}
         if (i >= prev_len){
-            👉field.private_name👈->append(new 👉field.type.of_type.name👈(operation, concrete));
+            qtgql__appended.push_back(👉 "nullptr" if lazy else "new " ~ field.type.of_type.type_name() ~ "(operation, concrete)" 👈);
         } else {
-            auto proxy_to_update = 👉field.private_name👈->get(i);
+            auto proxy_to_update = 👉field.private_name👈->👉 "peek" if lazy else "get" 👈(i);
             if(proxy_to_update){
                 proxy_to_update->qtgql_replace_concrete(concrete);
             }
+            {% if not lazy -%}
             else{ {#// handle optionals no need to delete -#}
-                👉field.private_name👈->replace(i, new 👉field.type.of_type.name👈(operation, concrete));
+                👉field.private_name👈->replace(i, new 👉field.type.of_type.type_name()👈(operation, concrete));
             }
+            {% endif -%}
         }
 
     {% elif field.type.of_type.is_queried_union or field.type.of_type.is_queried_interface %}
-        auto 👉field.name👈_typename = concrete->__typename();
-        {%set type_cond -%}👉field.name👈_typename{% endset -%}
         {% for choice in field.type.of_type.choices %}
         {% set do_on_meets -%}
         if (i >= prev_len){
-            👉field.private_name👈->append(new 👉choice.name👈(operation, std::static_pointer_cast<👉choice.concrete.name👈>(concrete)));
+            qtgql__appended.push_back(👉 "nullptr" if lazy else "new " ~ choice.type_name() ~ "(operation, std::static_pointer_cast<" ~ choice.concrete.name ~ ">(concrete))" 👈);
         } else{
-            auto proxy_to_update = 👉field.private_name👈->get(i);
-            if (proxy_to_update && proxy_to_update->__typename() == "👉choice.concrete.name👈"){
+            auto proxy_to_update = 👉field.private_name👈->👉 "peek" if lazy else "get" 👈(i);
+            {% if choice.implementations -%}
+            if (proxy_to_update && qobject_cast<👉choice.property_type👈>(proxy_to_update)){
+            {% else -%}
+            if (proxy_to_update && proxy_to_update->qtgql_type_id() == TypeIds::👉choice.concrete.name👈){
+            {% endif -%}
                 qobject_cast<👉choice.property_type👈>(proxy_to_update)->qtgql_replace_concrete(std::static_pointer_cast<👉choice.concrete.name👈>(concrete));
             }
-            else{
-                👉field.private_name👈->replace(i, new 👉choice.name👈(operation, std::static_pointer_cast<👉choice.concrete.name👈>(concrete)));
+            else{{% if lazy %} if (proxy_to_update) {#- otherwise it wasn't created yet. -#}{% endif %}
+                👉field.private_name👈->replace(i, new 👉choice.type_name()👈(operation, std::static_pointer_cast<👉choice.concrete.name👈>(concrete)));
                 delete proxy_to_update; {# // might have been optional or the type_name changed #}
             }
 
         }
 
         {% endset %}
-        👉iterate_type_condition(choice,type_cond, do_on_meets, loop)👈
+        👉iterate_type_condition(choice, "concrete->qtgql_type_id()", "concrete->__typename()", do_on_meets, loop)👈
         {% endfor %}
     {% else %}
     throw qtgql::exceptions::NotImplementedError({""
                                                   "can't update model of 👉field.type.of_type.__class__👈"});
     {% endif %}
     }
+    👉field.private_name👈->append_range(std::move(qtgql__appended));
 {% elif field.type.is_queried_object_type -%}
 auto concrete = 👉new_concrete👈;
 if (👉field.private_name👈){
     👉field.private_name👈->qtgql_replace_concrete(concrete);
 }
 else{
-    👉field.private_name👈 = new 👉field.type.name👈(operation, concrete);
+    {% if not lazy -%}
+    👉field.private_name👈 = new 👉field.type.type_name()👈(operation, concrete);
+    {% endif -%}
     emit 👉 field.concrete.signal_name 👈();
 }
 {% elif field.type.is_queried_interface or field.type.is_queried_union -%}
 auto concrete = 👉new_concrete👈;
-auto 👉field.name👈_typename = concrete->__typename();
-{%set type_cond -%}👉field.name👈_typename{% endset -%}
+{% if lazy -%}
+{#- otherwise it is created by the getter. -#}
+if (👉field.private_name👈){
+{% endif -%}
 {% for choice in field.type.choices %}
 {% set do_on_meets -%}
-if (👉field.private_name👈 && 👉field.private_name👈->__typename() == "👉choice.concrete.name👈"){
+{% if choice.implementations -%}
+if (👉field.private_name👈 && qobject_cast<👉choice.property_type👈>(👉field.private_name👈)){
+{% else -%}
+if (👉field.private_name👈 && 👉field.private_name👈->qtgql_type_id() == TypeIds::👉choice.concrete.name👈){
+{% endif -%}
 qobject_cast<👉choice.property_type👈>(👉field.private_name👈)->qtgql_replace_concrete(std::static_pointer_cast<👉choice.concrete.name👈>(concrete));
 }
 else{
     delete 👉field.private_name👈; {# // might have been optional or the type_name changed #}
-    👉field.private_name👈 = qobject_cast<👉field.type.property_type👈>(new 👉choice.name👈(operation, std::static_pointer_cast<👉choice.concrete.name👈>(concrete)));
+    👉field.private_name👈 = qobject_cast<👉field.type.property_type👈>(new 👉choice.type_name()👈(operation, std::static_pointer_cast<👉choice.concrete.name👈>(concrete)));
 }
 {% endset -%}
-👉iterate_type_condition(choice,type_cond, do_on_meets, loop)👈
+👉iterate_type_condition(choice, "concrete->qtgql_type_id()", "concrete->__typename()", do_on_meets, loop)👈
 {% endfor %}
+{% if lazy -%}
+}
+{% endif -%}
 emit 👉 field.concrete.signal_name 👈();
 {% else -%}
 emit 👉 field.concrete.signal_name 👈();
@@ -1,9 +1,15 @@
 {%- from "macros/deserialize_concrete_field.jinja.hpp" import  deserialize_concrete_field -%}
-{%- from "macros/proxy_type_fields.jinja.hpp" import  proxy_type_fields -%}
+{%- from "macros/narrowed_type_declaration.jinja.hpp" import  narrowed_interface_declaration, narrowed_object_declaration -%}
 {%- from "macros/update_proxy_field.jinja.cpp" import  update_proxy_field -%}
-{%- from "macros/serialize_input_variable.jinja.hpp" import  serialize_input_variable -%}
+{%- from "macros/operation_variables.jinja.hpp" import  operation_variables -%}
+{%- from "macros/extern_list_models.jinja.hpp" import  extern_list_models -%}
 #pragma once
-#include "./schema.hpp"
+{% for include in context.schema_includes -%}
+#include "./👉 include 👈"
+{% endfor -%}
+{% if context.operation.uses_shared_types -%}
+#include "./fragments.hpp"
+{% endif -%}
 #include <qtgql/bases/bases.hpp>
 #include <QObject>
 #include <QtQml/qqmlregistration.h>
@@ -27,7 +33,7 @@ std::shared_ptr<👉 t.concrete.name 👈> des_👉 t.name 👈(const QJsonObjec
 };
 
 namespace updaters{
-{% for t in context.operation.narrowed_types -%}
+{% for t in context.operation.narrowed_types if context.generates_updater(t) -%}
 void update_👉 t.name 👈(👉 t.concrete.member_type_arg 👈 inst, const QJsonObject &data, const 👉 context.operation.name 👈 * operation);
 {% endfor -%}
 };
@@ -39,70 +45,14 @@ class 👉 t.name 👈;
 
 // ------------ Narrowed Interfaces ------------
 {% for t in context.operation.interfaces -%}
-class 👉context.export_macro👈  👉 t.name 👈: public 👉 context.qtgql_types.ObjectTypeABC.name 👈{
-
-👉 proxy_type_fields(t, context) 👈
-public:
-    using 👉 context.qtgql_types.ObjectTypeABC.name 👈::👉 context.qtgql_types.ObjectTypeABC.last 👈;
-{% for f in t.fields -%}
-[[nodiscard]] inline virtual const 👉 f.type.property_type 👈  👉 f.concrete.getter_name 👈() const {
-throw qtgql::exceptions::InterfaceDirectAccessError("👉t.concrete.name👈");
-}
-{% endfor %}
-};
+👉 narrowed_interface_declaration(t, context) 👈
 {% endfor %}
 // ------------ Narrowed Object types ------------
 {% for t in context.operation.narrowed_types %}
-class 👉context.export_macro👈  👉 t.name 👈: public 👉 context.qtgql_types.ObjectTypeABC.name if not t.base_interface else t.base_interface.name 👈{
-
-👉context.operation.name👈* m_operation;
-
-👉 proxy_type_fields(t, context) 👈
-public:
-// args builders
-{%for f in t.fields_with_args -%}
-static 👉 f.concrete.arguments_type 👈  👉 f.variable_builder_name 👈(const 👉context.operation.name👈* operation);
-{% endfor %}
-
-👉 t.name 👈(👉 context.operation.name 👈 * operation, const std::shared_ptr<👉 t.concrete.name 👈> &inst);
-{% if  not t.concrete.is_root -%}
-void qtgql_replace_concrete(const std::shared_ptr<👉 t.concrete.name 👈> & new_inst);
-{% endif %}
-protected:
-    void _qtgql_connect_signals();
-public:
-{% for f in t.fields -%}
-[[nodiscard]] const 👉 f.type.property_type 👈 👉 f.concrete.getter_name 👈() const;
-{% endfor -%}
-// fields with custom getters
-{% for f in t.fields_with_custom_getter -%}
-[[nodiscard]] const 👉 f.type.proxy_cpp_type 👈 & 👉 f.concrete.getter_name 👈_cpp() const;
-{% endfor -%}
-
-public:
-[[nodiscard]] const QString & __typename() const final{
-    return m_inst->__typename();
-}
-};
+👉 narrowed_object_declaration(t, context) 👈
 {% endfor %}
 
-struct 👉 context.operation.generated_variables_type 👈{
-{% for var in context.operation.variables -%}
-{% if var.type.is_optional -%}
-std::optional<👉 var.type.type_name() 👈> 👉 var.name 👈 = {};
-{% else -%}
-👉 var.type.type_name() 👈 👉 var.name 👈;
-{% endif -%}
-{% endfor -%}
-    QJsonObject to_json() const{
-    QJsonObject __ret;
-    {% for var in context.operation.variables -%}
-    👉 serialize_input_variable("__ret", var, attr_name=var.name, json_name=var.name) 👈
-    {% endfor -%}
-    return __ret;
-    }
-
-};
+👉 operation_variables(context.operation) 👈
 
 class 👉context.export_macro👈  👉 context.operation.name 👈: public qtgql::bases::OperationHandlerABC{
     Q_OBJECT
@@ -123,6 +73,11 @@ signals:
 
 public:
 👉 context.operation.generated_variables_type 👈 vars_inst;
+{% for t in context.operation.narrowed_types -%}
+{% for f in t.fields_with_args if f.variable_uses -%}
+mutable qtgql::bases::MemoizedArgs 👉 f.args_memo_name(t) 👈;
+{% endfor -%}
+{% endfor %}
 
 👉 context.operation.name 👈(): qtgql::bases::OperationHandlerABC(qtgql::bases::GraphQLMessage(
         {%- for line in context.operation.query.splitlines() %}"👉 line 👈"{% endfor -%}
@@ -136,6 +91,15 @@ QTGQL_STATIC_MAKE_SHARED(👉 context.operation.name 👈)
 
 void on_next(const QJsonObject &data_) override{
     auto root_instance = 👉 context.operation.root_type.concrete.name👈::instance();
+    {% if context.deserialize_only -%}
+    {#- the proxies don't observe updates, create new ones for every response. -#}
+    👉 context.operation.root_type.updater_name👈(root_instance, data_, this);
+    if (m_data){
+        m_data.value()->deleteLater();
+    }
+    m_data = new 👉 context.operation.root_type.name👈(this, root_instance);
+    emit dataChanged();
+    {% else -%}
     if (!m_data){
         👉 context.operation.root_type.updater_name👈(root_instance, data_, this);
         m_data = new 👉 context.operation.root_type.name👈(this, root_instance);
@@ -144,6 +108,7 @@ void on_next(const QJsonObject &data_) override{
     else{
         👉 context.operation.root_type.updater_name👈(root_instance, data_, this);
     }
+    {% endif -%}
 }
 
 inline const 👉 context.operation.root_type.name 👈 * data() const{
@@ -216,3 +181,4 @@ signals:
     QJsonArray error(const QJsonArray &);
 };
 };
+👉- extern_list_models(context) 👈
@@ -0,0 +1,60 @@
+{%- from "macros/input_object_definition.jinja.hpp" import  input_object_definition -%}
+{%- from "macros/type_ids.jinja.hpp" import  type_ids -%}
+#pragma once
+#include <QObject>
+#include <QJsonObject>
+#include <QJsonArray>
+#include <memory>
+
+#include <qtgql/bases/bases.hpp>
+{% for dep in context.dependencies -%}
+👉 dep 👈
+{% endfor %}
+
+#if defined(👉context.config.shared_lib_export_definition 👈)
+#define 👉context.export_macro👈 Q_DECL_EXPORT
+#else
+#define 👉context.export_macro👈 Q_DECL_IMPORT
+#endif
+
+namespace 👉 context.config.env_name 👈{
+{% if context.enums %}
+// ---------- Enums ----------
+
+class Enums{
+    Q_GADGET
+
+public:
+{% for enum in context.enums %}
+enum 👉enum.name👈{
+{% for member in enum.members -%}
+👉member.name👈 = 👉member.index👈,
+{% endfor %}
+};
+Q_ENUM(👉enum.name👈)
+struct 👉enum.map_name👈{
+Q_GADGET
+public:
+static constexpr 👉 enum.members_table.cpp_type 👈 members👉 enum.members_table.cpp_initializer 👈;
+    GraphQLEnum_MACRO(👉enum.name👈)
+};
+
+{% endfor %}
+};
+{% endif %}
+
+// ---------- INPUT OBJECTS ----------
+{% for type in context.input_objects -%}
+👉 input_object_definition(type) 👈
+{% endfor %}
+
+👉 type_ids(context) 👈
+
+// Forward references
+{% for type in context.interfaces -%}
+class 👉 type.name 👈;
+{% endfor %}
+{% for type in context.types -%}
+class 👉 type.name 👈;
+{% endfor %}
+}
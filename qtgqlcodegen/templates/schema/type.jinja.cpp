@@ -0,0 +1,16 @@
+{%- from "macros/concrete_type_fields.jinja.hpp" import concrete_type_fields_definition -%}
+{%- set type = context.type -%}
+#include "./👉 type.name 👈.hpp"
+
+namespace 👉 context.schema.config.env_name 👈{
+👉 concrete_type_fields_definition(type, context.fields, lazy=context.schema.config.lazy_deserialization, watched=context.schema.config.skip_unchanged_subtrees) 👈
+{% if not type.is_interface %}
+const QString & 👉 type.name 👈::__typename() const{
+static const QString ret = "👉 type.name 👈";
+return ret;
+}
+int 👉 type.name 👈::qtgql_type_id() const{
+return TypeIds::👉 type.name 👈;
+}
+{% endif %}
+}
@@ -0,0 +1,66 @@
+{%- from "macros/concrete_type_fields.jinja.hpp" import concrete_type_fields -%}
+{%- macro base_members(type, config) -%}
+{#- declared once by the type that extends `ObjectTypeABC` / `NodeInterfaceABC`. -#}
+{% if not type.interfaces_raw -%}
+public:
+{% if config.skip_unchanged_subtrees -%}
+// see `QtGqlConfig.skip_unchanged_subtrees`, notified by the setters.
+qtgql::bases::subtrees::Watchers qtgql_watchers;
+{% if type.is_root or (type.is_interface and type.is_node_interface) -%}
+qtgql::bases::subtrees::UpdateRecords qtgql_update_records;
+{% endif -%}
+{% endif -%}
+{% if config.lazy_deserialization -%}
+// see `QtGqlConfig.lazy_deserialization`, read by (const) getters.
+mutable qtgql::bases::lazy::PendingFields qtgql_pending;
+{% endif -%}
+{% endif -%}
+{%- endmacro -%}
+{%- set type = context.type -%}
+#pragma once
+#include "./👉 context.schema.common_header 👈"
+{% for base in type.interfaces_raw -%}
+#include "./👉 base.name 👈.hpp"
+{% endfor %}
+namespace 👉 context.schema.config.env_name 👈{
+{% if type.is_interface %}
+class 👉context.schema.export_macro👈  👉 type.name 👈 {% for base in type.bases %} {%if loop.first %}: {% endif %} public 👉 base.name 👈 {% if not loop.last %}, {% endif %}{% endfor %}{
+Q_OBJECT
+👉 base_members(type, context.schema.config) 👈
+👉 concrete_type_fields(type, context.fields, context) 👈
+
+{% if type.is_node_interface -%}
+static auto & ENV_CACHE() {
+        static auto cache = qtgql::bases::Environment::get_env_strict("👉 context.schema.config.env_name 👈")->get_cache();
+        return cache;
+}
+{% endif %}
+};
+{% else %}
+class 👉context.schema.export_macro👈  👉 type.name 👈 {% for base in type.bases %}{%if loop.first%}: {% endif %} public 👉 base.name 👈 {% if not loop.last %}, {% endif %}{% endfor %}{
+Q_OBJECT
+👉 base_members(type, context.schema.config) 👈
+👉 concrete_type_fields(type, context.fields, context) 👈
+public:
+{% if type.is_root %} {# root types should be singletons #}
+[[nodiscard]] static std::shared_ptr<👉 type.name 👈> instance(){
+    static std::weak_ptr<👉 type.name 👈> observer_inst;
+    if (observer_inst.expired()){
+        auto ret = std::make_shared<👉 type.name 👈>();
+        observer_inst = ret;
+        return ret;
+    }
+    return observer_inst.lock();
+}
+{% else %}
+QTGQL_STATIC_MAKE_SHARED(👉 type.name 👈)
+{% endif %}
+
+👉 type.name 👈()= default;
+
+public:
+const QString & __typename() const final;
+int qtgql_type_id() const final;
+};
+{% endif %}
+}
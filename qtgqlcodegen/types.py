@@ -8,6 +8,7 @@ import attrs
 from attr import define
 
 from qtgqlcodegen.core.cppref import CppAttribute, QtGqlBasesNs, QtGqlTypes
+from qtgqlcodegen.core.keytable import KeyTable
 
 if TYPE_CHECKING:
     from qtgqlcodegen.operation.definitions import QtGqlQueriedField
@@ -187,6 +188,16 @@ class QtGqlList(QtGqlTypeABC):
             return True
         return False
 
+    @property
+    def is_keyed(self) -> bool:
+        """Whether the rows of the proxy model are matched by node on updates
+        (`ListModelABC::sync`), otherwise they are updated by their index."""
+        if union := self.of_type.is_queried_union:
+            return all(choice.implements_node for choice in union.choices)
+        if of_type := self.of_type.is_queried_object_type or self.of_type.is_queried_interface:
+            return of_type.implements_node
+        return False
+
     @property
     def member_type(self) -> str:
         if self.of_type.is_builtin_scalar:
@@ -274,6 +285,16 @@ class BuiltinScalar(QtGqlTypeABC):
     def type_name(self) -> str:
         return self.attr.name
 
+    @property
+    def member_type(self) -> str:
+        """Stored by value, empty until the field is deserialized (or if it is
+        null)."""
+        return f"std::optional<{self.type_name()}>"
+
+    @property
+    def default_value(self) -> str:
+        return "{}"
+
     @property
     def is_void(self) -> bool:
         return self is BuiltinScalars.VOID
@@ -293,6 +314,9 @@ class CustomScalarDefinition(QtGqlTypeABC):
     deserialized_type: str
     to_qt_type: str
     include_path: str
+    # implemented as a `qtgql::customscalars::ScalarValue` (held by value),
+    # otherwise a `CustomScalarABC` (held by a shared pointer).
+    value_semantic: bool = False
 
     @property
     def is_custom_scalar(self) -> CustomScalarDefinition | None:
@@ -305,12 +329,23 @@ class CustomScalarDefinition(QtGqlTypeABC):
         return self.name
 
     @property
-    def fget_type(self) -> str:
+    def member_type(self) -> str:
+        if self.value_semantic:
+            return f"std::optional<{self.type_name()}>"
         return f"std::shared_ptr<{self.type_name()}>"
 
+    @property
+    def default_value(self) -> str:
+        return "{}" if self.value_semantic else "nullptr"
+
+    @property
+    def fget_type(self) -> str:
+        return self.member_type
+
     @property
     def getter_is_constable(self) -> bool:
-        return False
+        # `ScalarValue::to_qt` is const.
+        return self.value_semantic
 
     @property
     def property_type(self) -> str:
@@ -508,6 +543,12 @@ class QtGqlEnumDefinition(QtGqlTypeABC):
     def namespaced_name(self) -> str:
         return f"Enums::{self.name}"
 
+    @cached_property
+    def members_table(self) -> KeyTable:
+        """Names of the members ordered by their values, see `GraphQLEnum_MACRO`."""
+        assert [member.index for member in self.members] == list(range(len(self.members)))
+        return KeyTable.create(tuple(member.name for member in self.members))
+
     @property
     def is_enum(self) -> QtGqlEnumDefinition | None:
         return self
@@ -524,15 +565,31 @@ class QtGqlQueriedTypeABC(ABC):
     concrete: QtGqlTypeABC
 
 
+# namespace of the narrowed types that are shared across operations.
+SHARED_TYPES_NS = "fragments"
+# directory of the per-type headers of the schema.
+SCHEMA_TYPES_DIR = "schema"
+
+
 @define(slots=False, repr=False)
 class QtGqlQueriedObjectType(QtGqlQueriedTypeABC, QtGqlTypeABC):
     name: str
     concrete: QtGqlObjectType
     fields_dict: dict[str, QtGqlQueriedField] = attrs.Factory(dict)
     base_interface: QtGqlQueriedInterface | None = None  # I think that there could be only one
+    shared: bool = False  # generated once for all the operations.
+    # if set, this is a generic type of an interface (the concrete) that narrows
+    # all these implementations.
+    implementations: tuple[QtGqlObjectType, ...] = attrs.Factory(tuple)
+
+    @property
+    def ns_prefix(self) -> str:
+        return f"{SHARED_TYPES_NS}::" if self.shared else ""
 
     @property
     def implements_node(self) -> bool:
+        if self.implementations and (interface := self.concrete.is_interface):
+            return interface.implements_node or interface.is_node_interface
         return self.concrete.implements_node
 
     @property
@@ -547,20 +604,25 @@ class QtGqlQueriedObjectType(QtGqlQueriedTypeABC, QtGqlTypeABC):
     def fields_with_args(self) -> tuple[QtGqlQueriedField, ...]:
         return tuple([field for field in self.fields if field.cached_by_args])
 
+    @cached_property
+    def json_keys(self) -> KeyTable:
+        """Keys of the selected fields, extracted from the data in a single pass."""
+        return KeyTable.create(tuple(f.name for f in self.fields))
+
     @cached_property
     def fields_with_custom_getter(self) -> tuple[QtGqlQueriedField, ...]:
         return tuple(f for f in self.fields if f.type.is_custom_scalar)
 
     @property
     def deserializer_name(self) -> str:
-        return f"deserializers::des_{self.name}"
+        return f"{self.ns_prefix}deserializers::des_{self.name}"
 
     @property
     def updater_name(self) -> str:
-        return f"updaters::update_{self.name}"
+        return f"{self.ns_prefix}updaters::update_{self.name}"
 
     def type_name(self) -> str:
-        return self.name
+        return f"{self.ns_prefix}{self.name}"
 
     @property
     def property_type(self) -> str:
@@ -697,32 +759,36 @@ class _BuiltinScalars:
 
 BuiltinScalars = _BuiltinScalars()
 DateTimeScalarDefinition = CustomScalarDefinition(
-    name="qtgql::customscalars::DateTimeScalar",
+    name="qtgql::customscalars::DateTimeValue",
     graphql_name="DateTime",
     deserialized_type="QDateTime",
     to_qt_type="QString",
     include_path="<qtgql/customscalars/customscalars.hpp>",
+    value_semantic=True,
 )
 DateScalarDefinition = CustomScalarDefinition(
-    name="qtgql::customscalars::DateScalar",
+    name="qtgql::customscalars::DateValue",
     graphql_name="Date",
     deserialized_type="QDate",
     to_qt_type="QString",
     include_path="<qtgql/customscalars/customscalars.hpp>",
+    value_semantic=True,
 )
 TimeScalarDefinition = CustomScalarDefinition(
-    name="qtgql::customscalars::TimeScalar",
+    name="qtgql::customscalars::TimeValue",
     graphql_name="Time",
     deserialized_type="QTime",
     to_qt_type="QString",
     include_path="<qtgql/customscalars/customscalars.hpp>",
+    value_semantic=True,
 )
 DecimalScalarDefinition = CustomScalarDefinition(
-    name="qtgql::customscalars::DecimalScalar",
+    name="qtgql::customscalars::DecimalValue",
     graphql_name="Decimal",
     deserialized_type="QString",
     to_qt_type="QString",
     include_path="<qtgql/customscalars/customscalars.hpp>",
+    value_semantic=True,
 )
 CUSTOM_SCALARS: CustomScalarMap = {
     DateTimeScalarDefinition.graphql_name: DateTimeScalarDefinition,
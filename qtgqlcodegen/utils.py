@@ -15,6 +15,7 @@ class FileSpec:
     content: str
 
     def dump(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
         self.path.write_text(self.content, "UTF-8")
 
 
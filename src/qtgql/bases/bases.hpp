@@ -1,11 +1,16 @@
 #pragma once
+#include "detail/argscache.hpp"
 #include "detail/backports.hpp"
 #include "detail/constants.hpp"
 #include "detail/environment.hpp"
 #include "detail/exceptions.hpp"
+#include "detail/keytable.hpp"
+#include "detail/lazy.hpp"
 #include "detail/listmodel.hpp"
 #include "detail/macros.hpp"
 #include "detail/networklayer.hpp"
 #include "detail/objecttype.hpp"
 #include "detail/operationhandler.hpp"
+#include "detail/subtrees.hpp"
+#include "detail/tables.hpp"
 #include "detail/tools.hpp"
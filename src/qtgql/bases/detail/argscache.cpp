@@ -0,0 +1,25 @@
+#include "argscache.hpp"
+
+namespace qtgql::bases::pinned_args {
+
+namespace {
+// leaked, operations might release their arguments while exiting.
+std::unordered_map<ArgsKey, std::size_t, ArgsKey::Hasher> &pins() {
+  static auto *ret =
+      new std::unordered_map<ArgsKey, std::size_t, ArgsKey::Hasher>();
+  return *ret;
+}
+} // namespace
+
+void pin(const ArgsKey &key) { ++pins()[key]; }
+
+void release(const ArgsKey &key) {
+  auto found = pins().find(key);
+  if (found != pins().end() && --found->second == 0) {
+    pins().erase(found);
+  }
+}
+
+bool contains(const ArgsKey &key) { return pins().contains(key); }
+
+} // namespace qtgql::bases::pinned_args
@@ -0,0 +1,151 @@
+#pragma once
+#include "qtgql/qtgql_export.hpp"
+#include "tools.hpp"
+#include <QJsonObject>
+#include <list>
+#include <unordered_map>
+#include <utility>
+
+namespace qtgql::bases {
+
+// The arguments of a field, hashed once when they are built.
+class ArgsKey {
+  QJsonObject m_args;
+  std::size_t m_hash = 0;
+
+public:
+  ArgsKey() = default;
+  explicit ArgsKey(QJsonObject args)
+      : m_args{std::move(args)}, m_hash{tools::QJsonValueHasher{}(m_args)} {}
+
+  [[nodiscard]] const QJsonObject &json() const { return m_args; }
+
+  [[nodiscard]] std::size_t hash() const { return m_hash; }
+
+  bool operator==(const ArgsKey &other) const {
+    return m_hash == other.m_hash && m_args == other.m_args;
+  }
+
+  struct Hasher {
+    std::size_t operator()(const ArgsKey &key) const noexcept {
+      return key.hash();
+    }
+  };
+};
+
+// Arguments that live operations use, bounded caches never evict their values.
+namespace pinned_args {
+QTGQL_EXPORT void pin(const ArgsKey &key);
+QTGQL_EXPORT void release(const ArgsKey &key);
+[[nodiscard]] QTGQL_EXPORT bool contains(const ArgsKey &key);
+} // namespace pinned_args
+
+// Arguments built from the variables of an operation, they are rebuilt only
+// when the variables change (see `OperationHandlerABC::vars_version`).
+// The arguments are pinned as long as they are memoized.
+class MemoizedArgs {
+  std::uint64_t m_version = 0;
+  ArgsKey m_args;
+
+public:
+  MemoizedArgs() = default;
+  MemoizedArgs(const MemoizedArgs &) = delete;
+  MemoizedArgs &operator=(const MemoizedArgs &) = delete;
+
+  ~MemoizedArgs() {
+    if (m_version != 0) {
+      pinned_args::release(m_args);
+    }
+  }
+
+  template <typename T_Build>
+  const ArgsKey &get(std::uint64_t version, T_Build build) {
+    if (version != m_version) {
+      auto args = build();
+      pinned_args::pin(args);
+      if (m_version != 0) {
+        pinned_args::release(m_args);
+      }
+      m_args = std::move(args);
+      m_version = version;
+    }
+    return m_args;
+  }
+};
+
+/* Values of a field by its arguments.
+ If `T_Bound` is greater than zero only the `T_Bound` most recently used values
+ are kept (see `QtGqlConfig.args_cache_size`), values of pinned arguments are
+ never evicted, so the bound is exceeded while more operations are alive.
+ */
+template <typename T, std::size_t T_Bound = 0> class ArgsCache {
+  using T_Entries = std::list<std::pair<ArgsKey, T>>;
+  // most recently used first.
+  mutable T_Entries m_entries;
+  std::unordered_map<ArgsKey, typename T_Entries::iterator, ArgsKey::Hasher>
+      m_index;
+
+  void use(typename T_Entries::iterator entry) const {
+    if constexpr (T_Bound > 0) {
+      m_entries.splice(m_entries.begin(), m_entries, entry);
+    }
+  }
+
+  // the least recently used first.
+  void evict() {
+    auto entry = m_entries.end();
+    while (m_entries.size() > T_Bound && entry != m_entries.begin()) {
+      --entry;
+      if (!pinned_args::contains(entry->first)) {
+        m_index.erase(entry->first);
+        entry = m_entries.erase(entry);
+      }
+    }
+  }
+
+public:
+  [[nodiscard]] bool contains(const ArgsKey &key) const {
+    return m_index.contains(key);
+  }
+
+  [[nodiscard]] std::size_t size() const { return m_index.size(); }
+
+  // throws `std::out_of_range` if there is no value for these arguments.
+  [[nodiscard]] const T &at(const ArgsKey &key) const {
+    auto entry = m_index.at(key);
+    use(entry);
+    return entry->second;
+  }
+
+  [[nodiscard]] T &at(const ArgsKey &key) {
+    return const_cast<T &>(std::as_const(*this).at(key));
+  }
+
+  T &operator[](const ArgsKey &key) {
+    if (auto found = m_index.find(key); found != m_index.end()) {
+      use(found->second);
+      return found->second->second;
+    }
+    m_entries.emplace_front(key, T{});
+    m_index.emplace(key, m_entries.begin());
+    if constexpr (T_Bound > 0) {
+      evict();
+    }
+    return m_entries.front().second;
+  }
+
+  bool operator==(const ArgsCache &other) const {
+    if (size() != other.size()) {
+      return false;
+    }
+    for (const auto &[key, value] : m_entries) {
+      auto found = other.m_index.find(key);
+      if (found == other.m_index.end() || !(found->second->second == value)) {
+        return false;
+      }
+    }
+    return true;
+  }
+};
+
+} // namespace qtgql::bases
@@ -0,0 +1,89 @@
+#pragma once
+#include <QAnyStringView>
+#include <QJsonObject>
+#include <QJsonValue>
+#include <QLatin1StringView>
+#include <array>
+#include <cstdint>
+#include <type_traits>
+
+// Matches the keys of an incoming JSON object with the keys a generated type
+// selected, in a single pass over the object.
+// The hash tables are computed by codegen (see `qtgqlcodegen.core.keytable`),
+// usually without collisions, so each incoming key costs a hash and (at most)
+// one comparison and no `QString` is constructed.
+namespace qtgql::bases::keys {
+
+inline constexpr QLatin1StringView TYPENAME("__typename");
+inline constexpr QLatin1StringView ID("id");
+
+namespace detail {
+template <typename T_Char> constexpr std::uint32_t code_of(T_Char c) {
+  if constexpr (std::is_integral_v<T_Char>) {
+    // UTF-8 code unit, GraphQL names are ASCII.
+    return static_cast<unsigned char>(c);
+  } else {
+    return c.unicode();
+  }
+}
+} // namespace detail
+
+// Seeds a hash of a key (murmur3 finalizer).
+constexpr std::uint32_t mix(std::uint32_t seed, std::uint32_t hashed) {
+  std::uint32_t ret = hashed ^ seed;
+  ret ^= ret >> 16;
+  ret *= 0x85ebca6b;
+  ret ^= ret >> 13;
+  ret *= 0xc2b2ae35;
+  return ret ^ (ret >> 16);
+}
+
+// must be kept in sync with `qtgqlcodegen.core.keytable.key_hash`.
+inline std::uint32_t key_hash(std::uint32_t seed, QAnyStringView key) {
+  return key.visit([seed](auto s) {
+    std::uint32_t ret = 0x811c9dc5; // FNV-1a offset basis.
+    for (auto c : s) {
+      ret = (ret ^ detail::code_of(c)) * 0x01000193; // FNV-1a prime.
+    }
+    return mix(seed, ret);
+  });
+}
+
+template <std::size_t N, std::size_t M> struct KeyTable {
+  static_assert(M > N, "A key table must have empty buckets");
+  std::array<QLatin1StringView, N> keys;
+  std::uint32_t seed;
+  // index of the key at each bucket (-1 if empty), collisions are probed
+  // linearly.
+  std::array<int, M> buckets;
+
+  // -1 if this is not one of the keys.
+  [[nodiscard]] int index_of(QAnyStringView key) const {
+    if (key.isEmpty()) {
+      return -1;
+    }
+    for (auto bucket = key_hash(seed, key) % M;; bucket = (bucket + 1) % M) {
+      auto index = buckets[bucket];
+      if (index < 0 || QAnyStringView::equal(keys[index], key)) {
+        return index;
+      }
+    }
+  }
+};
+
+// The values of the keys of the table ordered as the keys, missing keys are
+// undefined (as `QJsonObject::value` would return).
+template <std::size_t N, std::size_t M>
+std::array<QJsonValue, N> extract(const QJsonObject &data,
+                                  const KeyTable<N, M> &table) {
+  std::array<QJsonValue, N> ret;
+  ret.fill(QJsonValue(QJsonValue::Undefined));
+  for (auto it = data.constBegin(); it != data.constEnd(); ++it) {
+    if (auto index = table.index_of(it.keyView()); index >= 0) {
+      ret[index] = it.value();
+    }
+  }
+  return ret;
+}
+
+} // namespace qtgql::bases::keys
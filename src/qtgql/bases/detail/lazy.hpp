@@ -0,0 +1,121 @@
+#pragma once
+#include <QJsonArray>
+#include <QJsonObject>
+#include <QJsonValue>
+#include <optional>
+#include <utility>
+#include <vector>
+
+// Fields that are converted from their raw JSON on first access, see
+// `QtGqlConfig.lazy_deserialization`.
+// Leaf fields (scalars, enums and custom scalars) are converted by their
+// getters, object fields (and lists of objects) by the loader they were
+// deferred with, i.e the deserializer of the narrowed type that selected them.
+namespace qtgql::bases::lazy {
+
+// Deserializes the raw value into the member at `member`.
+using Loader = void (*)(void *member, const QJsonValue &raw);
+
+// Raw values of the fields of an instance that were not read yet, by the
+// address of their member.
+class PendingFields {
+  struct Pending {
+    const void *member;
+    QJsonValue raw;
+    Loader loader;
+  };
+  std::vector<Pending> m_values;
+
+  auto find(const void *member) {
+    auto it = m_values.begin();
+    for (; it != m_values.end() && it->member != member; ++it) {
+    }
+    return it;
+  }
+
+public:
+  // keeps `value` (implicitly shared) until the field is read.
+  void defer(const void *member, const QJsonValue &value,
+             Loader loader = nullptr) {
+    auto it = find(member);
+    if (it == m_values.end()) {
+      m_values.push_back({member, value, loader});
+    } else {
+      *it = {member, value, loader};
+    }
+  }
+
+  // Replaces the raw value of the field if it wasn't read yet, nothing
+  // observes it yet so no signal is needed.
+  // Object fields are replaced only by data of the same selections (loader),
+  // otherwise they should be loaded and updated.
+  [[nodiscard]] bool replace(const void *member, const QJsonValue &value,
+                             Loader loader = nullptr) {
+    auto it = find(member);
+    if (it == m_values.end() || it->loader != loader) {
+      return false;
+    }
+    it->raw = value;
+    return true;
+  }
+
+  // The raw value of the field, if it wasn't read yet.
+  [[nodiscard]] std::optional<QJsonValue> take(const void *member) {
+    if (m_values.empty()) {
+      return std::nullopt;
+    }
+    auto it = find(member);
+    if (it == m_values.end()) {
+      return std::nullopt;
+    }
+    auto ret = std::move(it->raw);
+    m_values.erase(it);
+    return ret;
+  }
+
+  // Loads an object field if it wasn't read yet.
+  void load(const void *member) {
+    if (m_values.empty()) {
+      return;
+    }
+    auto it = find(member);
+    if (it == m_values.end() || !it->loader) {
+      return;
+    }
+    auto pending = std::move(*it);
+    m_values.erase(it);
+    pending.loader(const_cast<void *>(member), pending.raw);
+  }
+};
+
+template <typename T_Member, typename T_Converter>
+T_Member materialize(const QJsonValue &raw, T_Converter from_json) {
+  if (raw.isNull()) {
+    return {};
+  }
+  return from_json(raw);
+}
+
+// The `Loader` of an object field (`std::shared_ptr`) or a list of objects
+// (`std::vector`). Only subtrees that don't use the operation are deferred,
+// so the deserializer is called without one.
+template <typename T_Member, auto deserializer>
+void load(void *member, const QJsonValue &raw) {
+  if (raw.isNull()) {
+    return;
+  }
+  auto &value = *static_cast<T_Member *>(member);
+  if constexpr (requires { value.reserve(0); }) {
+    const auto array = raw.toArray();
+    T_Member items;
+    items.reserve(array.size());
+    for (const auto &item : array) {
+      items.push_back(deserializer(item.toObject(), nullptr));
+    }
+    value = std::move(items);
+  } else {
+    value = deserializer(raw.toObject(), nullptr);
+  }
+}
+
+} // namespace qtgql::bases::lazy
@@ -26,4 +26,11 @@ void ListModelMixin::set_current_index(int index) {
 
 ListModelMixin::ListModelMixin(QObject *parent) : QAbstractListModel(parent){};
 
+template class ListModelABC<int>;
+template class ListModelABC<float>;
+template class ListModelABC<bool>;
+template class ListModelABC<QString>;
+template class ListModelABC<QUuid>;
+template class ListModelABC<ObjectTypeABC *>;
+
 } // namespace qtgql::bases
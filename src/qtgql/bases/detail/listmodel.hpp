@@ -1,7 +1,11 @@
 #pragma once
 #include "QAbstractListModel"
+#include "QUuid"
 #include "objecttype.hpp"
 #include "qtgql/qtgql_export.hpp"
+#include <algorithm>
+#include <functional>
+#include <unordered_map>
 
 namespace qtgql::bases {
 
@@ -63,8 +67,33 @@ private:
       return node;
   };
 
+public:
+  // Creates the element at an index when it is first accessed, see
+  // `QtGqlConfig.lazy_proxies`.
+  using T_Factory = std::function<T(std::size_t)>;
+  // Identifies the element of a row across updates, see `sync`.
+  using T_Key = const void *;
+
 protected:
   T_VEC m_data;
+  // elements are `nullptr` until they are accessed if this is set.
+  T_Factory m_factory;
+  // the key of each row, empty unless the model is updated by `sync`.
+  std::vector<T_Key> m_keys;
+
+  // by value for `std::vector<bool>` (its `const_reference` is a `bool`).
+  typename T_VEC::const_reference materialize(std::size_t i) const {
+    if constexpr (std::is_pointer_v<T>) {
+      auto &ret = const_cast<T &>(m_data.at(i));
+      if (!ret && m_factory) {
+        // creating an element is not a change of the model.
+        ret = m_factory(i);
+      }
+      return ret;
+    } else {
+      return m_data.at(i);
+    }
+  }
 
   void insert_common(const int from, const int to) {
     beginInsertRows(invalid_index(), from, to);
@@ -84,18 +113,60 @@ protected:
     endRemoveRows();
   }
 
+  // elements created by `sync` are owned by the model.
+  static void dispose(const T &element) {
+    if constexpr (std::is_pointer_v<T>) {
+      if (element) {
+        element->deleteLater();
+      }
+    }
+  }
+
+  // keeps the keys in step with the rows that are about to be erased, models
+  // that aren't keyed have no keys.
+  void erase_keys(int from, int to) {
+    if (m_keys.size() == m_data.size()) {
+      m_keys.erase(std::next(m_keys.begin(), from),
+                   std::next(m_keys.begin(), to + 1));
+    } else {
+      m_keys.clear();
+    }
+  }
+
+  void erase_rows(int from, int to) {
+    remove_common(from, to);
+    erase_keys(from, to);
+    m_data.erase(std::next(m_data.begin(), from),
+                 std::next(m_data.begin(), to + 1));
+    end_remove_common();
+  }
+
+  void move_row(int from, int to) {
+    beginMoveRows(invalid_index(), from, from, invalid_index(), to);
+    std::rotate(std::next(m_data.begin(), to), std::next(m_data.begin(), from),
+                std::next(m_data.begin(), from + 1));
+    std::rotate(std::next(m_keys.begin(), to), std::next(m_keys.begin(), from),
+                std::next(m_keys.begin(), from + 1));
+    endMoveRows();
+  }
+
 public:
   explicit ListModelABC(QObject *parent, T_VEC data = {})
       : ListModelMixin(parent), m_data{std::move(data)} {
     m_count = m_data.size();
   };
 
+  ListModelABC(QObject *parent, std::size_t count, T_Factory factory)
+      : ListModelMixin(parent), m_data(count), m_factory{std::move(factory)} {
+    m_count = count;
+  };
+
   [[nodiscard]] QVariant data(const QModelIndex &index,
                               int role) const override {
     auto row = index.row();
     if (row < m_count && index.isValid()) {
       if (role == DATA_ROLE) {
-        return p_dataFn(m_data.at(row));
+        return p_dataFn(materialize(row));
       }
     }
     return {};
@@ -107,11 +178,21 @@ public:
   T_const_iterator end() const { return m_data.end(); }
   // C++ API
 public:
-  [[nodiscard]] const auto &get(int index) const { return m_data.at(index); }
+  [[nodiscard]] decltype(auto) get(int index) const {
+    return materialize(index);
+  }
 
-  [[nodiscard]] const auto &first() const { return m_data.front(); }
+  // The element at index, `nullptr` if it wasn't created yet (see
+  // `T_Factory`).
+  [[nodiscard]] decltype(auto) peek(int index) const {
+    return m_data.at(index);
+  }
+
+  [[nodiscard]] decltype(auto) first() const { return materialize(0); }
 
-  [[nodiscard]] const auto &last() const { return m_data.back(); }
+  [[nodiscard]] decltype(auto) last() const {
+    return materialize(m_data.size() - 1);
+  }
 
   int rowCount(const QModelIndex &parent = {}) const override {
     return m_count;
@@ -119,18 +200,71 @@ public:
 
   void replace(std::size_t i, const T &value) {
     if (i < m_count) {
-      insert_common(i, i);
       m_data.at(i) = value;
-      end_insert_common();
+      auto changed = index(static_cast<int>(i));
+      emit dataChanged(changed, changed, {DATA_ROLE});
     }
   }
 
   void append(const T &element) {
+    m_keys.clear(); // the rows aren't keyed anymore, see `sync`.
     insert_common(m_count, m_count);
     m_data.push_back(element);
     end_insert_common();
   }
 
+  // inserts the elements before `row` with a single notification.
+  void insert_range(int row, T_VEC elements) {
+    if (elements.empty() || row < 0 || row > m_count) {
+      return;
+    }
+    m_keys.clear(); // the rows aren't keyed anymore, see `sync`.
+    insert_common(row, row + static_cast<int>(elements.size()) - 1);
+    m_data.insert(std::next(m_data.begin(), row),
+                  std::make_move_iterator(elements.begin()),
+                  std::make_move_iterator(elements.end()));
+    end_insert_common();
+  }
+
+  void append_range(T_VEC elements) {
+    insert_range(m_count, std::move(elements));
+  }
+
+  /* Replaces the elements of the model, rows that exist in both are changed in
+   place (a single `dataChanged` for the range that differs) and the rest are
+   inserted or removed at once. Returns whether the model changed.
+   */
+  bool assign(T_VEC elements) {
+    m_keys.clear();
+    auto new_count = static_cast<int>(elements.size());
+    bool changed = new_count != m_count;
+    if (new_count < m_count) {
+      remove_common(new_count, m_count - 1);
+      m_data.erase(std::next(m_data.begin(), new_count), m_data.end());
+      end_remove_common();
+    }
+    int first_changed = -1;
+    int last_changed = -1;
+    for (int i = 0; i < m_count; i++) {
+      if (!(m_data[i] == elements[i])) {
+        m_data[i] = std::move(elements[i]);
+        if (first_changed < 0) {
+          first_changed = i;
+        }
+        last_changed = i;
+      }
+    }
+    if (first_changed > -1) {
+      changed = true;
+      emit dataChanged(index(first_changed), index(last_changed), {DATA_ROLE});
+    }
+    if (new_count > m_count) {
+      elements.erase(elements.begin(), std::next(elements.begin(), m_count));
+      append_range(std::move(elements));
+    }
+    return changed;
+  }
+
   // removes item at index. if index is -1 removes from the end of the vec.
   void pop(int index = -1) {
     if (m_data.empty()) {
@@ -140,6 +274,7 @@ public:
     int real_index = index_is_valid ? index : (m_count - 1);
 
     remove_common(real_index, real_index);
+    erase_keys(real_index, real_index);
     m_data.erase(std::next(m_data.begin(), real_index));
     end_remove_common();
   }
@@ -147,6 +282,7 @@ public:
   void clear() {
     if (!m_data.empty()) {
       remove_common(0, m_count - 1);
+      m_keys.clear();
       m_data.clear();
       end_remove_common();
     }
@@ -157,8 +293,9 @@ public:
    */
   bool removeRows(int row, int count,
                   const QModelIndex &parent = QModelIndex()) override {
-    if ((row + count) <= m_count) {
-      remove_common(row, row + count);
+    if (count > 0 && (row + count) <= m_count) {
+      remove_common(row, row + count - 1);
+      erase_keys(row, row + count - 1);
       m_data.erase(std::next(m_data.begin(), row),
                    std::next(m_data.begin(), row + count));
       end_remove_common();
@@ -166,6 +303,146 @@ public:
     }
     return false;
   }
+
+  // Removes the rows from `row` on and deletes their elements, used by the
+  // generated updaters that own the elements (see `dispose`).
+  void truncate(int row) {
+    if (row < 0 || row >= m_count) {
+      return;
+    }
+    remove_common(row, m_count - 1);
+    for (auto it = std::next(m_data.begin(), row); it != m_data.end(); ++it) {
+      dispose(*it);
+    }
+    erase_keys(row, m_count - 1);
+    m_data.erase(std::next(m_data.begin(), row), m_data.end());
+    end_remove_common();
+  }
+
+  void set_keys(std::vector<T_Key> keys) { m_keys = std::move(keys); }
+
+  /* Updates the model to the rows identified by `keys` with minimal
+   notifications: rows whose key is gone are removed, rows whose key remains are
+   moved to their new index and the rest are inserted, `create(index)` returns
+   the element of an inserted row.
+   If more than `reset_ratio` of the rows were inserted or removed the model is
+   reset instead (existing elements are still reused).
+   Elements of removed rows (or that weren't reused) are deleted later.
+   */
+  template <typename T_Create>
+  void sync(std::vector<T_Key> keys, T_Create create,
+            float reset_ratio = 0.5f) {
+    bool keys_are_known = m_keys.size() == m_data.size();
+    std::unordered_map<T_Key, std::size_t> old_rows;
+    old_rows.reserve(m_keys.size());
+    for (std::size_t i = 0; i < m_keys.size(); i++) {
+      keys_are_known &= old_rows.emplace(m_keys[i], i).second;
+    }
+    std::unordered_map<T_Key, std::size_t> new_rows;
+    new_rows.reserve(keys.size());
+    for (std::size_t i = 0; i < keys.size(); i++) {
+      keys_are_known &= new_rows.emplace(keys[i], i).second;
+    }
+    std::size_t removed = 0;
+    for (const auto &key : m_keys) {
+      removed += !new_rows.contains(key);
+    }
+    auto inserted = keys.size() - (m_keys.size() - removed);
+    auto largest = std::max(keys.size(), m_data.size());
+
+    if (!keys_are_known ||
+        (largest && (removed + inserted) > reset_ratio * largest)) {
+      beginResetModel();
+      T_VEC data;
+      data.reserve(keys.size());
+      std::vector<bool> reused(m_data.size());
+      for (std::size_t i = 0; i < keys.size(); i++) {
+        auto old_row = old_rows.find(keys[i]);
+        if (keys_are_known && old_row != old_rows.end()) {
+          data.push_back(m_data[old_row->second]);
+          reused[old_row->second] = true;
+        } else {
+          data.push_back(create(i));
+        }
+      }
+      for (std::size_t i = 0; i < m_data.size(); i++) {
+        if (!reused[i]) {
+          dispose(m_data[i]);
+        }
+      }
+      m_data = std::move(data);
+      m_keys = std::move(keys);
+      update_count();
+      endResetModel();
+      return;
+    }
+    // removals, contiguous rows are removed at once.
+    for (int row = static_cast<int>(m_keys.size()) - 1; row >= 0; row--) {
+      if (new_rows.contains(m_keys[row])) {
+        continue;
+      }
+      auto last = row;
+      while (row > 0 && !new_rows.contains(m_keys[row - 1])) {
+        row--;
+      }
+      for (auto i = row; i <= last; i++) {
+        dispose(m_data[i]);
+      }
+      erase_rows(row, last);
+    }
+    // moves and insertions, the rows before `i` are in their final order.
+    for (std::size_t i = 0; i < keys.size();) {
+      if (i < m_keys.size() && m_keys[i] == keys[i]) {
+        i++;
+      } else if (old_rows.contains(keys[i])) {
+        auto from = std::distance(
+            m_keys.begin(),
+            std::find(std::next(m_keys.begin(), i), m_keys.end(), keys[i]));
+        move_row(from, i);
+        i++;
+      } else {
+        auto last = i;
+        while (last + 1 < keys.size() && !old_rows.contains(keys[last + 1])) {
+          last++;
+        }
+        T_VEC created;
+        created.reserve(last - i + 1);
+        for (auto row = i; row <= last; row++) {
+          created.push_back(create(row));
+        }
+        insert_common(i, last);
+        m_data.insert(std::next(m_data.begin(), i),
+                      std::make_move_iterator(created.begin()),
+                      std::make_move_iterator(created.end()));
+        m_keys.insert(std::next(m_keys.begin(), i),
+                      std::next(keys.begin(), i),
+                      std::next(keys.begin(), last + 1));
+        end_insert_common();
+        i = last + 1;
+      }
+    }
+  }
 };
 
+// The keys of a list of nodes for `ListModelABC::sync`, nodes are cached by
+// their id hence the instance identifies the node.
+template <typename T_Vec>
+std::vector<const void *> node_keys(const T_Vec &nodes) {
+  std::vector<const void *> ret;
+  ret.reserve(nodes.size());
+  for (const auto &node : nodes) {
+    ret.push_back(node.get());
+  }
+  return ret;
+}
+
+// Models of scalars and unions are shared by all the generated code, the
+// generated list models are instantiated by the sources of their proxy types.
+extern template class QTGQL_EXPORT ListModelABC<int>;
+extern template class QTGQL_EXPORT ListModelABC<float>;
+extern template class QTGQL_EXPORT ListModelABC<bool>;
+extern template class QTGQL_EXPORT ListModelABC<QString>;
+extern template class QTGQL_EXPORT ListModelABC<QUuid>;
+extern template class QTGQL_EXPORT ListModelABC<ObjectTypeABC *>;
+
 } // namespace qtgql::bases
@@ -1,23 +1,23 @@
 #pragma once
 
 //  macros can't use namespaces
+// `members` is a `qtgql::bases::keys::KeyTable` of the member names ordered by
+// their values, so both lookups are O(1).
 #define GraphQLEnum_MACRO(T_EnumType)                                          \
   inline static const QString name_by_value(T_EnumType v) {                    \
-    for (const auto &member : members) {                                       \
-      if (member.second == v) {                                                \
-        return member.first;                                                   \
-      }                                                                        \
+    const auto index = static_cast<std::size_t>(v);                            \
+    if (index >= members.keys.size()) {                                        \
+      throw std::runtime_error("Couldn't find enum member");                   \
     }                                                                          \
-    throw std::runtime_error("Couldn't find enum member");                     \
+    return members.keys[index];                                                \
   };                                                                           \
                                                                                \
-  inline static T_EnumType by_name(const QString &name) {                      \
-    for (const auto &member : members) {                                       \
-      if (member.first == name) {                                              \
-        return member.second;                                                  \
-      }                                                                        \
+  inline static T_EnumType by_name(QAnyStringView name) {                      \
+    const auto index = members.index_of(name);                                 \
+    if (index < 0) {                                                           \
+      throw std::runtime_error("Couldn't find enum member");                   \
     }                                                                          \
-    throw std::runtime_error("Couldn't find enum member");                     \
+    return static_cast<T_EnumType>(index);                                     \
   }
 
 #define QTGQL_STATIC_MAKE_SHARED(type)                                         \
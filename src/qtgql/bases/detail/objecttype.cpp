@@ -6,4 +6,9 @@ const QString &ObjectTypeABC::__typename() const {
   throw exceptions::NotImplementedError(
       {"Derived classes must override this method."});
 };
+
+int ObjectTypeABC::qtgql_type_id() const {
+  throw exceptions::NotImplementedError(
+      {"Derived classes must override this method."});
+};
 } // namespace qtgql::bases
@@ -5,6 +5,7 @@
 #include "QSet"
 #include "exceptions.hpp"
 #include "qtgql/qtgql_export.hpp"
+#include <optional>
 
 namespace qtgql::bases {
 
@@ -16,6 +17,8 @@ public:
   using QObject::QObject;
 
   [[nodiscard]] virtual const QString &__typename() const;
+  // the id of `__typename` (generated per environment), cheaper to compare.
+  [[nodiscard]] virtual int qtgql_type_id() const;
 };
 
 class NodeInterfaceABC;
@@ -24,7 +27,7 @@ class QTGQL_EXPORT NodeInterfaceABC : public ObjectTypeABC {
 public:
   using ObjectTypeABC::ObjectTypeABC;
 
-  [[nodiscard]] virtual const std::shared_ptr<scalars::Id> &get_id() const = 0;
+  [[nodiscard]] virtual const std::optional<scalars::Id> &get_id() const = 0;
 };
 
 } // namespace qtgql::bases
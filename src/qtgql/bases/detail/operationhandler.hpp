@@ -47,6 +47,8 @@ class OperationHandlerABC
       public std::enable_shared_from_this<OperationHandlerABC> {
 protected:
   GraphQLMessage m_message_template;
+  // incremented whenever the variables are set.
+  std::uint64_t m_vars_version = 1;
 
 public:
   explicit OperationHandlerABC(GraphQLMessage message)
@@ -100,8 +102,13 @@ public:
     invalidate();
     m_execution_id = QUuid::createUuid();
     m_message_template.set_variables(vars);
+    m_vars_version++;
   }
 
+  // arguments built from the variables are valid as long as this is the same,
+  // see `MemoizedArgs`.
+  [[nodiscard]] std::uint64_t vars_version() const { return m_vars_version; }
+
   const bases::GraphQLMessage &message() override {
     return m_message_template;
   };
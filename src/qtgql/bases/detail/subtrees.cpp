@@ -0,0 +1,144 @@
+#include "subtrees.hpp"
+#include "keytable.hpp"
+#include <QJsonArray>
+#include <algorithm>
+
+namespace qtgql::bases::subtrees {
+
+namespace {
+Scope *&innermost() {
+  static thread_local Scope *ret = nullptr;
+  return ret;
+}
+
+// drops tokens that were destroyed and returns whether `token` is there.
+bool prune(std::vector<std::weak_ptr<Token>> &tokens, const Token *token) {
+  tokens.erase(std::remove_if(tokens.begin(), tokens.end(),
+                              [](const auto &t) { return t.expired(); }),
+               tokens.end());
+  return std::any_of(tokens.begin(), tokens.end(), [&](const auto &t) {
+    return t.lock().get() == token;
+  });
+}
+
+std::size_t hash_value(const QJsonValue &value, NodeHashes &nodes) {
+  if (value.isObject()) {
+    return hash(value.toObject(), nodes);
+  }
+  if (value.isArray()) {
+    std::size_t ret = 0;
+    for (const auto &item : value.toArray()) {
+      ret = qHashMulti(ret, hash_value(item, nodes));
+    }
+    return ret;
+  }
+  return qHash(value);
+}
+} // namespace
+
+void Token::invalidate() {
+  if (!m_valid) {
+    return;
+  }
+  m_valid = false;
+  auto containers = std::move(m_containers);
+  for (const auto &container : containers) {
+    if (auto locked = container.lock()) {
+      locked->invalidate();
+    }
+  }
+}
+
+void Token::contained_by(const std::shared_ptr<Token> &container) {
+  if (!m_valid) {
+    container->invalidate();
+  } else if (!prune(m_containers, container.get())) {
+    m_containers.push_back(container);
+  }
+}
+
+void Watchers::watch(const std::shared_ptr<Token> &token) {
+  if (!prune(m_tokens, token.get())) {
+    m_tokens.push_back(token);
+  }
+}
+
+void Watchers::notify() {
+  auto tokens = std::move(m_tokens);
+  for (const auto &token : tokens) {
+    if (auto locked = token.lock()) {
+      locked->invalidate();
+    }
+  }
+}
+
+Scope::Scope(const QJsonObject &data)
+    : m_token{std::make_shared<Token>()}, m_outer{innermost()} {
+  std::optional<std::size_t> known;
+  if (m_outer) {
+    auto id = data.value(keys::ID).toString();
+    for (auto scope = m_outer; scope && !known; scope = scope->m_outer) {
+      known = scope->m_node_hashes.value(id);
+    }
+  }
+  m_hash = known ? *known : hash(data, m_node_hashes);
+  innermost() = this;
+}
+
+Scope::~Scope() {
+  innermost() = m_outer;
+  if (m_outer) {
+    m_token->contained_by(m_outer->m_token);
+  }
+}
+
+bool Scope::unchanged(const UpdateRecords &records, const void *updater) const {
+  for (const auto &record : records.m_records) {
+    if (record.updater == updater) {
+      if (record.hash != m_hash || !record.token->valid()) {
+        return false;
+      }
+      if (m_outer) {
+        record.token->contained_by(m_outer->m_token);
+      }
+      return true;
+    }
+  }
+  return false;
+}
+
+void Scope::remember(UpdateRecords &records, const void *updater) const {
+  for (auto &record : records.m_records) {
+    if (record.updater == updater) {
+      record.hash = m_hash;
+      record.token = m_token;
+      return;
+    }
+  }
+  records.m_records.push_back({updater, m_hash, m_token});
+}
+
+void watch(Watchers &watchers) {
+  if (auto scope = innermost()) {
+    watchers.watch(scope->m_token);
+  }
+}
+
+std::size_t hash(const QJsonObject &data, NodeHashes &nodes) {
+  std::size_t ret = 0;
+  for (auto it = data.begin(); it != data.end(); ++it) {
+    ret = qHashMulti(ret, it.key(), hash_value(it.value(), nodes));
+  }
+  auto id = data.value(keys::ID);
+  if (id.isString()) {
+    auto found = nodes.find(id.toString());
+    if (found == nodes.end()) {
+      nodes.insert(id.toString(), ret);
+    } else if (*found != ret) {
+      *found = std::nullopt;
+    }
+  }
+  return ret;
+}
+
+} // namespace qtgql::bases::subtrees
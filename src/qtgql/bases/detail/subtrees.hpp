@@ -0,0 +1,95 @@
+#pragma once
+#include "qtgql/qtgql_export.hpp"
+#include <QHash>
+#include <QJsonObject>
+#include <cstddef>
+#include <memory>
+#include <optional>
+#include <vector>
+
+// Lets generated updaters skip subtrees of a response that are the same as the
+// last time they updated an instance (i.e a polled query that didn't change),
+// see `QtGqlConfig.skip_unchanged_subtrees`.
+namespace qtgql::bases::subtrees {
+
+// Whether the instances of a subtree are still as an updater left them, it is
+// invalidated when any of them changes (or a subtree it contains is
+// invalidated).
+class QTGQL_EXPORT Token {
+  bool m_valid = true;
+  // tokens of the subtrees that contain this one.
+  std::vector<std::weak_ptr<Token>> m_containers;
+
+public:
+  [[nodiscard]] bool valid() const { return m_valid; }
+
+  void invalidate();
+
+  void contained_by(const std::shared_ptr<Token> &container);
+};
+
+// The tokens of the subtrees an instance was updated in.
+class QTGQL_EXPORT Watchers {
+  std::vector<std::weak_ptr<Token>> m_tokens;
+
+public:
+  void watch(const std::shared_ptr<Token> &token);
+
+  // Should be called whenever the instance changes.
+  void notify();
+};
+
+class QTGQL_EXPORT UpdateRecords {
+  friend class Scope;
+  struct Record {
+    // identifies the updater (a narrowed type) that updated the instance.
+    const void *updater;
+    std::size_t hash;
+    std::shared_ptr<Token> token;
+  };
+  // usually a record per operation that updates the instance.
+  std::vector<Record> m_records;
+};
+
+// Hashes of the nodes in a response by their id, `std::nullopt` if a node
+// appears more than once with different data.
+using NodeHashes = QHash<QString, std::optional<std::size_t>>;
+
+/* The update of an instance by a generated updater that might be skipped.
+ While it is alive the instances that are updated (or deserialized) call
+ `watch()` and become part of its subtree.
+ The response is hashed once by the outermost scope, nested scopes (of nodes)
+ reuse the hash of their data.
+ */
+class QTGQL_EXPORT Scope {
+  std::size_t m_hash;
+  std::shared_ptr<Token> m_token;
+  NodeHashes m_node_hashes;
+  Scope *m_outer;
+
+public:
+  explicit Scope(const QJsonObject &data);
+  ~Scope();
+  Scope(const Scope &) = delete;
+  Scope &operator=(const Scope &) = delete;
+
+  // Whether `updater` already updated the instance from the same data and
+  // nothing in that subtree changed since.
+  [[nodiscard]] bool unchanged(const UpdateRecords &records,
+                               const void *updater) const;
+
+  // Should be called after `updater` updated the instance.
+  void remember(UpdateRecords &records, const void *updater) const;
+
+  friend void watch(Watchers &watchers);
+};
+
+// Adds the instance to the subtree of the innermost scope (if any), called by
+// the updaters and deserializers after they are done with the instance.
+QTGQL_EXPORT void watch(Watchers &watchers);
+
+// Structural hash of a JSON object (its keys and values, recursively), the
+// hashes of the nested nodes are added to `nodes`.
+QTGQL_EXPORT std::size_t hash(const QJsonObject &data, NodeHashes &nodes);
+
+} // namespace qtgql::bases::subtrees
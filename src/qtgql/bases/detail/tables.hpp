@@ -0,0 +1,282 @@
+#pragma once
+#include "exceptions.hpp"
+#include "keytable.hpp"
+#include <QJsonArray>
+#include <QJsonObject>
+#include <QJsonValue>
+#include <QString>
+#include <QUuid>
+#include <array>
+#include <memory>
+#include <optional>
+#include <tuple>
+
+// Generic (de)serialization of the fields of a concrete type (that have no
+// arguments), driven by constexpr field tables that are generated per narrowed
+// type. Leaf fields (scalars, enums and custom scalars) are converted in
+// place, object fields (and lists of objects) call the deserializers / updaters
+// of their narrowed types, interfaces and unions dispatch on the type id.
+// The values are extracted from the data beforehand, see `keys::extract`.
+// See `QtGqlConfig.table_driven_deserialization`.
+namespace qtgql::bases::tables {
+
+enum FieldFlags : unsigned char {
+  NONE = 0,
+  // null would reset the field.
+  NULLABLE = 1 << 0,
+  // root fields might not be set before the first update.
+  ROOT = 1 << 1,
+};
+
+// The `type_id` of the choice of the generic type of an interface, matches the
+// types that have no choice of their own.
+inline constexpr int OTHER_TYPES = -1;
+
+// builtin scalars and value semantic custom scalars (held by value) and custom
+// scalars that implement `deserialize`.
+template <typename T> auto from_json(const QJsonValue &value) {
+  if constexpr (std::is_same_v<T, int>) {
+    return std::optional<int>(value.toInt());
+  } else if constexpr (std::is_same_v<T, float>) {
+    return std::optional<float>(value.toDouble());
+  } else if constexpr (std::is_same_v<T, bool>) {
+    return std::optional<bool>(value.toBool());
+  } else if constexpr (std::is_same_v<T, QString>) {
+    return std::optional<QString>(value.toString());
+  } else if constexpr (std::is_same_v<T, QUuid>) {
+    return std::optional<QUuid>(value.toVariant().toUuid());
+  } else if constexpr (requires { T::from_json(value); }) {
+    return std::optional<T>(T::from_json(value));
+  } else {
+    auto ret = std::make_shared<T>();
+    ret->deserialize(value);
+    return ret;
+  }
+}
+
+template <typename T, typename T_EnumMap>
+std::shared_ptr<T> enum_from_json(const QJsonValue &value) {
+  return std::make_shared<T>(T_EnumMap::by_name(value.toString()));
+}
+
+// A field of `T_Concrete` that holds a `T_Member` (`std::optional` of a
+// builtin scalar or `std::shared_ptr` of an enum / custom scalar, custom
+// scalars might be held by value as well).
+template <typename T_Concrete, typename T_Member> struct LeafField {
+  // index of the value in the extracted data.
+  std::size_t json_index;
+  T_Member T_Concrete::*member;
+  void (T_Concrete::*setter)(const T_Member &);
+  T_Member (*from_json)(const QJsonValue &);
+  unsigned char flags = NONE;
+
+  template <std::size_t N, typename T_Operation>
+  void deserialize(T_Concrete *inst, const std::array<QJsonValue, N> &json,
+                   const T_Operation *) const {
+    const auto &value = json[json_index];
+    if (!value.isNull()) {
+      (inst->*setter)(from_json(value));
+    }
+  }
+
+  // sets the field only if the value has changed (to avoid redundant signals).
+  template <std::size_t N, typename T_Operation>
+  void update(T_Concrete *inst, const std::array<QJsonValue, N> &json,
+              const T_Operation *operation) const {
+    const auto &current = inst->*member;
+    if ((flags & ROOT) && !current) {
+      deserialize(inst, json, operation);
+      return;
+    }
+    const auto &value = json[json_index];
+    if (!value.isNull()) {
+      if constexpr (requires { current->raw_equals(value); }) {
+        if (current && current->raw_equals(value)) {
+          return;
+        }
+      }
+      auto new_value = from_json(value);
+      if (!current || *current != *new_value) {
+        (inst->*setter)(new_value);
+      }
+    } else if (flags & NULLABLE) {
+      (inst->*setter)({});
+    }
+  }
+};
+
+// The deserializer and updater of a narrowed type that a field of `T_Member`
+// (`std::shared_ptr` of an object type, an interface or `ObjectTypeABC`) might
+// hold.
+template <typename T_Member, typename T_Operation> struct Choice {
+  // the type id of the instances, only used by interfaces and unions.
+  int type_id;
+  T_Member (*deserializer)(const QJsonObject &, const T_Operation *);
+  // updates the instance in place, returns false if the data belongs to
+  // another node. `nullptr` if the operation only deserializes.
+  bool (*updater)(const T_Member &, const QJsonObject &, const T_Operation *);
+};
+
+// Adapts a generated deserializer to a `Choice`.
+template <typename T_Member, typename T_Operation, auto deserializer>
+T_Member deserialize_as(const QJsonObject &data, const T_Operation *operation) {
+  return deserializer(data, operation);
+}
+
+// Adapts a generated updater of `T_Instance` to a `Choice`, nodes are updated
+// only by data of the same node.
+template <typename T_Member, typename T_Instance, typename T_Operation,
+          auto updater, bool is_node>
+bool update_as(const T_Member &inst, const QJsonObject &data,
+               const T_Operation *operation) {
+  auto casted = std::static_pointer_cast<T_Instance>(inst);
+  if constexpr (is_node) {
+    if (*casted->get_id() != data.value(keys::ID).toString()) {
+      return false;
+    }
+  }
+  updater(casted, data, operation);
+  return true;
+}
+
+// The choices of a field, an object type has a single choice and no
+// `by_name`, interfaces and unions choose by the `__typename` of the data.
+template <typename T_Member, typename T_Operation, std::size_t K>
+struct Choices {
+  std::array<Choice<T_Member, T_Operation>, K> choices;
+  int (*by_name)(QAnyStringView) = nullptr;
+
+  [[nodiscard]] const Choice<T_Member, T_Operation> &
+  choose(const QJsonObject &data, int &type_id) const {
+    if (!by_name) {
+      return choices[0];
+    }
+    auto type_name = data.value(keys::TYPENAME).toString();
+    type_id = by_name(type_name);
+    for (const auto &choice : choices) {
+      if (choice.type_id == type_id || choice.type_id == OTHER_TYPES) {
+        return choice;
+      }
+    }
+    throw exceptions::InterfaceDeserializationError(type_name.toStdString());
+  }
+
+  [[nodiscard]] T_Member deserialize(const QJsonObject &data,
+                                     const T_Operation *operation) const {
+    int type_id = OTHER_TYPES;
+    return choose(data, type_id).deserializer(data, operation);
+  }
+
+  // returns the instance to set, `nullptr` if `current` was updated in place.
+  [[nodiscard]] T_Member update(const T_Member &current,
+                                const QJsonObject &data,
+                                const T_Operation *operation) const {
+    int type_id = OTHER_TYPES;
+    const auto &choice = choose(data, type_id);
+    // the type of an interface or a union might have changed.
+    if (current && (!by_name || current->qtgql_type_id() == type_id) &&
+        choice.updater(current, data, operation)) {
+      return {};
+    }
+    return choice.deserializer(data, operation);
+  }
+};
+
+// A field of `T_Concrete` that holds an object type, an interface or a union.
+template <typename T_Concrete, typename T_Member, typename T_Operation,
+          std::size_t K>
+struct ObjectField {
+  std::size_t json_index;
+  T_Member T_Concrete::*member;
+  void (T_Concrete::*setter)(const T_Member &);
+  Choices<T_Member, T_Operation, K> choices;
+  unsigned char flags = NONE;
+
+  template <std::size_t N>
+  void deserialize(T_Concrete *inst, const std::array<QJsonValue, N> &json,
+                   const T_Operation *operation) const {
+    const auto &value = json[json_index];
+    if (!value.isNull()) {
+      (inst->*setter)(choices.deserialize(value.toObject(), operation));
+    }
+  }
+
+  template <std::size_t N>
+  void update(T_Concrete *inst, const std::array<QJsonValue, N> &json,
+              const T_Operation *operation) const {
+    const auto &current = inst->*member;
+    if ((flags & ROOT) && !current) {
+      deserialize(inst, json, operation);
+      return;
+    }
+    const auto &value = json[json_index];
+    if (!value.isNull()) {
+      if (auto new_value = choices.update(current, value.toObject(), operation)) {
+        (inst->*setter)(new_value);
+      }
+    } else if (flags & NULLABLE) {
+      (inst->*setter)({});
+    }
+  }
+};
+
+// A field of `T_Concrete` that holds a list of object types, interfaces or
+// unions (`T_List` is a `std::vector`), it is deserialized again on updates.
+template <typename T_Concrete, typename T_List, typename T_Operation,
+          std::size_t K>
+struct ObjectListField {
+  std::size_t json_index;
+  void (T_Concrete::*setter)(const T_List &);
+  Choices<typename T_List::value_type, T_Operation, K> choices;
+  unsigned char flags = NONE;
+
+  template <std::size_t N>
+  void deserialize(T_Concrete *inst, const std::array<QJsonValue, N> &json,
+                   const T_Operation *operation) const {
+    const auto &value = json[json_index];
+    if (!value.isNull()) {
+      const auto array = value.toArray();
+      T_List items;
+      items.reserve(array.size());
+      for (const auto &item : array) {
+        items.push_back(choices.deserialize(item.toObject(), operation));
+      }
+      (inst->*setter)(items);
+    }
+  }
+
+  template <std::size_t N>
+  void update(T_Concrete *inst, const std::array<QJsonValue, N> &json,
+              const T_Operation *operation) const {
+    if (json[json_index].isNull() && (flags & NULLABLE)) {
+      (inst->*setter)({});
+      return;
+    }
+    deserialize(inst, json, operation);
+  }
+};
+
+template <typename T_Concrete, std::size_t N, typename T_Operation,
+          typename... T_Fields>
+void deserialize_fields(T_Concrete *inst,
+                        const std::array<QJsonValue, N> &json,
+                        const T_Operation *operation,
+                        const std::tuple<T_Fields...> &fields) {
+  std::apply(
+      [&](const auto &...field) {
+        (field.deserialize(inst, json, operation), ...);
+      },
+      fields);
+}
+
+template <typename T_Concrete, std::size_t N, typename T_Operation,
+          typename... T_Fields>
+void update_fields(T_Concrete *inst, const std::array<QJsonValue, N> &json,
+                   const T_Operation *operation,
+                   const std::tuple<T_Fields...> &fields) {
+  std::apply(
+      [&](const auto &...field) { (field.update(inst, json, operation), ...); },
+      fields);
+}
+
+} // namespace qtgql::bases::tables
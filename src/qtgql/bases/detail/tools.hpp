@@ -13,35 +13,11 @@ template <class T> inline void hash_combine(std::size_t &seed, const T &v) {
   seed ^= hasher(v) + 0x9e3779b9 + (seed << 6) + (seed >> 2);
 }
 
+// hashes the structure of a JSON value, strings are hashed as they are stored
+// (no conversions).
 struct QJsonValueHasher {
   std::size_t operator()(const QJsonValue &v) const noexcept {
-    switch (v.type()) {
-    case QJsonValue::Type::Bool:
-      return std::hash<bool>{}(v.toBool());
-    case QJsonValue::Type::String:
-      return std::hash<std::string>{}(v.toString().toStdString());
-    case QJsonValue::Type::Double:
-      return std::hash<double>{}(v.toDouble());
-    case QJsonValue::Type::Array: {
-      std::size_t ret = 0;
-      for (const QJsonValue value : v.toArray()) {
-        hash_combine(ret, QJsonValueHasher()(value));
-      }
-      return ret;
-    }
-    case QJsonValue::Type::Object: {
-      std::size_t ret = 0;
-      auto obj = v.toObject();
-      for (const auto &key : obj) {
-        auto key_as_str = key.toString();
-        hash_combine(ret, std::hash<QString>{}(key_as_str));
-        hash_combine(ret, QJsonValueHasher()(obj.value(key_as_str)));
-      }
-      return ret;
-    }
-    default:
-      return 0;
-    }
+    return qHash(v);
   }
 };
 
@@ -1,3 +1,4 @@
 #pragma once
 #include "detail/basecustomscalar.hpp"
 #include "detail/implementations.hpp"
+#include "detail/scalarvalue.hpp"
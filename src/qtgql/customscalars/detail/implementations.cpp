@@ -1,82 +1,143 @@
 #include "implementations.hpp"
 namespace qtgql {
 namespace customscalars {
-const QString &DateTimeScalar::to_qt() {
-  if (m_should_update) {
-    m_cached_to_qt = m_value.toString("hh:mm (dd.mm.yyyy)");
-    m_should_update = false;
-  }
-  return m_cached_to_qt;
+const QString &DateTimeTraits::GRAPHQL_NAME() {
+  static const QString ret = "DateTime";
+  return ret;
 }
 
-const QString &DateTimeScalar::GRAPHQL_NAME() {
-  static const QString ret = "DateTime";
+QDateTime DateTimeTraits::deserialize(const QJsonValue &raw_data) {
+  return QDateTime::fromString(raw_data.toString(), BaseTimeScalar::FORMAT);
+}
+
+QJsonValue DateTimeTraits::serialize(const QDateTime &value) {
+  return {value.toString(BaseTimeScalar::FORMAT)};
+}
+
+QString DateTimeTraits::to_qt(const QDateTime &value) {
+  return value.toString("hh:mm (dd.mm.yyyy)");
+}
+
+const QString &DateTraits::GRAPHQL_NAME() {
+  static const QString ret = "Date";
   return ret;
 }
 
+QDate DateTraits::deserialize(const QJsonValue &raw_data) {
+  return QDate::fromString(raw_data.toString(), BaseTimeScalar::FORMAT);
+}
+
+QJsonValue DateTraits::serialize(const QDate &value) {
+  return {value.toString(BaseTimeScalar::FORMAT)};
+}
+
+QString DateTraits::to_qt(const QDate &value) {
+  return value.toString("dd.MM.yyyy");
+}
+
+const QString &TimeTraits::GRAPHQL_NAME() {
+  static const QString ret = "Time";
+  return ret;
+}
+
+QTime TimeTraits::deserialize(const QJsonValue &raw_data) {
+  return QTime::fromString(raw_data.toString(), BaseTimeScalar::FORMAT);
+}
+
+QJsonValue TimeTraits::serialize(const QTime &value) {
+  return {value.toString(BaseTimeScalar::FORMAT)};
+}
+
+QString TimeTraits::to_qt(const QTime &value) { return value.toString(); }
+
+const QString &DecimalTraits::GRAPHQL_NAME() {
+  static const QString ret = "Decimal";
+  return ret;
+}
+
+QString DecimalTraits::deserialize(const QJsonValue &raw_data) {
+  return raw_data.toString();
+}
+
+QJsonValue DecimalTraits::serialize(const QString &value) { return {value}; }
+
+QString DecimalTraits::to_qt(const QString &value) { return value; }
+
 void DateTimeScalar::deserialize(const QJsonValue &raw_data) {
-  m_value = QDateTime::fromString(raw_data.toString(), DateTimeScalar::FORMAT);
+  m_value = DateTimeTraits::deserialize(raw_data);
   m_should_update = true;
 }
 
+const QString &DateTimeScalar::GRAPHQL_NAME() {
+  return DateTimeTraits::GRAPHQL_NAME();
+}
+
+const QString &DateTimeScalar::to_qt() {
+  if (m_should_update) {
+    m_cached_to_qt = DateTimeTraits::to_qt(m_value);
+    m_should_update = false;
+  }
+  return m_cached_to_qt;
+}
+
 QJsonValue DateTimeScalar::serialize() const {
-  return {m_value.toString(DateTimeScalar::FORMAT)};
+  return DateTimeTraits::serialize(m_value);
 }
 
 void DateScalar::deserialize(const QJsonValue &raw_data) {
-  m_value = QDate::fromString(raw_data.toString(), BaseTimeScalar::FORMAT);
+  m_value = DateTraits::deserialize(raw_data);
   m_should_update = true;
 }
 
 const QString &DateScalar::GRAPHQL_NAME() {
-  static const QString ret = "Date";
-  return ret;
+  return DateTraits::GRAPHQL_NAME();
 }
 
 const QString &DateScalar::to_qt() {
   if (m_should_update) {
-    m_cached_to_qt = m_value.toString("dd.MM.yyyy");
+    m_cached_to_qt = DateTraits::to_qt(m_value);
     m_should_update = false;
   }
   return m_cached_to_qt;
 }
 
 QJsonValue DateScalar::serialize() const {
-  return {m_value.toString(BaseTimeScalar::FORMAT)};
+  return DateTraits::serialize(m_value);
 }
 
 void TimeScalar::deserialize(const QJsonValue &raw_data) {
-  m_value = QTime::fromString(raw_data.toString(), BaseTimeScalar::FORMAT);
+  m_value = TimeTraits::deserialize(raw_data);
   m_should_update = true;
 }
-QJsonValue TimeScalar::serialize() const {
-  return {m_value.toString(BaseTimeScalar::FORMAT)};
-}
 
 const QString &TimeScalar::GRAPHQL_NAME() {
-  static const QString ret = "Time";
-  return ret;
+  return TimeTraits::GRAPHQL_NAME();
 }
 
 const QString &TimeScalar::to_qt() {
   if (m_should_update) {
-    m_cached_to_qt = m_value.toString();
+    m_cached_to_qt = TimeTraits::to_qt(m_value);
     m_should_update = false;
   }
   return m_cached_to_qt;
 }
 
+QJsonValue TimeScalar::serialize() const {
+  return TimeTraits::serialize(m_value);
+}
+
 void DecimalScalar::deserialize(const QJsonValue &raw_data) {
-  m_value = raw_data.toString();
+  m_value = DecimalTraits::deserialize(raw_data);
 }
 
 const QString &DecimalScalar::GRAPHQL_NAME() {
-  static const QString ret = "Decimal";
-  return ret;
+  return DecimalTraits::GRAPHQL_NAME();
 }
 
 const QString &DecimalScalar::to_qt() { return m_value; }
 
-QJsonValue DecimalScalar::serialize() const { return {m_value}; }
+QJsonValue DecimalScalar::serialize() const {
+  return DecimalTraits::serialize(m_value);
+}
 }; // namespace customscalars
 }; // namespace qtgql
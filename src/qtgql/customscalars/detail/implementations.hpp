@@ -1,6 +1,7 @@
 #pragma once
 #include "basecustomscalar.hpp"
 #include "qtgql/qtgql_export.hpp"
+#include "scalarvalue.hpp"
 #include <QDateTime>
 
 namespace qtgql {
@@ -14,6 +15,53 @@ public:
   inline static Qt::DateFormat FORMAT = Qt::DateFormat(Qt::ISODate);
 };
 
+struct QTGQL_EXPORT DateTimeTraits {
+  using value_type = QDateTime;
+  using qt_type = QString;
+
+  static const QString &GRAPHQL_NAME();
+  static QDateTime deserialize(const QJsonValue &raw_data);
+  static QJsonValue serialize(const QDateTime &value);
+  static QString to_qt(const QDateTime &value);
+};
+using DateTimeValue = ScalarValue<DateTimeTraits>;
+
+struct QTGQL_EXPORT DateTraits {
+  using value_type = QDate;
+  using qt_type = QString;
+
+  static const QString &GRAPHQL_NAME();
+  static QDate deserialize(const QJsonValue &raw_data);
+  static QJsonValue serialize(const QDate &value);
+  static QString to_qt(const QDate &value);
+};
+using DateValue = ScalarValue<DateTraits>;
+
+struct QTGQL_EXPORT TimeTraits {
+  using value_type = QTime;
+  using qt_type = QString;
+
+  static const QString &GRAPHQL_NAME();
+  static QTime deserialize(const QJsonValue &raw_data);
+  static QJsonValue serialize(const QTime &value);
+  static QString to_qt(const QTime &value);
+};
+using TimeValue = ScalarValue<TimeTraits>;
+
+struct QTGQL_EXPORT DecimalTraits {
+  using value_type = QString;
+  using qt_type = QString;
+
+  static const QString &GRAPHQL_NAME();
+  static QString deserialize(const QJsonValue &raw_data);
+  static QJsonValue serialize(const QString &value);
+  static QString to_qt(const QString &value);
+};
+using DecimalValue = ScalarValue<DecimalTraits>;
+
+// The provided scalars as `CustomScalarABC`s (held by a shared pointer), the
+// generated code uses the `ScalarValue`s above. Scalars that extend them can be
+// configured as any other user defined scalar.
 class QTGQL_EXPORT DateTimeScalar : public CustomScalarABC<QDateTime, QString>,
                                     BaseTimeScalar {
 public:
@@ -0,0 +1,94 @@
+#pragma once
+#include <QJsonValue>
+#include <QString>
+#include <concepts>
+#include <optional>
+#include <utility>
+
+namespace qtgql {
+namespace customscalars {
+/*
+ * Describes a value semantic custom scalar with static members only:
+ * value_type - would be the deserialized type.
+ * qt_type - the property type that would be exposed to QML, usually this would
+ * be a string.
+ * GRAPHQL_NAME() - the *real* GraphQL name of the scalar.
+ * deserialize(raw_data) - deserializes data fetched from graphql.
+ * serialize(value) - used for operation variables.
+ * to_qt(value) - the official value that Qt should "understand".
+ */
+template <typename T>
+concept ScalarTraits =
+    requires(const QJsonValue &raw_data,
+             const typename T::value_type &value) {
+      typename T::qt_type;
+      { T::GRAPHQL_NAME() } -> std::convertible_to<const QString &>;
+      {
+        T::deserialize(raw_data)
+        } -> std::convertible_to<typename T::value_type>;
+      { T::serialize(value) } -> std::convertible_to<QJsonValue>;
+      { T::to_qt(value) } -> std::convertible_to<typename T::qt_type>;
+    };
+
+/*
+ * A custom scalar that is held by value (no virtual calls and no heap
+ * allocations), the alternative to `CustomScalarABC`.
+ * It keeps the raw data it was deserialized from, so updates can compare the
+ * incoming data before parsing it (see `raw_equals`) and `to_qt` is computed
+ * once it is read (usually by QML).
+ */
+template <ScalarTraits T_Traits> class ScalarValue {
+public:
+  using traits = T_Traits;
+  using value_type = typename T_Traits::value_type;
+  using qt_type = typename T_Traits::qt_type;
+
+private:
+  QJsonValue m_raw;
+  value_type m_value;
+  mutable std::optional<qt_type> m_qt_value_cached;
+
+  ScalarValue(QJsonValue raw, value_type v)
+      : m_raw(std::move(raw)), m_value(std::move(v)) {}
+
+public:
+  ScalarValue() : ScalarValue(value_type()) {}
+  explicit ScalarValue(const value_type &v)
+      : m_raw(T_Traits::serialize(v)), m_value(v) {}
+
+  static ScalarValue from_json(const QJsonValue &raw_data) {
+    return {raw_data, T_Traits::deserialize(raw_data)};
+  }
+
+  static const QString &GRAPHQL_NAME() { return T_Traits::GRAPHQL_NAME(); }
+
+  const value_type &get_value() const { return m_value; };
+
+  const qt_type &to_qt() const {
+    if (!m_qt_value_cached) {
+      m_qt_value_cached = T_Traits::to_qt(m_value);
+    }
+    return *m_qt_value_cached;
+  }
+
+  [[nodiscard]] QJsonValue serialize() const { return m_raw; }
+
+  // Whether this scalar was deserialized from `raw_data`, cheaper than
+  // deserializing it and comparing the values.
+  [[nodiscard]] bool raw_equals(const QJsonValue &raw_data) const {
+    return m_raw == raw_data;
+  }
+
+  bool operator==(const ScalarValue &other) const {
+    return m_value == other.m_value;
+  };
+
+  bool operator!=(const ScalarValue &other) const {
+    return !(operator==(other));
+  }
+  bool operator<(const ScalarValue &other) const {
+    return m_value < other.m_value;
+  }
+};
+}; // namespace customscalars
+}; // namespace qtgql
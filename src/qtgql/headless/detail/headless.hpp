@@ -0,0 +1,189 @@
+#pragma once
+#include "qtgql/bases/detail/constants.hpp"
+#include "qtgql/bases/detail/exceptions.hpp"
+#include "qtgql/bases/detail/keytable.hpp"
+#include "qtgql/bases/detail/macros.hpp"
+#include "qtgql/bases/detail/networklayer.hpp"
+#include <QEventLoop>
+#include <QJsonArray>
+#include <QJsonObject>
+#include <QJsonValue>
+#include <QTimer>
+#include <QUuid>
+#include <QVariant>
+#include <chrono>
+#include <functional>
+#include <memory>
+#include <optional>
+#include <type_traits>
+#include <variant>
+#include <vector>
+
+// Runtime of the headless codegen target.
+// The generated types are plain structs (no QObjects / signals) and the
+// operations are executed directly on a network layer.
+
+namespace qtgql::headless {
+
+namespace detail {
+template <typename T> struct is_optional : std::false_type {};
+template <typename T> struct is_optional<std::optional<T>> : std::true_type {};
+
+template <typename T> struct is_vector : std::false_type {};
+template <typename T> struct is_vector<std::vector<T>> : std::true_type {};
+
+template <typename T> struct is_variant : std::false_type {};
+template <typename... Ts>
+struct is_variant<std::variant<Ts...>> : std::true_type {};
+} // namespace detail
+
+template <typename T> T deserialize(const QJsonValue &value);
+
+/*
+ * Interfaces and unions are variants of their choices, the first choice that
+ * matches the type id of `__typename` is deserialized.
+ */
+template <typename T_Variant, std::size_t I = 0>
+T_Variant deserialize_choice(const QJsonValue &value, int type_id,
+                             const QString &type_name) {
+  if constexpr (I == std::variant_size_v<T_Variant>) {
+    throw exceptions::InterfaceDeserializationError(type_name.toStdString());
+  } else {
+    using T_Choice = std::variant_alternative_t<I, T_Variant>;
+    if (T_Choice::qtgql_matches(type_id)) {
+      return T_Variant(std::in_place_index<I>, T_Choice::from_json(value));
+    }
+    return deserialize_choice<T_Variant, I + 1>(value, type_id, type_name);
+  }
+}
+
+/*
+ * Deserializes a JSON value to a headless type.
+ * Generated object types implement `from_json`,
+ * generated enums are resolved with `qtgql_enum_by_name` (found by ADL) and
+ * custom scalars with their `deserialize` method.
+ */
+template <typename T> T deserialize(const QJsonValue &value) {
+  if constexpr (detail::is_optional<T>::value) {
+    if (value.isNull() || value.isUndefined()) {
+      return std::nullopt;
+    }
+    return deserialize<typename T::value_type>(value);
+  } else if constexpr (detail::is_vector<T>::value) {
+    T ret;
+    auto array = value.toArray();
+    ret.reserve(array.size());
+    for (const auto &node : array) {
+      ret.push_back(deserialize<typename T::value_type>(node));
+    }
+    return ret;
+  } else if constexpr (detail::is_variant<T>::value) {
+    using T_First = std::variant_alternative_t<0, T>;
+    const auto type_name =
+        value.toObject().value(qtgql::bases::keys::TYPENAME).toString();
+    return deserialize_choice<T>(
+        value, T_First::qtgql_type_ids::by_name(type_name), type_name);
+  } else if constexpr (std::is_same_v<T, bool>) {
+    return value.toBool();
+  } else if constexpr (std::is_same_v<T, int>) {
+    return value.toInt();
+  } else if constexpr (std::is_same_v<T, float>) {
+    return static_cast<float>(value.toDouble());
+  } else if constexpr (std::is_same_v<T, QString>) {
+    return value.toString();
+  } else if constexpr (std::is_same_v<T, QUuid>) {
+    return value.toVariant().toUuid();
+  } else if constexpr (std::is_same_v<T, bases::scalars::Void>) {
+    return nullptr;
+  } else if constexpr (std::is_enum_v<T>) {
+    return qtgql_enum_by_name(T{}, value.toString());
+  } else if constexpr (requires { T::from_json(value); }) {
+    return T::from_json(value);
+  } else {
+    T ret;
+    ret.deserialize(value);
+    return ret;
+  }
+}
+
+template <typename T_Data> struct Result {
+  std::optional<T_Data> data = {};
+  std::optional<QJsonArray> errors = {};
+  // whether the operation wasn't completed in time, `data` and `errors` are
+  // whatever arrived before that.
+  bool timed_out = false;
+};
+
+/*
+ * Handler of an operation generated by the headless target.
+ * T_Data is the generated type of the root fields.
+ */
+template <typename T_Data>
+class OperationHandler
+    : public bases::HandlerABC,
+      public std::enable_shared_from_this<OperationHandler<T_Data>> {
+  bases::GraphQLMessage m_message;
+
+public:
+  std::function<void(T_Data)> on_data = [](T_Data) {};
+  std::function<void(const QJsonArray &)> on_errors = [](const QJsonArray &) {};
+  std::function<void()> on_done = [] {};
+
+  explicit OperationHandler(bases::GraphQLMessage message)
+      : m_message(std::move(message)) {}
+
+  const bases::GraphQLMessage &message() override { return m_message; }
+
+  void on_next(const QJsonObject &data) override {
+    on_data(T_Data::from_json(data));
+  }
+
+  void on_error(const QJsonArray &errors) override {
+    on_errors(errors);
+    on_done();
+  }
+
+  void on_completed() override { on_done(); }
+
+  void set_vars(const QJsonObject &vars) {
+    m_execution_id = QUuid::createUuid();
+    m_message.set_variables(vars);
+  }
+
+  // Executes the operation, the callbacks would be called by the network
+  // layer (i.e `Environment::get_network_layer()`).
+  void execute(bases::NetworkLayerABC *network_layer) {
+    network_layer->execute(this->shared_from_this());
+  }
+
+  /*
+   * Executes the operation and blocks (running a local event loop) until
+   * it is completed or the timeout has elapsed (see `Result::timed_out`).
+   * Overrides the callbacks of this handler.
+   */
+  Result<T_Data>
+  execute_sync(bases::NetworkLayerABC *network_layer,
+               std::chrono::milliseconds timeout = std::chrono::seconds(5)) {
+    Result<T_Data> ret;
+    QEventLoop loop;
+    bool done = false;
+    on_data = [&ret](T_Data data) { ret.data = std::move(data); };
+    on_errors = [&ret](const QJsonArray &errors) { ret.errors = errors; };
+    on_done = [&loop, &done] {
+      done = true;
+      loop.quit();
+    };
+    QTimer::singleShot(timeout, &loop, &QEventLoop::quit);
+    execute(network_layer);
+    if (!done) {
+      loop.exec();
+    }
+    ret.timed_out = !done;
+    on_data = [](T_Data) {};
+    on_errors = [](const QJsonArray &) {};
+    on_done = [] {};
+    return ret;
+  }
+};
+
+} // namespace qtgql::headless
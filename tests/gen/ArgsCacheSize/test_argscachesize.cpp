@@ -0,0 +1,65 @@
+#include "gen/MainQuery.hpp"
+#include "testframework.hpp"
+#include "testutils.hpp"
+
+namespace ArgsCacheSize {
+using namespace qtgql;
+
+auto ENV_NAME = std::string("ArgsCacheSize");
+auto SCHEMA_ADDR =
+    test_utils::get_server_address(QString::fromStdString(ENV_NAME));
+
+std::shared_ptr<mainquery::MainQuery> execute_with(int i) {
+  auto mq = mainquery::MainQuery::shared();
+  mq->set_variables({i, 1.1f, "foobar", false, QUuid::createUuid()});
+  mq->execute();
+  test_utils::wait_for_completion(mq);
+  return mq;
+}
+
+TEST_CASE("ArgsCacheSize") {
+  auto env = test_utils::get_or_create_env(
+      ENV_NAME,
+      test_utils::DebugWsClientSettings{.prod_settings = {.url = SCHEMA_ADDR}});
+
+  SECTION("test values of live operations are not evicted") {
+    auto root = Query::instance();
+    std::vector<std::shared_ptr<mainquery::MainQuery>> operations;
+    for (int i = 0; i < 5; i++) {
+      operations.push_back(execute_with(i));
+    }
+    REQUIRE(root->m_getContainer.size() == 5);
+    for (int i = 0; i < 5; i++) {
+      REQUIRE(operations[i]->data()->get_getContainer()->get_i() == i);
+    }
+  };
+  SECTION("test evicted values are fetched again") {
+    auto root = Query::instance();
+    auto evicted_args = [&]() {
+      auto mq = execute_with(100);
+      return mainquery::Query__::build_args_for_getContainer(mq.get());
+    }();
+    // the operation that used it is gone, newer values evict it.
+    auto a = execute_with(101);
+    auto b = execute_with(102);
+    auto c = execute_with(103);
+    REQUIRE(!root->m_getContainer.contains(evicted_args));
+    auto again = execute_with(100);
+    REQUIRE(root->m_getContainer.contains(evicted_args));
+    REQUIRE(again->data()->get_getContainer()->get_i() == 100);
+  };
+  SECTION("test arguments are rebuilt only when the variables change") {
+    auto mq = execute_with(1);
+    auto hash = mainquery::Query__::build_args_for_getContainer(mq.get()).hash();
+    auto version = mq->vars_version();
+    REQUIRE(mainquery::Query__::build_args_for_getContainer(mq.get()).hash() ==
+            hash);
+    mq->set_variables({2, 1.1f, "foobar", false, QUuid::createUuid()});
+    REQUIRE(mq->vars_version() != version);
+    const auto &args = mainquery::Query__::build_args_for_getContainer(mq.get());
+    REQUIRE(args.hash() != hash);
+    REQUIRE(args.json().value("i").toInt() == 2);
+  };
+}
+
+}; // namespace ArgsCacheSize
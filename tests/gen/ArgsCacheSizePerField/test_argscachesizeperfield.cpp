@@ -0,0 +1,46 @@
+#include "gen/MainQuery.hpp"
+#include "testframework.hpp"
+#include "testutils.hpp"
+
+namespace ArgsCacheSizePerField {
+using namespace qtgql;
+
+auto ENV_NAME = std::string("ArgsCacheSizePerField");
+auto SCHEMA_ADDR =
+    test_utils::get_server_address(QString::fromStdString(ENV_NAME));
+
+std::shared_ptr<mainquery::MainQuery> execute_with(int i) {
+  auto mq = mainquery::MainQuery::shared();
+  mq->set_variables({i, 1.1f, "foobar", false, QUuid::createUuid()});
+  mq->execute();
+  test_utils::wait_for_completion(mq);
+  return mq;
+}
+
+// executes an operation that is gone when this returns.
+qtgql::bases::ArgsKey released_args(int i) {
+  auto mq = execute_with(i);
+  return mainquery::Query__::build_args_for_getContainer(mq.get());
+}
+
+TEST_CASE("ArgsCacheSizePerField") {
+  auto env = test_utils::get_or_create_env(
+      ENV_NAME,
+      test_utils::DebugWsClientSettings{.prod_settings = {.url = SCHEMA_ADDR}});
+
+  SECTION("test the bound of the field overrides the default") {
+    auto root = Query::instance();
+    std::vector<qtgql::bases::ArgsKey> args;
+    for (int i = 0; i < 3; i++) {
+      args.push_back(released_args(i));
+    }
+    for (const auto &key : args) {
+      REQUIRE(root->m_getContainer.contains(key));
+    }
+    released_args(3);
+    REQUIRE(!root->m_getContainer.contains(args.front()));
+    REQUIRE(root->m_getContainer.size() == 3);
+  };
+}
+
+}; // namespace ArgsCacheSizePerField
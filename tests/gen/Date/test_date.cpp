@@ -29,7 +29,7 @@ TEST_CASE("Date") {
     auto old_user = mq->data()->get_user();
     auto modified_user_op = changeuserbirth::ChangeUserBirth::shared();
     auto new_birth =
-        customscalars::DateScalar(QDate::currentDate().addDays(12));
+        customscalars::DateValue(QDate::currentDate().addDays(12));
     auto user_id = old_user->get_id();
     modified_user_op->set_variables({{new_birth}, user_id});
     auto catcher =
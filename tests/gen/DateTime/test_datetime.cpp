@@ -28,7 +28,7 @@ TEST_CASE("DateTime") {
     auto old_user =
         mq->data()->property("user").value<mainquery::User__user *>();
     auto modified_user_op = changeuserbirth::ChangeUserBirth::shared();
-    auto new_birth = qtgql::customscalars::DateTimeScalar(
+    auto new_birth = qtgql::customscalars::DateTimeValue(
         QDateTime::currentDateTime().addDays(12));
     auto user_id = old_user->get_id();
     modified_user_op->set_variables({{new_birth}, user_id});
@@ -27,7 +27,7 @@ TEST_CASE("Decimal") {
     auto old_user = mq->data()->get_user();
     auto modified_user_op = updatebalance::UpdateBalance::shared();
     auto new_balance =
-        customscalars::DecimalScalar(old_user->get_balance() + "122121554545");
+        customscalars::DecimalValue(old_user->get_balance() + "122121554545");
     auto user_id = old_user->get_id();
     modified_user_op->set_variables({{new_balance}, user_id});
     auto catcher =
@@ -0,0 +1,61 @@
+#include "gen/MainQuery.hpp"
+#include "gen/UserWithSameIDDiffFields.hpp"
+#include "testframework.hpp"
+#include "testutils.hpp"
+#include <QSignalSpy>
+
+namespace DeserializeOnly {
+using namespace qtgql;
+
+auto ENV_NAME = std::string("DeserializeOnly");
+auto SCHEMA_ADDR =
+    test_utils::get_server_address(QString::fromStdString(ENV_NAME));
+
+TEST_CASE("DeserializeOnly") {
+  auto env = test_utils::get_or_create_env(
+      ENV_NAME,
+      test_utils::DebugWsClientSettings{.prod_settings = {.url = SCHEMA_ADDR}});
+  auto mq = mainquery::MainQuery::shared();
+  mq->execute();
+  test_utils::wait_for_completion(mq);
+
+  SECTION("test deserialize") {
+    auto modified_user_op =
+        userwithsameiddifffields::UserWithSameIDDiffFields::shared();
+    modified_user_op->execute();
+    test_utils::wait_for_completion(modified_user_op);
+    auto user = modified_user_op->data()->get_constUserWithModifiedFields();
+    REQUIRE(user->get_id() == "FakeID");
+    REQUIRE(user->get_name() == "nir");
+    REQUIRE(user->get_age() == 24);
+  };
+
+  SECTION("test updates cached nodes") {
+    auto user = mq->data()->get_constUser();
+    auto modified_user_op =
+        userwithsameiddifffields::UserWithSameIDDiffFields::shared();
+    auto prev_male = user->get_male();
+    test_utils::SignalCatcher catcher({.source_obj = user, .only = "male"});
+    modified_user_op->execute();
+    // the node is shared with the main query which observes updates.
+    REQUIRE(catcher.wait());
+    test_utils::wait_for_completion(modified_user_op);
+    REQUIRE(user->get_male() != prev_male);
+  }
+
+  SECTION("test new proxy for every response") {
+    auto modified_user_op =
+        userwithsameiddifffields::UserWithSameIDDiffFields::shared();
+    modified_user_op->execute();
+    test_utils::wait_for_completion(modified_user_op);
+    QSignalSpy spy(modified_user_op.get(),
+                   &userwithsameiddifffields::UserWithSameIDDiffFields::
+                       dataChanged);
+    modified_user_op->execute(true);
+    test_utils::wait_for_completion(modified_user_op);
+    REQUIRE(spy.count() == 1);
+    REQUIRE(modified_user_op->data()->get_constUserWithModifiedFields());
+  }
+}
+
+}; // namespace DeserializeOnly
@@ -30,6 +30,17 @@ TEST_CASE("Fragment") {
             QUuid::fromString("06335e84-2872-4914-8c5d-3ed07d2a2f16"));
     REQUIRE(d->get_voidField() == qtgql::bases::DEFAULTS::VOID);
   };
+  SECTION("test operations share the fragment types") {
+    STATIC_REQUIRE(
+        std::is_same_v<decltype(mq->data()->get_constUser()),
+                       const fragments::User__UserSelectionsFrag *>);
+    STATIC_REQUIRE(std::is_same_v<
+                   decltype(userwithsameidanddifferentfieldsquery::
+                                UserWithSameIDAndDifferentFieldsQuery::shared()
+                                    ->data()
+                                    ->get_constUserWithModifiedFields()),
+                   const fragments::User__UserSelectionsFrag *>);
+  };
   SECTION("test update") {
     auto data = mq->data();
     auto user = data->get_constUser();
@@ -23,7 +23,7 @@ TEST_CASE("FragmentsOnInterface") {
   SECTION("test deserialize") {
     auto animal = animal_query->data()->get_animal();
     REQUIRE(animal->get_kind() == Enums::AnimalKind::DOG);
-    auto dog = qobject_cast<const animalquery::Dog__animal *>(animal);
+    auto dog = qobject_cast<const fragments::Dog__AnimalFragment *>(animal);
     REQUIRE(!dog->get_furColor().isEmpty());
   };
   SECTION("test updates new type") {
@@ -34,7 +34,7 @@ TEST_CASE("FragmentsOnInterface") {
     REQUIRE(catcher.wait());
     test_utils::wait_for_completion(animal_query);
     REQUIRE(animal_query->data()->get_animal()->get_kind() == Enums::PERSON);
-    auto person = qobject_cast<const animalquery::Person__animal *>(
+    auto person = qobject_cast<const fragments::Person__AnimalFragment *>(
         animal_query->data()->get_animal());
     REQUIRE(!person->get_language().isEmpty());
   }
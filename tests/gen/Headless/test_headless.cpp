@@ -0,0 +1,71 @@
+#include "gen/headless/MainQuery.hpp"
+#include "testframework.hpp"
+#include "testutils.hpp"
+
+namespace Headless {
+using namespace qtgql;
+
+// never completes an operation.
+struct SilentNetworkLayer : public bases::NetworkLayerABC {
+  void execute(const std::shared_ptr<bases::HandlerABC> &) override {}
+};
+
+auto ENV_NAME = std::string("Headless");
+auto SCHEMA_ADDR =
+    test_utils::get_server_address(QString::fromStdString(ENV_NAME));
+
+TEST_CASE("Headless") {
+  auto env = test_utils::get_or_create_env(
+      ENV_NAME,
+      test_utils::DebugWsClientSettings{.prod_settings = {.url = SCHEMA_ADDR}});
+  auto mq = headless::mainquery::MainQuery::shared();
+
+  SECTION("test deserialize") {
+    mq->set_variables({headless::Enums::UnionChoice::PERSON});
+    auto result = mq->execute_sync(env->get_network_layer());
+    REQUIRE(!result.timed_out);
+    REQUIRE(!result.errors.has_value());
+    REQUIRE(result.data.has_value());
+    auto &person = std::get<headless::mainquery::Person__whoAmI>(
+        result.data->whoAmI);
+    REQUIRE(person.__typename == "Person");
+    REQUIRE(!person.name.isEmpty());
+  };
+
+  SECTION("test union choice") {
+    mq->set_variables({headless::Enums::UnionChoice::FROG});
+    auto result = mq->execute_sync(env->get_network_layer());
+    REQUIRE(result.data.has_value());
+    auto &frog =
+        std::get<headless::mainquery::Frog__whoAmI>(result.data->whoAmI);
+    REQUIRE(frog.__typename == "Frog");
+    REQUIRE(!frog.color.isEmpty());
+  };
+
+  SECTION("test timeout") {
+    mq->set_variables({headless::Enums::UnionChoice::PERSON});
+    SilentNetworkLayer network_layer;
+    auto result =
+        mq->execute_sync(&network_layer, std::chrono::milliseconds(50));
+    REQUIRE(result.timed_out);
+    REQUIRE(!result.data.has_value());
+    REQUIRE(!result.errors.has_value());
+  };
+
+  SECTION("test async callbacks") {
+    mq->set_variables({headless::Enums::UnionChoice::PERSON});
+    bool completed = false;
+    std::optional<headless::mainquery::Query__> data;
+    mq->on_data = [&data](headless::mainquery::Query__ d) {
+      data = std::move(d);
+    };
+    mq->on_done = [&completed] { completed = true; };
+    mq->execute(env->get_network_layer());
+    REQUIRE(QTest::qWaitFor([&]() -> bool { return completed; }, 1500));
+    REQUIRE(data.has_value());
+    REQUIRE(std::holds_alternative<headless::mainquery::Person__whoAmI>(
+        data->whoAmI));
+  };
+}
+
+}; // namespace Headless
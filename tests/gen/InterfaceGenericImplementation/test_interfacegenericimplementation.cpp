@@ -0,0 +1,59 @@
+#include "gen/AnimalQuery.hpp"
+#include "gen/ChangeAgeMutation.hpp"
+#include "testframework.hpp"
+#include "testutils.hpp"
+#include <QSignalSpy>
+
+namespace InterfaceGenericImplementation {
+using namespace qtgql;
+
+auto ENV_NAME = std::string("InterfaceGenericImplementation");
+auto SCHEMA_ADDR =
+    test_utils::get_server_address(QString::fromStdString(ENV_NAME));
+
+TEST_CASE("InterfaceGenericImplementation") {
+  auto env = test_utils::get_or_create_env(
+      ENV_NAME,
+      test_utils::DebugWsClientSettings{.prod_settings = {.url = SCHEMA_ADDR}});
+  auto animal_query = animalquery::AnimalQuery::shared();
+  animal_query->set_variables({Enums::AnimalKind::DOG});
+  animal_query->execute();
+  test_utils::wait_for_completion(animal_query);
+  SECTION("test deserialize") {
+    auto animal = animal_query->data()->get_animal();
+    REQUIRE(animal->get_kind() == Enums::AnimalKind::DOG);
+    REQUIRE(animal->property("__typeName").toString() == "Dog");
+    REQUIRE(qobject_cast<const animalquery::AnimalInterface__animal__generic *>(
+        animal));
+  };
+  SECTION("test updates new type") {
+    auto root = animal_query->data();
+    auto prev_animal = root->get_animal();
+    animal_query->set_variables({Enums::AnimalKind::PERSON});
+    test_utils::SignalCatcher catcher({.source_obj = root, .only = "animal"});
+    animal_query->execute();
+    REQUIRE(catcher.wait());
+    test_utils::wait_for_completion(animal_query);
+    auto animal = animal_query->data()->get_animal();
+    REQUIRE(animal->get_kind() == Enums::AnimalKind::PERSON);
+    REQUIRE(animal->property("__typeName").toString() == "Person");
+    // the same proxy is used for both implementations.
+    REQUIRE(animal == prev_animal);
+  }
+
+  SECTION("test specific and generic choices") {
+    auto change_age_mut = changeagemutation::ChangeAgeMutation::shared();
+    auto animal_id = animal_query->data()->get_animal()->get_id();
+    int new_age = 2223432;
+    change_age_mut->set_variables({animal_id, new_age});
+    change_age_mut->execute();
+    test_utils::wait_for_completion(change_age_mut);
+    auto changed = change_age_mut->data()->get_changeAge();
+    REQUIRE(changed->get_age() == new_age);
+    REQUIRE(qobject_cast<
+            const changeagemutation::AnimalInterface__changeAge__generic *>(
+        changed));
+  }
+}
+
+}; // namespace InterfaceGenericImplementation
@@ -0,0 +1,59 @@
+#include "gen/MainQuery.hpp"
+#include "gen/UserWithSameIDDiffFields.hpp"
+#include "testframework.hpp"
+#include "testutils.hpp"
+
+namespace LazyDeserialization {
+using namespace qtgql;
+
+TEST_CASE("LazyDeserialization") {
+  auto ENV_NAME = std::string("LazyDeserialization");
+
+  auto SCHEMA_ADDR =
+      test_utils::get_server_address(QString::fromStdString(ENV_NAME));
+  auto env = test_utils::get_or_create_env(
+      ENV_NAME,
+      test_utils::DebugWsClientSettings{.prod_settings = {.url = SCHEMA_ADDR}});
+  auto mq = std::make_shared<mainquery::MainQuery>();
+  mq->execute();
+  test_utils::wait_for_completion(mq);
+
+  SECTION("test deserialize") {
+    auto d = mq->data()->get_constUser();
+    REQUIRE(d->get_age() == 24);
+    REQUIRE(d->get_agePoint() == 24.0f);
+    REQUIRE(d->get_id() == "FakeID");
+    REQUIRE(d->get_male() == true);
+    REQUIRE(d->get_name() == "nir");
+    REQUIRE(d->get_uuid() ==
+            QUuid::fromString("06335e84-2872-4914-8c5d-3ed07d2a2f16"));
+    REQUIRE(d->get_voidField() == qtgql::bases::DEFAULTS::VOID);
+  };
+  SECTION("test update of fields that were read") {
+    auto user = mq->data()->get_constUser();
+    auto previous_name = user->get_name();
+    auto modified_user_op =
+        userwithsameiddifffields::UserWithSameIDDiffFields::shared();
+    auto catcher =
+        test_utils::SignalCatcher({.source_obj = user, .only = "name"});
+    modified_user_op->execute();
+    REQUIRE(catcher.wait());
+    test_utils::wait_for_completion(modified_user_op);
+    REQUIRE(user->get_name() != previous_name);
+  };
+  SECTION("test update of fields that were not read") {
+    auto concrete =
+        User::get_node(mq->data()->get_constUser()->get_id()).value();
+    QJsonObject data{{"id", concrete->get_id().value()},
+                     {"name", "not read"},
+                     {"age", 24},
+                     {"agePoint", 24.0},
+                     {"male", true},
+                     {"uuid", "06335e84-2872-4914-8c5d-3ed07d2a2f16"},
+                     {"voidField", QJsonValue()}};
+    mainquery::updaters::update_User__constUser(concrete, data, mq.get());
+    REQUIRE(mq->data()->get_constUser()->get_name() == "not read");
+  };
+};
+
+}; // namespace LazyDeserialization
@@ -0,0 +1,61 @@
+#include "gen/InsertUser.hpp"
+#include "gen/MainQuery.hpp"
+#include "gen/RemoveUser.hpp"
+#include "testframework.hpp"
+#include "testutils.hpp"
+#include <QPointer>
+
+namespace LazyListOfNonNode {
+using namespace qtgql;
+
+auto ENV_NAME = std::string("LazyListOfNonNode");
+auto SCHEMA_ADDR =
+    test_utils::get_server_address(QString::fromStdString(ENV_NAME));
+
+TEST_CASE("LazyListOfNonNode") {
+  auto env = test_utils::get_or_create_env(
+      ENV_NAME,
+      test_utils::DebugWsClientSettings{.prod_settings = {.url = SCHEMA_ADDR}});
+  auto mq = mainquery::MainQuery::shared();
+  mq->execute();
+  test_utils::wait_for_completion(mq);
+  SECTION("test proxies are created on first access") {
+    auto model = mq->data()->get_users();
+    REQUIRE(model->peek(1) == nullptr);
+    REQUIRE(!model->get(1)->get_name().isEmpty());
+    REQUIRE(model->peek(1) == model->get(1));
+  }
+  SECTION("test update - inserted rows are created on first access") {
+    auto model = mq->data()->get_users();
+    auto prev_len = model->rowCount();
+    auto insert_user = insertuser::InsertUser::shared();
+    QString user_name("fobar");
+    insert_user->set_variables({prev_len, user_name});
+    insert_user->execute();
+    test_utils::wait_for_completion(insert_user);
+    mq->execute(true);
+    test_utils::wait_for_completion(mq);
+    REQUIRE(model->rowCount() == prev_len + 1);
+    REQUIRE(model->peek(prev_len) == nullptr);
+    REQUIRE(model->last()->get_name().toStdString() ==
+            user_name.toStdString());
+  }
+  SECTION("test update - removed rows delete their proxies") {
+    auto model = mq->data()->get_users();
+    auto prev_len = model->rowCount();
+    QPointer<QObject> removed_user = model->last();
+    QPointer<QObject> kept_user = model->first();
+    auto remove_user = removeuser::RemoveUser::shared();
+    remove_user->set_variables({prev_len - 1});
+    remove_user->execute();
+    test_utils::wait_for_completion(remove_user);
+    mq->execute(true);
+    test_utils::wait_for_completion(mq);
+    QCoreApplication::sendPostedEvents(nullptr, QEvent::DeferredDelete);
+    REQUIRE(model->rowCount() == prev_len - 1);
+    REQUIRE(removed_user.isNull());
+    REQUIRE(!kept_user.isNull());
+  }
+}
+
+}; // namespace LazyListOfNonNode
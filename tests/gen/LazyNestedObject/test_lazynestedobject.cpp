@@ -0,0 +1,76 @@
+#include "gen/ChangeStreet.hpp"
+#include "gen/MainQuery.hpp"
+#include "testframework.hpp"
+#include "testutils.hpp"
+
+namespace LazyNestedObject {
+using namespace qtgql;
+
+auto ENV_NAME = std::string("LazyNestedObject");
+auto SCHEMA_ADDR =
+    test_utils::get_server_address(QString::fromStdString(ENV_NAME));
+
+// every key is another user on the server, so that each section starts with a
+// user whose children were not read yet (nodes outlive the sections).
+std::shared_ptr<mainquery::MainQuery> execute_with(const QString &key) {
+  auto mq = std::make_shared<mainquery::MainQuery>();
+  mq->set_variables({key});
+  mq->execute();
+  test_utils::wait_for_completion(mq);
+  return mq;
+}
+
+// reading the user through the proxies would load the lists it has models for.
+std::shared_ptr<User> concrete_user(const mainquery::MainQuery *mq) {
+  return Query::instance()->m_user.at(
+      mainquery::Query__::build_args_for_user(mq));
+}
+
+TEST_CASE("LazyNestedObject") {
+  auto env = test_utils::get_or_create_env(
+      ENV_NAME,
+      test_utils::DebugWsClientSettings{.prod_settings = {.url = SCHEMA_ADDR}});
+
+  SECTION("test child objects are deserialized on first access") {
+    auto mq = execute_with("first access");
+    auto user = concrete_user(mq.get());
+    REQUIRE(user->m_address == nullptr);
+    auto street = mq->data()->get_user()->get_address()->get_street();
+    REQUIRE(user->m_address != nullptr);
+    REQUIRE(user->m_address->get_street() == street);
+    REQUIRE(!street.isEmpty());
+  }
+  SECTION("test lists of child objects are deserialized on first access") {
+    auto mq = execute_with("first access of list");
+    auto user = concrete_user(mq.get());
+    REQUIRE(user->m_pets.empty());
+    REQUIRE(user->get_pets().size() == 3);
+    REQUIRE(!user->m_pets.front()->get_name().value().isEmpty());
+  }
+  SECTION("test update of the same selections replaces the raw value") {
+    auto mq = execute_with("same selections");
+    auto user = concrete_user(mq.get());
+    mq->execute(true);
+    test_utils::wait_for_completion(mq);
+    REQUIRE(user->m_address == nullptr);
+    REQUIRE(user->m_pets.empty());
+    REQUIRE(!user->get_address()->get_street().value().isEmpty());
+  }
+  SECTION("test update of other selections loads the child") {
+    auto mq = execute_with("other selections");
+    auto user = concrete_user(mq.get());
+    REQUIRE(user->m_address == nullptr);
+    auto change_street = changestreet::ChangeStreet::shared();
+    QString new_street("Abbey Road");
+    change_street->set_variables({*user->get_id(), new_street});
+    change_street->execute();
+    test_utils::wait_for_completion(change_street);
+    REQUIRE(user->m_address != nullptr);
+    REQUIRE(user->m_address->get_street() == new_street);
+    // selected only by the query.
+    REQUIRE(!user->m_address->get_city().value().isEmpty());
+    REQUIRE(mq->data()->get_user()->get_address()->get_street() == new_street);
+  }
+}
+
+}; // namespace LazyNestedObject
@@ -0,0 +1,48 @@
+#include "testframework.hpp"
+
+#include "gen/AddFriend.hpp"
+#include "gen/MainQuery.hpp"
+#include "testutils.hpp"
+
+namespace LazyProxies {
+using namespace qtgql;
+auto ENV_NAME = std::string("LazyProxies");
+auto SCHEMA_ADDR =
+    test_utils::get_server_address(QString::fromStdString(ENV_NAME));
+
+TEST_CASE("LazyProxies") {
+  test_utils::get_or_create_env(
+      ENV_NAME,
+      test_utils::DebugWsClientSettings{.prod_settings = {.url = SCHEMA_ADDR}});
+  auto mq = mainquery::MainQuery::shared();
+  mq->execute();
+  test_utils::wait_for_completion(mq);
+  SECTION("test deserialize") {
+    auto user = mq->data()->get_user();
+    REQUIRE(user == mq->data()->get_user());
+    auto friends = user->get_friends();
+    REQUIRE(friends->rowCount() == 5);
+    REQUIRE(friends->peek(1) == nullptr);
+    auto p = friends->first();
+    REQUIRE(p->get_name() != bases::DEFAULTS::STRING);
+    REQUIRE(friends->peek(0) == p);
+    REQUIRE(friends->peek(1) == nullptr);
+    REQUIRE(friends->get(1)->get_name() != bases::DEFAULTS::STRING);
+  }
+  SECTION("test update") {
+    auto add_friend_mut = addfriend::AddFriend::shared();
+    QString new_name("Momo");
+    auto mq_model = mq->data()->get_user()->get_friends();
+    auto before_count = mq_model->rowCount();
+    add_friend_mut->set_variables({mq->data()->get_user()->get_id(), new_name});
+    add_friend_mut->execute();
+    test_utils::wait_for_completion(add_friend_mut);
+    REQUIRE(before_count < mq_model->rowCount());
+    REQUIRE(mq_model->peek(mq_model->rowCount() - 1) == nullptr);
+    REQUIRE(mq_model->last()->get_name() == new_name);
+    REQUIRE(mq_model->rowCount() ==
+            add_friend_mut->data()->get_addFriend()->get_friends()->rowCount());
+  }
+}
+
+} // namespace LazyProxies
@@ -1,8 +1,10 @@
 #include "gen/ChangeUserName.hpp"
 #include "gen/InsertUser.hpp"
 #include "gen/MainQuery.hpp"
+#include "gen/RemoveUser.hpp"
 #include "testframework.hpp"
 #include "testutils.hpp"
+#include <QPointer>
 #include <QSignalSpy>
 
 namespace ListOfNonNodeType {
@@ -51,6 +53,20 @@ TEST_CASE("ListOfNonNodeType") {
     REQUIRE(model->rowCount() == prev_len + 1);
     REQUIRE(model->get(3)->get_name().toStdString() == user_name.toStdString());
   }
+  SECTION("test update - removed rows delete their proxies") {
+    auto model = mq->data()->get_users();
+    auto prev_len = model->rowCount();
+    QPointer<QObject> removed_user = model->last();
+    auto remove_user = removeuser::RemoveUser::shared();
+    remove_user->set_variables({prev_len - 1});
+    remove_user->execute();
+    test_utils::wait_for_completion(remove_user);
+    mq->execute(true);
+    test_utils::wait_for_completion(mq);
+    QCoreApplication::sendPostedEvents(nullptr, QEvent::DeferredDelete);
+    REQUIRE(model->rowCount() == prev_len - 1);
+    REQUIRE(removed_user.isNull());
+  }
 }
 
 }; // namespace ListOfNonNodeType
@@ -0,0 +1,46 @@
+#include "gen/MainQuery.hpp"
+#include "testframework.hpp"
+#include "testutils.hpp"
+
+namespace MultipleRootFields {
+using namespace qtgql;
+
+auto ENV_NAME = std::string("MultipleRootFields");
+auto SCHEMA_ADDR =
+    test_utils::get_server_address(QString::fromStdString(ENV_NAME));
+
+TEST_CASE("MultipleRootFields") {
+  auto env = test_utils::get_or_create_env(
+      ENV_NAME,
+      test_utils::DebugWsClientSettings{.prod_settings = {.url = SCHEMA_ADDR}});
+  auto mq = mainquery::MainQuery::shared();
+  mq->execute();
+  test_utils::wait_for_completion(mq);
+
+  SECTION("test deserialize") {
+    auto const_user = mq->data()->get_constUser();
+    REQUIRE(const_user->get_id() == "FakeID");
+    REQUIRE(const_user->get_name() == "nir");
+    REQUIRE(const_user->get_age() == 24);
+    auto user = mq->data()->get_user();
+    REQUIRE(!user->get_name().isEmpty());
+    REQUIRE(user->get_id() != const_user->get_id());
+  };
+
+  SECTION("test update") {
+    auto data = mq->data();
+    auto const_user = data->get_constUser();
+    auto user = data->get_user();
+    auto previous_id = user->get_id();
+    test_utils::SignalCatcher catcher({.source_obj = user, .only = "id"});
+    mq->execute(true);
+    REQUIRE(catcher.wait());
+    test_utils::wait_for_completion(mq);
+    REQUIRE(data->get_user()->get_id() != previous_id);
+    // the other root field was updated by the same response.
+    REQUIRE(data->get_constUser() == const_user);
+    REQUIRE(const_user->get_name() == "nir");
+  }
+}
+
+}; // namespace MultipleRootFields
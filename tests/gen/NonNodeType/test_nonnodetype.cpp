@@ -30,6 +30,14 @@ TEST_CASE("NonNodeType") {
     REQUIRE(prev_name != new_name);
     REQUIRE(new_name == mq->data()->get_user()->get_name());
   };
+  SECTION("test update of an empty field") {
+    auto user = Query::instance()->get_user();
+    user->m_name = std::nullopt;
+    QJsonObject data{{"name", "new name"}, {"age", 1}};
+    mainquery::updaters::update_User__user(user, data, mq.get());
+    REQUIRE(user->m_name == QString("new name"));
+    REQUIRE(mq->data()->get_user()->get_name() == "new name");
+  };
 }
 
 }; // namespace NonNodeType
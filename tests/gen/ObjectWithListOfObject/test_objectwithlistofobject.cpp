@@ -3,6 +3,8 @@
 #include "gen/AddFriend.hpp"
 #include "gen/MainQuery.hpp"
 #include "testutils.hpp"
+#include <QPointer>
+#include <QSignalSpy>
 
 namespace ObjectWithListOfObject {
 using namespace qtgql;
@@ -37,6 +39,24 @@ TEST_CASE("ObjectWithListOfObject") {
     REQUIRE(mq_model->rowCount() ==
             add_friend_mut->data()->get_addFriend()->get_friends()->rowCount());
   }
+  SECTION("test update inserts only the new rows") {
+    auto mq_model = mq->data()->get_user()->get_friends();
+    QPointer<QObject> first = mq_model->first();
+    QSignalSpy inserted(mq_model, &QAbstractItemModel::rowsInserted);
+    QSignalSpy reset(mq_model, &QAbstractItemModel::modelReset);
+    auto add_friend_mut = addfriend::AddFriend::shared();
+    add_friend_mut->set_variables(
+        {mq->data()->get_user()->get_id(), QString("Momo")});
+    add_friend_mut->execute();
+    test_utils::wait_for_completion(add_friend_mut);
+    QCoreApplication::sendPostedEvents(nullptr, QEvent::DeferredDelete);
+    REQUIRE(inserted.count() == 1);
+    REQUIRE(inserted.first().at(1).toInt() == mq_model->rowCount() - 1);
+    REQUIRE(reset.isEmpty());
+    // the proxies of the rows that remain are kept.
+    REQUIRE(!first.isNull());
+    REQUIRE(mq_model->first() == first);
+  }
 }
 
 } // namespace ObjectWithListOfObject
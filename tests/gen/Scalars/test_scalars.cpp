@@ -4,6 +4,7 @@
 #include "testutils.hpp"
 
 #include "qtgql/gqloverhttp/gqloverhttp.hpp"
+#include <catch2/benchmark/catch_benchmark.hpp>
 
 namespace Scalars {
 using namespace qtgql;
@@ -52,4 +53,36 @@ TEST_CASE("Scalars") {
   };
 };
 
+// Not run by default, compare with `TableDrivenDeserialization` (run with `[benchmark]`).
+TEST_CASE("Scalars - update benchmark", "[.][benchmark]") {
+  auto ENV_NAME = std::string("Scalars");
+  auto SCHEMA_ADDR =
+      test_utils::get_server_address(QString::fromStdString(ENV_NAME));
+  auto env = test_utils::get_or_create_env(
+      ENV_NAME,
+      test_utils::DebugWsClientSettings{.prod_settings = {.url = SCHEMA_ADDR}});
+  auto mq = std::make_shared<mainquery::MainQuery>();
+  mq->execute();
+  test_utils::wait_for_completion(mq);
+  auto user = User::get_node(mq->data()->get_constUser()->get_id()).value();
+  QJsonObject data_a{{"id", user->get_id()},
+                     {"name", "nir"},
+                     {"age", 24},
+                     {"agePoint", 24.0},
+                     {"male", true},
+                     {"uuid", "06335e84-2872-4914-8c5d-3ed07d2a2f16"},
+                     {"voidField", QJsonValue()}};
+  auto data_b = data_a;
+  data_b["name"] = "not nir";
+  data_b["age"] = 25;
+
+  BENCHMARK("update changed fields") {
+    mainquery::updaters::update_User__constUser(user, data_a, mq.get());
+    mainquery::updaters::update_User__constUser(user, data_b, mq.get());
+  };
+  BENCHMARK("update unchanged fields") {
+    mainquery::updaters::update_User__constUser(user, data_a, mq.get());
+  };
+}
+
 }; // namespace Scalars
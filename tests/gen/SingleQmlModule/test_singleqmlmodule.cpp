@@ -0,0 +1,37 @@
+#include "testframework.hpp"
+#include "testutils.hpp"
+
+#include "gen/FriendsListQuery.hpp"
+#include "gen/SimpleQuery.hpp"
+
+#include <QQmlApplicationEngine>
+#include <filesystem>
+
+namespace fs = std::filesystem;
+
+namespace SingleQmlModule {
+using namespace qtgql;
+
+auto ENV_NAME = std::string("SingleQmlModule");
+
+auto SCHEMA_ADDR =
+    test_utils::get_server_address(QString::fromStdString(ENV_NAME));
+
+TEST_CASE("SingleQmlModuleTestCase") {
+  auto env = test_utils::get_or_create_env(
+      ENV_NAME,
+      test_utils::DebugWsClientSettings{.prod_settings = {.url = SCHEMA_ADDR}});
+  QQmlApplicationEngine engine;
+  auto bot = test_utils::QmlBot();
+
+  SECTION("all the operations are imported from a single module") {
+    auto main_qml =
+        fs::path(__FILE__).parent_path() / "testoncompletedhook.qml";
+
+    auto root_qquickitem = bot.load(main_qml);
+    REQUIRE(root_qquickitem->findChild<QObject *>("useFriendsListQuery"));
+    REQUIRE(QTest::qWaitFor(
+        [&] { return root_qquickitem->property("success").toBool(); }));
+  }
+}
+}; // namespace SingleQmlModule
@@ -0,0 +1,23 @@
+import QtQuick
+import GraphQL.SingleQmlModule
+
+Item {
+    id: root
+    objectName: "root"
+    property bool success: false
+    UseSimpleQuery {
+        id: main_query
+        objectName: "useSimpleQuery"
+        onCompletedChanged: root.success = true
+    }
+    UseFriendsListQuery {
+        id: friends_query
+        objectName: "useFriendsListQuery"
+    }
+    Component.onCompleted: {
+        main_query.execute();
+    }
+    Text {
+        text: `completed ${main_query.completed}`
+    }
+}
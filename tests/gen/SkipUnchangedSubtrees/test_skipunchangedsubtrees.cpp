@@ -0,0 +1,115 @@
+#include "gen/MainQuery.hpp"
+#include "gen/UserWithSameIDDiffFields.hpp"
+#include "testframework.hpp"
+#include "testutils.hpp"
+
+#include <catch2/benchmark/catch_benchmark.hpp>
+
+namespace SkipUnchangedSubtrees {
+using namespace qtgql;
+
+TEST_CASE("SkipUnchangedSubtrees") {
+  auto ENV_NAME = std::string("SkipUnchangedSubtrees");
+
+  auto SCHEMA_ADDR =
+      test_utils::get_server_address(QString::fromStdString(ENV_NAME));
+  auto env = test_utils::get_or_create_env(
+      ENV_NAME,
+      test_utils::DebugWsClientSettings{.prod_settings = {.url = SCHEMA_ADDR}});
+  auto mq = std::make_shared<mainquery::MainQuery>();
+  mq->execute();
+  test_utils::wait_for_completion(mq);
+  auto user = User::get_node(mq->data()->get_constUser()->get_id()).value();
+  QJsonObject data{{"id", user->get_id().value()},
+                   {"name", "nir"},
+                   {"age", 24},
+                   {"agePoint", 24.0},
+                   {"male", true},
+                   {"uuid", "06335e84-2872-4914-8c5d-3ed07d2a2f16"},
+                   {"voidField", QJsonValue()}};
+
+  // members are assigned directly (no setter) to tell whether an update was
+  // skipped.
+  SECTION("test unchanged data is skipped") {
+    mainquery::updaters::update_User__constUser(user, data, mq.get());
+    user->m_name = "not updated";
+    mainquery::updaters::update_User__constUser(user, data, mq.get());
+    REQUIRE(user->get_name() == "not updated");
+  }
+  SECTION("test changes of other instances don't matter") {
+    mainquery::updaters::update_User__constUser(user, data, mq.get());
+    auto other = User::shared();
+    other->set_name("other");
+    user->m_name = "not updated";
+    mainquery::updaters::update_User__constUser(user, data, mq.get());
+    REQUIRE(user->get_name() == "not updated");
+  }
+  SECTION("test unchanged nested nodes are skipped") {
+    auto query = Query::instance();
+    QJsonObject root_data{{"constUser", data}};
+    mainquery::updaters::update_Query__(query, root_data, mq.get());
+    user->m_name = "not updated";
+    mainquery::updaters::update_Query__(query, root_data, mq.get());
+    REQUIRE(user->get_name() == "not updated");
+    // voids the record of the root only, the node is still skipped.
+    query->set_constUser(query->get_constUser());
+    user->m_age = 1;
+    mainquery::updaters::update_Query__(query, root_data, mq.get());
+    REQUIRE(user->get_age() == 1);
+  }
+  SECTION("test changes of nested nodes are updated") {
+    auto query = Query::instance();
+    QJsonObject root_data{{"constUser", data}};
+    mainquery::updaters::update_Query__(query, root_data, mq.get());
+    user->set_name("changed elsewhere");
+    mainquery::updaters::update_Query__(query, root_data, mq.get());
+    REQUIRE(user->get_name() == "nir");
+  }
+  SECTION("test changed data is updated") {
+    mainquery::updaters::update_User__constUser(user, data, mq.get());
+    data["name"] = "not nir";
+    mainquery::updaters::update_User__constUser(user, data, mq.get());
+    REQUIRE(user->get_name() == "not nir");
+  }
+  SECTION("test instances changed since are updated") {
+    mainquery::updaters::update_User__constUser(user, data, mq.get());
+    user->set_name("changed elsewhere");
+    mainquery::updaters::update_User__constUser(user, data, mq.get());
+    REQUIRE(user->get_name() == "nir");
+  }
+  SECTION("test update by another operation") {
+    auto previous_name = user->get_name();
+    auto modified_user_op =
+        userwithsameiddifffields::UserWithSameIDDiffFields::shared();
+    modified_user_op->execute();
+    test_utils::wait_for_completion(modified_user_op);
+    REQUIRE(user->get_name() != previous_name);
+  }
+};
+
+// Not run by default, compare with `Scalars` (run with `[benchmark]`).
+TEST_CASE("SkipUnchangedSubtrees - update benchmark", "[.][benchmark]") {
+  auto ENV_NAME = std::string("SkipUnchangedSubtrees");
+  auto SCHEMA_ADDR =
+      test_utils::get_server_address(QString::fromStdString(ENV_NAME));
+  auto env = test_utils::get_or_create_env(
+      ENV_NAME,
+      test_utils::DebugWsClientSettings{.prod_settings = {.url = SCHEMA_ADDR}});
+  auto mq = std::make_shared<mainquery::MainQuery>();
+  mq->execute();
+  test_utils::wait_for_completion(mq);
+  auto user = User::get_node(mq->data()->get_constUser()->get_id()).value();
+  QJsonObject data{{"id", user->get_id().value()},
+                   {"name", "nir"},
+                   {"age", 24},
+                   {"agePoint", 24.0},
+                   {"male", true},
+                   {"uuid", "06335e84-2872-4914-8c5d-3ed07d2a2f16"},
+                   {"voidField", QJsonValue()}};
+
+  BENCHMARK("update unchanged fields") {
+    mainquery::updaters::update_User__constUser(user, data, mq.get());
+  };
+}
+
+}; // namespace SkipUnchangedSubtrees
@@ -0,0 +1,88 @@
+#include "gen/MainQuery.hpp"
+#include "gen/UserWithSameIDDiffFields.hpp"
+#include "testframework.hpp"
+#include "testutils.hpp"
+
+#include "qtgql/gqloverhttp/gqloverhttp.hpp"
+#include <catch2/benchmark/catch_benchmark.hpp>
+
+namespace TableDrivenDeserialization {
+using namespace qtgql;
+
+TEST_CASE("TableDrivenDeserialization") {
+  auto ENV_NAME = std::string("TableDrivenDeserialization");
+
+  auto SCHEMA_ADDR =
+      test_utils::get_server_address(QString::fromStdString(ENV_NAME));
+  auto env = test_utils::get_or_create_env(
+      ENV_NAME,
+      test_utils::DebugWsClientSettings{.prod_settings = {.url = SCHEMA_ADDR}});
+  auto mq = std::make_shared<mainquery::MainQuery>();
+  mq->execute();
+  test_utils::wait_for_completion(mq);
+
+  SECTION("test deserialize") {
+    auto d = mq->data()->get_constUser();
+    REQUIRE(d->get_age() == 24);
+    REQUIRE(d->get_agePoint() == 24.0f);
+    REQUIRE(d->get_id() == "FakeID");
+    REQUIRE(d->get_male() == true);
+    REQUIRE(d->get_name() == "nir");
+    REQUIRE(d->get_uuid() ==
+            QUuid::fromString("06335e84-2872-4914-8c5d-3ed07d2a2f16"));
+    REQUIRE(d->get_voidField() == qtgql::bases::DEFAULTS::VOID);
+  };
+  SECTION("test update") {
+
+    auto data = mq->data();
+    auto user = data->get_constUser();
+    auto previous_name = user->get_name();
+    auto modified_user_op =
+        userwithsameiddifffields::UserWithSameIDDiffFields::shared();
+    auto catcher = test_utils::SignalCatcher(
+        {.source_obj = user, .excludes = {{"voidField"}}});
+    modified_user_op->execute();
+    REQUIRE(catcher.wait());
+    test_utils::wait_for_completion(modified_user_op);
+    auto modified_user =
+        modified_user_op->data()->get_constUserWithModifiedFields();
+    REQUIRE(user->get_id() == modified_user->get_id());
+    auto new_name = modified_user->get_name();
+    REQUIRE(user->get_name() == new_name);
+    REQUIRE(new_name != previous_name);
+  };
+};
+
+// Not run by default, compare with `Scalars` (run with `[benchmark]`).
+TEST_CASE("TableDrivenDeserialization - update benchmark", "[.][benchmark]") {
+  auto ENV_NAME = std::string("TableDrivenDeserialization");
+  auto SCHEMA_ADDR =
+      test_utils::get_server_address(QString::fromStdString(ENV_NAME));
+  auto env = test_utils::get_or_create_env(
+      ENV_NAME,
+      test_utils::DebugWsClientSettings{.prod_settings = {.url = SCHEMA_ADDR}});
+  auto mq = std::make_shared<mainquery::MainQuery>();
+  mq->execute();
+  test_utils::wait_for_completion(mq);
+  auto user = User::get_node(mq->data()->get_constUser()->get_id()).value();
+  QJsonObject data_a{{"id", user->get_id()},
+                     {"name", "nir"},
+                     {"age", 24},
+                     {"agePoint", 24.0},
+                     {"male", true},
+                     {"uuid", "06335e84-2872-4914-8c5d-3ed07d2a2f16"},
+                     {"voidField", QJsonValue()}};
+  auto data_b = data_a;
+  data_b["name"] = "not nir";
+  data_b["age"] = 25;
+
+  BENCHMARK("update changed fields") {
+    mainquery::updaters::update_User__constUser(user, data_a, mq.get());
+    mainquery::updaters::update_User__constUser(user, data_b, mq.get());
+  };
+  BENCHMARK("update unchanged fields") {
+    mainquery::updaters::update_User__constUser(user, data_a, mq.get());
+  };
+}
+
+}; // namespace TableDrivenDeserialization
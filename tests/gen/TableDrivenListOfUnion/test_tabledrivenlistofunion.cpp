@@ -0,0 +1,98 @@
+#include "gen/InsertToList.hpp"
+#include "gen/MainQuery.hpp"
+#include "gen/ModifyName.hpp"
+#include "gen/RemoveAt.hpp"
+#include "testframework.hpp"
+#include "testutils.hpp"
+#include <QSignalSpy>
+
+namespace TableDrivenListOfUnion {
+using namespace qtgql;
+
+auto ENV_NAME = std::string("TableDrivenListOfUnion");
+auto SCHEMA_ADDR =
+    test_utils::get_server_address(QString::fromStdString(ENV_NAME));
+
+TEST_CASE("TableDrivenListOfUnion") {
+  auto env = test_utils::get_or_create_env(
+      ENV_NAME,
+      test_utils::DebugWsClientSettings{.prod_settings = {.url = SCHEMA_ADDR}});
+  auto mq = mainquery::MainQuery::shared();
+  mq->execute();
+  test_utils::wait_for_completion(mq);
+  auto person_id = mq->data()->get_randPerson()->get_id();
+  auto person = Person::get_node(person_id).value();
+
+  SECTION("test deserialize dispatches by type") {
+    const auto &pets = person->get_pets();
+    auto model = mq->data()->get_randPerson()->get_pets();
+    REQUIRE(static_cast<int>(pets.size()) == model->rowCount());
+    for (int i = 0; i < model->rowCount(); i++) {
+      auto type_name = model->get(i)->__typename();
+      if (type_name == "Dog") {
+        REQUIRE(pets[i]->qtgql_type_id() == TypeIds::Dog);
+        REQUIRE(std::static_pointer_cast<Dog>(pets[i])->get_age() > 0);
+      } else {
+        REQUIRE(type_name == "Cat");
+        REQUIRE(pets[i]->qtgql_type_id() == TypeIds::Cat);
+        REQUIRE(
+            !std::static_pointer_cast<Cat>(pets[i])->get_color().value().isEmpty());
+      }
+    }
+  };
+
+  SECTION("test update keeps the nodes") {
+    auto insert_mut = inserttolist::InsertToList::shared();
+    auto at = static_cast<int>(person->get_pets().size());
+    insert_mut->set_variables({person_id, at, "Rex",
+                               TableDrivenListOfUnion::Enums::UnionTypes::DOG});
+    insert_mut->execute();
+    test_utils::wait_for_completion(insert_mut);
+    auto dog = person->get_pets().at(at);
+    REQUIRE(dog->qtgql_type_id() == TypeIds::Dog);
+
+    auto modify_mut = modifyname::ModifyName::shared();
+    QString new_name("Frank Zappa");
+    modify_mut->set_variables({person_id, at, new_name});
+    modify_mut->execute();
+    test_utils::wait_for_completion(modify_mut);
+    // the list is deserialized again, the node is taken from the cache.
+    REQUIRE(person->get_pets().at(at) == dog);
+    REQUIRE(std::static_pointer_cast<Dog>(dog)->get_name() == new_name);
+    REQUIRE(mq->data()
+                ->get_randPerson()
+                ->get_pets()
+                ->get(at)
+                ->property("name")
+                .toString() == new_name);
+  }
+
+  SECTION("test update add") {
+    auto insert_mut = inserttolist::InsertToList::shared();
+    auto model = mq->data()->get_randPerson()->get_pets();
+    QString name_to_set("Abu Nasr al-Farabi");
+    auto prev_length = model->rowCount();
+    insert_mut->set_variables({person_id, prev_length + 1, name_to_set,
+                               TableDrivenListOfUnion::Enums::UnionTypes::DOG});
+    insert_mut->execute();
+    test_utils::wait_for_completion(insert_mut);
+    REQUIRE(prev_length < model->rowCount());
+    REQUIRE(person->get_pets().back()->qtgql_type_id() == TypeIds::Dog);
+    auto dog =
+        qobject_cast<const mainquery::Dog__randPersonpets *>(model->last());
+    REQUIRE(dog->get_name() == name_to_set);
+  }
+
+  SECTION("test update remove") {
+    auto prev_length = static_cast<int>(person->get_pets().size());
+    auto remove_mut = removeat::RemoveAt::shared();
+    remove_mut->set_variables({person_id, 3});
+    remove_mut->execute();
+    test_utils::wait_for_completion(remove_mut);
+    REQUIRE(static_cast<int>(person->get_pets().size()) == prev_length - 1);
+    REQUIRE(mq->data()->get_randPerson()->get_pets()->rowCount() ==
+            prev_length - 1);
+  };
+}
+
+}; // namespace TableDrivenListOfUnion
@@ -0,0 +1,61 @@
+#include "testframework.hpp"
+#include <QSignalSpy>
+
+#include "gen/MainQuery.hpp"
+#include "gen/ReplacePerson.hpp"
+#include "gen/UpdateUserName.hpp"
+#include "testutils.hpp"
+
+namespace TableDrivenNestedObject {
+using namespace qtgql;
+auto ENV_NAME = std::string("TableDrivenNestedObject");
+auto SCHEMA_ADDR =
+    test_utils::get_server_address(QString::fromStdString(ENV_NAME));
+
+TEST_CASE("TableDrivenNestedObject") {
+  auto env = test_utils::get_or_create_env(
+      ENV_NAME,
+      test_utils::DebugWsClientSettings{.prod_settings = {.url = SCHEMA_ADDR}});
+  auto mq = std::make_shared<mainquery::MainQuery>();
+  mq->execute();
+  test_utils::wait_for_completion(mq);
+  auto user_id = mq->data()->get_user()->get_id();
+  auto user = User::get_node(user_id).value();
+
+  SECTION("test deserialize") {
+    auto name = mq->data()->get_user()->get_person()->get_name();
+    REQUIRE((!name.isEmpty() && name != bases::DEFAULTS::STRING));
+    REQUIRE(user->get_person());
+    REQUIRE(user->get_person()->get_name() == name);
+  }
+  SECTION("test update of the same node is in place") {
+    auto person = user->get_person();
+    QSignalSpy person_spy(user.get(), &User::personChanged);
+    auto change_user_name_op = updateusername::UpdateUserName::shared();
+    QString new_name = "שלום";
+    change_user_name_op->set_variables({user_id, new_name});
+    change_user_name_op->execute();
+    test_utils::wait_for_completion(change_user_name_op);
+    REQUIRE(user->get_person() == person);
+    REQUIRE(person->get_name() == new_name);
+    REQUIRE(person_spy.count() == 0);
+    REQUIRE(mq->data()->get_user()->get_person()->get_name() == new_name);
+  }
+  SECTION("test update of another node replaces the instance") {
+    auto person = user->get_person();
+    auto replace_person_op = replaceperson::ReplacePerson::shared();
+    replace_person_op->set_variables({user_id});
+    auto catcher = test_utils::SignalCatcher(
+        {.source_obj = mq->data()->get_user()->get_person(), .only = "name"});
+    replace_person_op->execute();
+    REQUIRE(catcher.wait());
+    test_utils::wait_for_completion(replace_person_op);
+    auto new_person = user->get_person();
+    REQUIRE(new_person != person);
+    REQUIRE(new_person->get_id() != person->get_id());
+    REQUIRE(mq->data()->get_user()->get_person()->get_id() ==
+            new_person->get_id());
+  }
+}
+
+}; // namespace TableDrivenNestedObject
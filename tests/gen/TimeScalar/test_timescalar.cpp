@@ -28,7 +28,7 @@ TEST_CASE("TimeScalar") {
     auto old_user = mq->data()->get_user();
     auto modified_user_op = updatelunchtime::UpdateLunchTime::shared();
     auto new_lunch_time =
-        customscalars::TimeScalar(QTime::currentTime().addSecs(20));
+        customscalars::TimeValue(QTime::currentTime().addSecs(20));
     auto user_id = old_user->get_id();
     modified_user_op->set_variables({{new_lunch_time}, user_id});
     auto catcher = test_utils::SignalCatcher(
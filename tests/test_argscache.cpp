@@ -0,0 +1,91 @@
+#include "testframework.hpp"
+#include <qtgql/bases/bases.hpp>
+using namespace qtgql;
+
+bases::ArgsKey key_of(int i) { return bases::ArgsKey({{"i", i}}); }
+
+TEST_CASE("ArgsKey") {
+  SECTION("test equal arguments have the same key") {
+    auto a = bases::ArgsKey({{"i", 1}, {"s", "foo"}});
+    auto b = bases::ArgsKey({{"s", "foo"}, {"i", 1}});
+    REQUIRE(a == b);
+    REQUIRE(a.hash() == b.hash());
+  }
+  SECTION("test nested values are hashed") {
+    auto a = bases::ArgsKey({{"obj", QJsonObject{{"s", "foo"}}}});
+    auto b = bases::ArgsKey({{"obj", QJsonObject{{"s", "bar"}}}});
+    REQUIRE(!(a == b));
+    REQUIRE(a.hash() != b.hash());
+  }
+}
+
+TEST_CASE("ArgsCache") {
+  SECTION("test unbounded keeps all the values") {
+    bases::ArgsCache<int> cache;
+    for (int i = 0; i < 100; i++) {
+      cache[key_of(i)] = i;
+    }
+    REQUIRE(cache.size() == 100);
+    REQUIRE(cache.at(key_of(0)) == 0);
+  }
+  SECTION("test bounded evicts the least recently used") {
+    bases::ArgsCache<int, 2> cache;
+    cache[key_of(1)] = 1;
+    cache[key_of(2)] = 2;
+    REQUIRE(cache.at(key_of(1)) == 1); // 2 is the least recently used now.
+    cache[key_of(3)] = 3;
+    REQUIRE(cache.size() == 2);
+    REQUIRE(cache.contains(key_of(1)));
+    REQUIRE(!cache.contains(key_of(2)));
+    REQUIRE(cache.contains(key_of(3)));
+  }
+  SECTION("test pinned arguments are not evicted") {
+    bases::ArgsCache<int, 1> cache;
+    {
+      bases::MemoizedArgs memo;
+      const auto &pinned = memo.get(1, []() { return key_of(1); });
+      cache[pinned] = 1;
+      cache[key_of(2)] = 2;
+      cache[key_of(3)] = 3;
+      REQUIRE(cache.contains(key_of(1)));
+      REQUIRE(cache.size() == 2);
+    }
+    // released when the memo is destroyed.
+    cache[key_of(4)] = 4;
+    REQUIRE(cache.size() == 1);
+    REQUIRE(cache.contains(key_of(4)));
+  }
+  SECTION("test rebuilt arguments are released") {
+    bases::MemoizedArgs memo;
+    memo.get(1, []() { return key_of(1); });
+    REQUIRE(bases::pinned_args::contains(key_of(1)));
+    memo.get(2, []() { return key_of(2); });
+    REQUIRE(!bases::pinned_args::contains(key_of(1)));
+    REQUIRE(bases::pinned_args::contains(key_of(2)));
+  }
+  SECTION("test equality ignores the order of use") {
+    bases::ArgsCache<int, 2> a;
+    bases::ArgsCache<int, 2> b;
+    a[key_of(1)] = 1;
+    a[key_of(2)] = 2;
+    b[key_of(2)] = 2;
+    b[key_of(1)] = 1;
+    REQUIRE(a == b);
+    b[key_of(1)] = 3;
+    REQUIRE(a != b);
+  }
+}
+
+TEST_CASE("MemoizedArgs") {
+  bases::MemoizedArgs memo;
+  int builds = 0;
+  auto build = [&]() {
+    builds++;
+    return key_of(builds);
+  };
+  REQUIRE(memo.get(1, build) == key_of(1));
+  REQUIRE(memo.get(1, build) == key_of(1));
+  REQUIRE(builds == 1);
+  REQUIRE(memo.get(2, build) == key_of(2));
+  REQUIRE(builds == 2);
+}
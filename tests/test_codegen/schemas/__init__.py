@@ -20,6 +20,7 @@ from . import (  # noqa
     object_with_enum,
     object_with_list_of_object,
     object_with_object,
+    object_with_non_node_object,
     object_with_optional_object,
     object_with_optional_scalar,
     object_with_scalar,
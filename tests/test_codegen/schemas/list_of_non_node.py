@@ -24,6 +24,10 @@ class Mutation:
     def modify_user(self, at: int, name: str) -> None:
         USERS[at].name = name
 
+    @strawberry.field()
+    def remove_user(self, at: int) -> None:
+        USERS.pop(at)
+
 
 @strawberry.type
 class Query:
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import strawberry
+
+from tests.conftest import fake
+from tests.test_codegen.schemas.node_interface import NODE_DB, Node
+
+
+@strawberry.type
+class Address:
+    street: str
+    city: str
+
+
+@strawberry.type
+class Pet:
+    name: str
+
+
+@strawberry.type
+class User(Node):
+    name: str
+    address: Address
+    pets: list[Pet]
+
+
+USERS: dict[str, User] = {}
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def user(self, key: str) -> User:
+        if key not in USERS:
+            USERS[key] = User(
+                name=fake.name(),
+                address=Address(street=fake.street_name(), city=fake.city()),
+                pets=[Pet(name=fake.first_name()) for _ in range(3)],
+            )
+        return USERS[key]
+
+
+@strawberry.type
+class Mutation:
+    @strawberry.field()
+    def change_street(self, node_id: strawberry.ID, street: str) -> User:
+        user: User = NODE_DB.get(node_id)
+        user.address.street = street
+        return user
+
+
+schema = strawberry.Schema(query=Query, mutation=Mutation)
@@ -12,6 +12,9 @@ custom_scalars["👉 cs.graphql_name 👈"] = CustomScalarDefinition(
     to_qt_type="👉 cs.to_qt_type 👈",
     deserialized_type="👉 cs.deserialized_type 👈",
     include_path="👉 cs.include_path 👈",
+    {% if cs.value_semantic -%}
+    value_semantic=True,
+    {% endif -%}
 )
 {% endfor -%}
 
@@ -20,5 +23,32 @@ config = QtGqlConfig(
     env_name="👉 context.config.env_name 👈",
     generated_dir_name="../gen",
     custom_scalars=custom_scalars,
+    {% if context.config.deserialize_only_operations -%}
+    deserialize_only_operations={👉 context.config.deserialize_only_operations | sort | map("tojson") | join(", ") 👈},
+    {% endif -%}
+    {% if context.config.headless -%}
+    headless=True,
+    {% endif -%}
+    {% if context.config.single_qml_module -%}
+    single_qml_module=True,
+    {% endif -%}
+    {% if context.config.table_driven_deserialization -%}
+    table_driven_deserialization=True,
+    {% endif -%}
+    {% if context.config.skip_unchanged_subtrees -%}
+    skip_unchanged_subtrees=True,
+    {% endif -%}
+    {% if context.config.lazy_deserialization -%}
+    lazy_deserialization=True,
+    {% endif -%}
+    {% if context.config.lazy_proxies -%}
+    lazy_proxies=True,
+    {% endif -%}
+    {% if context.config.args_cache_size -%}
+    args_cache_size=👉 context.config.args_cache_size 👈,
+    {% endif -%}
+    {% if context.config.args_cache_sizes -%}
+    args_cache_sizes=👉 context.config.args_cache_sizes | tojson 👈,
+    {% endif -%}
     qml_plugins_path="👉 context.config.qml_plugins_path 👈",
 )
@@ -0,0 +1,63 @@
+from qtgqlcodegen.core.template import CmakeTemplateContext, cmake_template
+
+from tests.test_codegen import schemas
+from tests.test_codegen.testcases import generate_virtual
+
+OPERATIONS = """
+query MainQuery {
+  constUser {
+    name
+  }
+}
+"""
+
+
+def generate_cmake(**config_options) -> str:
+    output = generate_virtual(
+        schema=schemas.object_with_scalar.schema,
+        operations=OPERATIONS,
+        **config_options,
+    )
+    config = output.operations[0].context.config
+    return cmake_template(CmakeTemplateContext(config=config, generation_output=output))
+
+
+def test_no_build_time_options_by_default():
+    cmake = generate_cmake()
+    assert "target_precompile_headers" not in cmake
+    assert "UNITY_BUILD" not in cmake
+
+
+def test_precompile_headers():
+    cmake = generate_cmake(precompile_headers=True)
+    assert "target_precompile_headers(${target} PRIVATE" in cmake
+    assert "<qtgql/bases/bases.hpp>" in cmake
+    assert "${EnvTarget}schema\n        ${EnvTarget}MainQuery\n" in cmake
+    assert "UNITY_BUILD" not in cmake
+
+
+def test_unity_build():
+    cmake = generate_cmake(unity_build_batch_size=8)
+    assert "UNITY_BUILD ON" in cmake
+    assert "UNITY_BUILD_BATCH_SIZE 8" in cmake
+    assert "target_precompile_headers" not in cmake
+
+
+def test_single_qml_module():
+    cmake = generate_cmake(single_qml_module=True)
+    assert cmake.count("qt_add_qml_module(") == 1
+    assert "URI GraphQL.${EnvTarget}\n" in cmake
+    assert "${EnvTarget}schema" not in cmake
+    assert "MainQuery.cpp" in cmake
+
+
+def test_single_qml_module_registers_narrowed_types_anonymously():
+    output = generate_virtual(
+        schema=schemas.object_with_scalar.schema,
+        operations=OPERATIONS,
+        single_qml_module=True,
+    )
+    operation_hpp = output.operations[0].sources[0].content
+    assert "QML_ANONYMOUS" in operation_hpp
+    # proxy types of different operations may share a name.
+    assert "does not supports instantiation via qml" not in operation_hpp
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from tests.test_codegen import schemas
+from tests.test_codegen.testcases import (
+    CountryScalar,
+    CustomUserScalarTestCase,
+    generate_virtual,
+    implemented_testcases,
+)
+
+if TYPE_CHECKING:
+    from qtgqlcodegen.generator import GenerationOutput
+
+
+def source_of(output: GenerationOutput, name: str) -> str:
+    return next(f for f in output.schema.sources if f.path.name == name).content
+
+
+def test_builtin_custom_scalars_are_held_by_value():
+    output = generate_virtual(
+        schema=schemas.object_with_datetime.schema,
+        operations="""
+        query MainQuery {
+          user {
+            birth
+          }
+        }
+        """,
+    )
+    user_hpp = source_of(output, "User.hpp")
+    assert "std::optional<qtgql::customscalars::DateTimeValue>" in user_hpp
+    assert "std::shared_ptr<qtgql::customscalars::DateTimeValue>" not in user_hpp
+    operation_cpp = output.operations[0].sources[1].content
+    assert "qtgql::customscalars::DateTimeValue::from_json(qtgql__json[0])" in operation_cpp
+    # the raw data is compared before it is parsed.
+    assert "!inst->m_birth->raw_equals(qtgql__json[0])" in operation_cpp
+    assert "make_shared<qtgql::customscalars::DateTimeValue>" not in operation_cpp
+
+
+def test_abc_custom_scalars_are_shared():
+    output = generate_virtual(
+        schema=schemas.object_with_user_defined_scalar.schema,
+        custom_scalars={CountryScalar.graphql_name: CountryScalar},
+        operations="""
+        query MainQuery {
+          user {
+            country
+          }
+        }
+        """,
+    )
+    assert "std::shared_ptr<CountryScalar>" in source_of(output, "User.hpp")
+    operation_cpp = output.operations[0].sources[1].content
+    assert "new_country->deserialize(qtgql__json[0]);" in operation_cpp
+    assert "raw_equals" not in operation_cpp
+
+
+def test_user_defined_abc_scalars_are_still_generated():
+    # compiled (and tested) by the C++ suite, see tests/gen/CustomUserScalar.
+    assert CustomUserScalarTestCase in implemented_testcases
+    output = generate_virtual(CustomUserScalarTestCase)
+    assert '#include "../countryscalar.hpp"' in source_of(output, "_common.hpp")
+    user_hpp = source_of(output, "User.hpp")
+    assert "[[nodiscard]] const std::shared_ptr<CountryScalar> &get_country();" in user_hpp
+    operation_cpp = output.operations[0].sources[1].content
+    assert "auto new_country = std::make_shared<CountryScalar>();" in operation_cpp
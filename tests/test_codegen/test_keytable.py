@@ -0,0 +1,106 @@
+import random
+import string
+import time
+
+import pytest
+from qtgqlcodegen.core.keytable import KeyTable, key_hash
+
+from tests.test_codegen import schemas
+from tests.test_codegen.testcases import generate_virtual
+
+
+def lookup(table: KeyTable, key: str) -> int:
+    """Mirrors `qtgql::bases::keys::KeyTable::index_of`."""
+    bucket = key_hash(table.seed, key) % len(table.buckets)
+    while (index := table.buckets[bucket]) != -1:
+        if table.keys[index] == key:
+            return index
+        bucket = (bucket + 1) % len(table.buckets)
+    return -1
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [
+        (),
+        ("id",),
+        ("id", "name", "age", "friends", "createdAt", "updatedAt"),
+        # same length, first, middle and last characters.
+        ("name", "nome", "id", "AXB", "ACB"),
+        tuple(f"field{i}" for i in range(40)),
+    ],
+)
+def test_key_table_lookup(keys: tuple[str, ...]):
+    table = KeyTable.create(keys)
+    assert len(table.buckets) > len(keys)
+    assert sorted(i for i in table.buckets if i != -1) == list(range(len(keys)))
+    for index, key in enumerate(keys):
+        assert lookup(table, key) == index
+    for key in ("__typename", "nam", "field40", "x"):
+        assert lookup(table, key) == -1
+
+
+def test_perfect_hash_is_found():
+    table = KeyTable.create(("id", "name", "age", "friends", "createdAt", "updatedAt"))
+    assert {key_hash(table.seed, key) % len(table.buckets) for key in table.keys} == {
+        table.buckets.index(i) for i in range(len(table.keys))
+    }
+
+
+def test_large_tables_are_created_fast():
+    rnd = random.Random(0)
+    names = {"".join(rnd.choices(string.ascii_letters, k=rnd.randint(3, 20))) for _ in range(2000)}
+    # a big enum with members that only differ in the middle.
+    members = tuple(f"MEMBER_{i:04}_VALUE" for i in range(500))
+    start = time.perf_counter()
+    for keys in (tuple(names), members):
+        table = KeyTable.create(keys)
+        for index, key in enumerate(keys):
+            assert lookup(table, key) == index
+    assert time.perf_counter() - start < 5
+    assert all(lookup(table, key) == -1 for key in ("MEMBER_0500_VALUE", "x"))
+
+
+def test_fields_are_extracted_once():
+    output = generate_virtual(
+        schema=schemas.object_with_scalar.schema,
+        operations="""
+        query MainQuery {
+          constUser {
+            id
+            name
+          }
+        }
+        """,
+    )
+    operation_cpp = output.operations[0].sources[1].content
+    assert (
+        'KeyTable<2, 3> User__constUser{{QLatin1StringView("id"), QLatin1StringView("name")}'
+        in operation_cpp
+    )
+    # once in the deserializer and once in the updater.
+    assert (
+        operation_cpp.count(
+            "const auto qtgql__json = qtgql::bases::keys::extract(data, field_keys::User__constUser);",
+        )
+        == 2
+    )
+    assert 'data.value("' not in operation_cpp
+
+
+def test_enum_members_table():
+    output = generate_virtual(
+        schema=schemas.object_with_enum.schema,
+        operations="""
+        query MainQuery {
+          user {
+            status
+          }
+        }
+        """,
+    )
+    common = next(f for f in output.schema.sources if f.path.name == "_common.hpp").content
+    table = KeyTable.create(("Connected", "Stale", "Disconnected"))
+    # the index of a name is the value of the member.
+    assert f"static constexpr {table.cpp_type} members{table.cpp_initializer};" in common
+    assert "std::pair<QString" not in common
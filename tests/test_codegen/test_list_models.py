@@ -0,0 +1,91 @@
+from qtgqlcodegen.core.template import CmakeTemplateContext, cmake_template
+
+from tests.test_codegen import schemas
+from tests.test_codegen.testcases import generate_virtual
+
+OPERATIONS = """
+query MainQuery {
+  user {
+    friends {
+      name
+    }
+  }
+}
+
+mutation AddFriend($userId: ID!, $name: String!) {
+  addFriend(userId: $userId, name: $name) {
+    friends {
+      name
+    }
+  }
+}
+"""
+
+
+def test_list_models_are_instantiated_by_the_operation():
+    output = generate_virtual(
+        test_name="ListModelsTestCase",
+        schema=schemas.object_with_list_of_object.schema,
+        operations=OPERATIONS,
+    )
+    main_query_model = (
+        "qtgql::bases::ListModelABC<ListModelsTestCase::mainquery::Person__userfriends *>"
+    )
+    add_friend_model = (
+        "qtgql::bases::ListModelABC<ListModelsTestCase::addfriend::Person__addFriendfriends *>"
+    )
+    main_query, add_friend = output.operations
+    for op, model in ((main_query, main_query_model), (add_friend, add_friend_model)):
+        hpp, cpp = (source.content for source in op.sources)
+        export_macro = op.context.export_macro
+        assert f"extern template class {export_macro} {model};" in hpp
+        assert f"\ntemplate class {export_macro} {model};" in cpp
+    assert main_query_model not in add_friend.sources[1].content
+    # the proxy types and their models are in the same library.
+    config = output.operations[0].context.config
+    cmake = cmake_template(CmakeTemplateContext(config=config, generation_output=output))
+    assert "listmodels" not in cmake
+
+
+def test_models_of_shared_types_are_instantiated_by_fragments():
+    output = generate_virtual(
+        test_name="ListModelsTestCase",
+        schema=schemas.object_with_list_of_object.schema,
+        operations="""
+        fragment UserFragment on User {
+          friends {
+            name
+          }
+        }
+
+        query MainQuery {
+          user {
+            ...UserFragment
+          }
+        }
+        """,
+    )
+    assert output.fragments
+    model = "qtgql::bases::ListModelABC<ListModelsTestCase::fragments::"
+    fragments_hpp, fragments_cpp = (source.content for source in output.fragments.sources)
+    assert f"extern template class {output.fragments.context.export_macro} {model}" in (
+        fragments_hpp
+    )
+    assert f"\ntemplate class {output.fragments.context.export_macro} {model}" in fragments_cpp
+    assert all(model not in source.content for source in output.operations[0].sources)
+
+
+def test_no_list_models():
+    output = generate_virtual(
+        test_name="ListModelsTestCase",
+        schema=schemas.object_with_list_of_object.schema,
+        operations="""
+        query MainQuery {
+          user {
+            id
+          }
+        }
+        """,
+    )
+    assert "template class" not in output.operations[0].sources[0].content
+    assert "template class" not in output.operations[0].sources[1].content
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from qtgqlcodegen.report import GenerationReport, create_report, parse_ninja_log
+
+from tests.test_codegen import schemas
+from tests.test_codegen.testcases import generate_virtual
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def report(ninja_log: Path | None = None, **config_options) -> GenerationReport:
+    output = generate_virtual(
+        test_name="ReportTestCase",
+        schema=schemas.object_with_object.schema,
+        operations="""
+        query MainQuery {
+          user {
+            person {
+              name
+              age
+            }
+          }
+        }
+        query OnlyName {
+          user {
+            person {
+              name
+            }
+          }
+        }
+        """,
+        **config_options,
+    )
+    return create_report(output, output.operations[0].context.config, ninja_log)
+
+
+def test_report_counts_per_narrowed_type():
+    generation_report = report()
+    main_query = next(op for op in generation_report.operations if op.name == "MainQuery")
+    types = {t.concrete: t for t in main_query.narrowed_types}
+    assert types["Person"].fields == 3  # id is injected.
+    assert types["Person"].signals == 3
+    assert types["Person"].connections == 3
+    assert types["Person"].deserializers == 1
+    assert types["Query"].deserializers == 0  # root types are never deserialized.
+    assert main_query.deserializers == 2
+    assert main_query.updaters == 3
+    assert main_query.classes == 5
+    assert sum(t.lines for t in main_query.narrowed_types) < main_query.lines
+    only_name = next(op for op in generation_report.operations if op.name == "OnlyName")
+    assert only_name.lines < main_query.lines
+    assert generation_report.sorted_by_cost()[0] is main_query
+    assert main_query.compile_seconds is None
+
+
+def test_report_deserialize_only_operation():
+    generation_report = report(deserialize_only_operations={"MainQuery"})
+    main_query = next(op for op in generation_report.operations if op.name == "MainQuery")
+    types = {t.concrete: t for t in main_query.narrowed_types}
+    assert main_query.connections == 4  # only the QML wrapper.
+    # nodes might be cached by other operations, their updaters are kept.
+    assert types["Person"].updaters == 1
+    assert types["Query"].updaters == 1
+    only_name = next(op for op in generation_report.operations if op.name == "OnlyName")
+    assert only_name.connections > main_query.connections
+
+
+def test_report_attaches_ninja_log_timings(tmp_path: Path):
+    ninja_log = tmp_path / ".ninja_log"
+    ninja_log.write_text(
+        "# ninja log v5\n"
+        "0\t1000\t0\tgen/CMakeFiles/ReportTestCaseMainQuery.dir/MainQuery.cpp.o\t1\n"
+        "0\t900\t0\tgen/CMakeFiles/ReportTestCaseMainQuery.dir/ReportTestCaseMainQuery_autogen/mocs_compilation.cpp.o\t2\n"
+        # rebuilt later, only the latest build should count.
+        "0\t1500\t0\tgen/CMakeFiles/ReportTestCaseMainQuery.dir/MainQuery.cpp.o\t3\n"
+        "0\t300\t0\tgen/libReportTestCaseMainQuery.so\t4\n",
+        "utf-8",
+    )
+    assert len(parse_ninja_log(ninja_log)) == 2
+    generation_report = report(ninja_log)
+    main_query = next(op for op in generation_report.operations if op.name == "MainQuery")
+    assert main_query.compile_seconds == 2.4
+    only_name = next(op for op in generation_report.operations if op.name == "OnlyName")
+    assert only_name.compile_seconds is None
+
+
+def test_report_attaches_timings_of_a_single_module(tmp_path: Path):
+    ninja_log = tmp_path / ".ninja_log"
+    ninja_log.write_text(
+        "# ninja log v5\n"
+        "0\t1000\t0\tgen/CMakeFiles/ReportTestCase.dir/MainQuery.cpp.o\t1\n"
+        "0\t700\t0\tgen/CMakeFiles/ReportTestCase.dir/OnlyName.cpp.o\t2\n"
+        # shared by all the operations.
+        "0\t900\t0\tgen/CMakeFiles/ReportTestCase.dir/ReportTestCase_autogen/mocs_compilation.cpp.o\t3\n"
+        "0\t500\t0\tgen/CMakeFiles/ReportTestCase.dir/schema/User.cpp.o\t4\n",
+        "utf-8",
+    )
+    generation_report = report(ninja_log, single_qml_module=True)
+    main_query = next(op for op in generation_report.operations if op.name == "MainQuery")
+    assert main_query.compile_seconds == 1.0
+    only_name = next(op for op in generation_report.operations if op.name == "OnlyName")
+    assert only_name.compile_seconds == 0.7
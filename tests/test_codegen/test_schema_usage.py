@@ -0,0 +1,64 @@
+from tests.test_codegen import schemas
+from tests.test_codegen.testcases import generate_virtual
+
+OPERATIONS = """
+mutation CreatePost($input: CreatePostInput!) {
+  createPost(input: $input) {
+    header
+  }
+}
+"""
+
+
+def schema_sources(keep_unused_schema_types: bool) -> str:
+    output = generate_virtual(
+        schema=schemas.input_type.schema,
+        operations=OPERATIONS,
+        keep_unused_schema_types=keep_unused_schema_types,
+    )
+    return "\n".join(source.content for source in output.schema.sources)
+
+
+def test_only_used_schema_types_are_generated():
+    schema_hpp = schema_sources(keep_unused_schema_types=False)
+    assert "struct CreatePostInput" in schema_hpp
+    assert "struct ModifyPostContentInput" not in schema_hpp
+    assert "class Query;" not in schema_hpp
+    # the selected field and the id of the node.
+    assert "set_header(" in schema_hpp
+    assert "set_id(" in schema_hpp
+    assert "set_content(" not in schema_hpp
+    assert "set_modifyPostContent(" not in schema_hpp
+    assert "set_createPost(" in schema_hpp
+
+
+def test_keep_unused_schema_types():
+    schema_hpp = schema_sources(keep_unused_schema_types=True)
+    assert "struct ModifyPostContentInput" in schema_hpp
+    assert "set_content(" in schema_hpp
+    assert "set_modifyPostContent(" in schema_hpp
+
+
+def test_each_type_has_its_own_header():
+    output = generate_virtual(schema=schemas.input_type.schema, operations=OPERATIONS)
+    generated_dir = output.schema.context.config.generated_dir
+    sources = {
+        source.path.relative_to(generated_dir).as_posix(): source
+        for source in output.schema.sources
+    }
+    assert sorted(sources) == [
+        "schema.hpp",
+        "schema/Mutation.cpp",
+        "schema/Mutation.hpp",
+        "schema/Node.cpp",
+        "schema/Node.hpp",
+        "schema/Post.cpp",
+        "schema/Post.hpp",
+        "schema/_common.hpp",
+    ]
+    assert '#include "./Node.hpp"' in sources["schema/Post.hpp"].content
+    # accessors are defined out of line.
+    assert "Post::set_header(" in sources["schema/Post.cpp"].content
+    operation_hpp = output.operations[0].sources[0].content
+    assert '#include "./schema/Post.hpp"' in operation_hpp
+    assert '#include "./schema.hpp"' not in operation_hpp
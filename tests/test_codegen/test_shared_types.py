@@ -0,0 +1,171 @@
+import strawberry
+from qtgqlcodegen.generator import GenerationOutput
+
+from tests.test_codegen import schemas
+from tests.test_codegen.testcases import generate_virtual
+
+
+def get_operation(output: GenerationOutput, name: str):
+    return next(op for op in output.operations if op.name == name).context.operation
+
+
+def test_fragment_types_are_shared_across_operations():
+    output = generate_virtual(
+        schema=schemas.object_with_object.schema,
+        operations="""
+        fragment UserFragment on User {
+          person {
+            name
+          }
+        }
+        query MainQuery {
+          user {
+            ...UserFragment
+          }
+        }
+        mutation ChangeName($nodeId: ID!, $newName: String!) {
+          changeName(nodeId: $nodeId, newName: $newName) {
+            ...UserFragment
+          }
+        }
+        """,
+    )
+    assert output.fragments
+    fragments = output.fragments.context.fragments
+    assert sorted(t.name for t in fragments.narrowed_types) == [
+        "Person__UserFragmentperson",
+        "User__UserFragment",
+    ]
+    main_query = get_operation(output, "MainQuery")
+    change_name = get_operation(output, "ChangeName")
+    assert main_query.uses_shared_types
+    assert main_query.root_fields[0].type.type_name() == "fragments::User__UserFragment"
+    assert change_name.root_fields[0].type is main_query.root_fields[0].type
+    # only the root types are generated by the operations themselves.
+    assert [t.name for t in main_query.narrowed_types] == ["Query__"]
+    assert [t.name for t in change_name.narrowed_types] == ["Mutation__"]
+
+
+def test_fragment_with_operation_variables_is_not_shared():
+    output = generate_virtual(
+        schema=schemas.object_with_optional_scalar.schema,
+        operations="""
+        fragment GetUserQuery on Query {
+          user(retNone: $returnNone) {
+            name
+          }
+        }
+        query MainQuery($returnNone: Boolean! = false) {
+          ...GetUserQuery
+        }
+        """,
+    )
+    assert output.fragments is None
+    assert not get_operation(output, "MainQuery").uses_shared_types
+
+
+@strawberry.type
+class Person:
+    name: str
+    age: int
+
+
+@strawberry.type
+class User:
+    friend: Person
+    best_friend: Person
+
+
+@strawberry.type
+class Query:
+    user: User
+
+
+def test_structurally_identical_selections_share_a_type():
+    output = generate_virtual(
+        schema=strawberry.Schema(query=Query),
+        operations="""
+        query MainQuery {
+          user {
+            friend {
+              name
+            }
+            bestFriend {
+              name
+            }
+          }
+        }
+        query OtherQuery {
+          user {
+            friend {
+              name
+            }
+            bestFriend {
+              name
+              age
+            }
+          }
+        }
+        """,
+    )
+    assert output.fragments is None
+    main_query = get_operation(output, "MainQuery")
+    assert sorted(t.name for t in main_query.narrowed_types) == [
+        "Person__userfriend",
+        "Query__",
+        "User__user",
+    ]
+    user = main_query.root_fields[0].type
+    assert user.fields_dict["bestFriend"].type is user.fields_dict["friend"].type
+    other_query = get_operation(output, "OtherQuery")
+    assert len(other_query.narrowed_types) == 4
+
+
+def test_unselected_implementations_share_a_generic_type():
+    output = generate_virtual(
+        schema=schemas.non_node_interface_field.schema,
+        operations="""
+        query AnimalQuery($kind: AnimalKind!) {
+          animal(kind: $kind) {
+            age
+            ... on Person {
+              language
+            }
+          }
+        }
+        """,
+    )
+    animal = get_operation(output, "AnimalQuery").root_fields[0].type
+    assert [choice.name for choice in animal.choices] == [
+        "Person__animal",
+        "AnimalInterface__animal__generic",
+    ]
+    generic = animal.choices[-1]
+    assert generic.concrete is animal.concrete
+    assert [impl.name for impl in generic.implementations] == ["Dog"]
+    assert list(generic.fields_dict) == list(animal.fields_dict)
+
+
+def test_headless_output():
+    output = generate_virtual(
+        schema=schemas.non_node_union.schema,
+        operations="""
+        query MainQuery($choice: UnionChoice!) {
+          whoAmI(choice: $choice) {
+            ... on Frog {
+              name
+            }
+            ... on Person {
+              age
+            }
+          }
+        }
+        """,
+        headless=True,
+    )
+    assert [spec.path.name for spec in output.headless] == ["schema.hpp", "MainQuery.hpp"]
+    assert all(spec.path.parent.name == "headless" for spec in output.headless)
+    operation = output.headless[1].content
+    assert "std::variant<Frog__whoAmI, Person__whoAmI> whoAmI" in operation
+    assert "Q_OBJECT" not in operation
+    assert "qtgql::headless::OperationHandler<Query__>" in operation
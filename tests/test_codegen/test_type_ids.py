@@ -0,0 +1,42 @@
+from tests.test_codegen import schemas
+from tests.test_codegen.testcases import generate_virtual
+
+OPERATIONS = """
+query MainQuery {
+  randPerson {
+    pets {
+      ... on Dog {
+        name
+      }
+      ... on Cat {
+        name
+      }
+    }
+  }
+}
+"""
+
+
+def test_type_ids_are_generated():
+    output = generate_virtual(schema=schemas.list_of_union.schema, operations=OPERATIONS)
+    common = next(f for f in output.schema.sources if f.path.name == "_common.hpp").content
+    type_ids = common.split("struct TypeIds{")[1].split("};")[0]
+    context = output.schema.context
+    for index, t in enumerate(context.types):
+        assert f"{t.name} = {index}," in type_ids
+        assert context.type_ids.index_of(t.name) == index
+    assert "[[nodiscard]] static int by_name(QAnyStringView type_name)" in common
+    cat_cpp = next(f for f in output.schema.sources if f.path.name == "Cat.cpp").content
+    assert "return TypeIds::Cat;" in cat_cpp
+
+
+def test_type_names_are_not_compared():
+    output = generate_virtual(schema=schemas.list_of_union.schema, operations=OPERATIONS)
+    operation_cpp = output.operations[0].sources[1].content
+    # deserializers map `__typename` once, proxies use the id of the concrete.
+    assert "switch (TypeIds::by_name(pets_typename)){" in operation_cpp
+    assert "switch (concrete->qtgql_type_id()){" in operation_cpp
+    assert "case TypeIds::Dog:{" in operation_cpp
+    assert "proxy_to_update->qtgql_type_id() == TypeIds::Cat" in operation_cpp
+    assert '== "Dog"' not in operation_cpp
+    assert '== "Cat"' not in operation_cpp
@@ -21,6 +21,7 @@ import tests.test_codegen.schemas as schemas
 from tests.test_codegen.utils import temp_cwd
 
 if TYPE_CHECKING:
+    from qtgqlcodegen.generator import GenerationOutput
     from strawberry import Schema
 
 GENERATED_TESTS_DIR = Path(__file__).parent.parent / "gen"
@@ -74,6 +75,15 @@ class QtGqlTestCase:
     schema: Schema
     test_name: str
     custom_scalars: dict = Factory(dict)
+    deserialize_only_operations: set[str] = Factory(set)
+    headless: bool = False
+    single_qml_module: bool = False
+    table_driven_deserialization: bool = False
+    skip_unchanged_subtrees: bool = False
+    lazy_deserialization: bool = False
+    lazy_proxies: bool = False
+    args_cache_size: int = 0
+    args_cache_sizes: dict[str, int] = Factory(dict)
     qml_file: str = ""
     metadata: TestCaseMetadata = attrs.Factory(TestCaseMetadata)
     is_virtual_test: bool = False
@@ -127,6 +137,15 @@ class QtGqlTestCase:
             graphql_dir=self.graphql_dir,
             env_name="default_env",
             custom_scalars=self.custom_scalars,
+            deserialize_only_operations=self.deserialize_only_operations,
+            headless=self.headless,
+            single_qml_module=self.single_qml_module,
+            table_driven_deserialization=self.table_driven_deserialization,
+            skip_unchanged_subtrees=self.skip_unchanged_subtrees,
+            lazy_deserialization=self.lazy_deserialization,
+            lazy_proxies=self.lazy_proxies,
+            args_cache_size=self.args_cache_size,
+            args_cache_sizes=self.args_cache_sizes,
             generated_dir_name="../gen",
             qml_plugins_path="${CMAKE_BINARY_DIR}/tests",
         )
@@ -183,6 +202,25 @@ class QtGqlTestCase:
             CLI_RUNNER.invoke(app, "gen", catch_exceptions=False)
 
 
+def generate_virtual(testcase: QtGqlTestCase | None = None, **kwargs) -> GenerationOutput:
+    """Generates a virtual testcase (nothing is kept in `tests/gen`) and returns the output.
+
+    `kwargs` override the attributes of `testcase` or initialize a new one, those
+    that aren't attributes of a testcase override its config.
+    """
+    kwargs.setdefault("test_name", "VirtualTestCase")
+    fields = attrs.fields_dict(QtGqlTestCase)
+    config_options = {name: kwargs.pop(name) for name in list(kwargs) if name not in fields}
+    if testcase:
+        virtual = attrs.evolve(testcase, is_virtual_test=True, **kwargs)
+    else:
+        virtual = QtGqlTestCase(is_virtual_test=True, **kwargs)
+    for name, value in config_options.items():
+        setattr(virtual.config, name, value)
+    with virtual.virtual_generate():
+        return virtual.evaluator.generate()
+
+
 RootScalarTestCase = QtGqlTestCase(
     schema=schemas.root_scalar.schema,
     operations="""
@@ -222,6 +260,119 @@ ScalarsTestCase = QtGqlTestCase(
     test_name="Scalars",
 )
 
+TableDrivenDeserializationTestCase = QtGqlTestCase(
+    schema=schemas.object_with_scalar.schema,
+    operations=ScalarsTestCase.operations,
+    table_driven_deserialization=True,
+    test_name="TableDrivenDeserialization",
+)
+
+SkipUnchangedSubtreesTestCase = QtGqlTestCase(
+    schema=schemas.object_with_scalar.schema,
+    operations=ScalarsTestCase.operations,
+    skip_unchanged_subtrees=True,
+    test_name="SkipUnchangedSubtrees",
+)
+
+LazyDeserializationTestCase = QtGqlTestCase(
+    schema=schemas.object_with_scalar.schema,
+    operations=ScalarsTestCase.operations,
+    lazy_deserialization=True,
+    test_name="LazyDeserialization",
+)
+
+LazyNestedObjectTestCase = QtGqlTestCase(
+    schema=schemas.object_with_non_node_object.schema,
+    operations="""
+    query MainQuery($key: String!) {
+      user(key: $key) {
+        name
+        address {
+          street
+          city
+        }
+        pets {
+          name
+        }
+      }
+    }
+
+    mutation ChangeStreet($nodeId: ID!, $street: String!) {
+      changeStreet(nodeId: $nodeId, street: $street) {
+        address {
+          street
+        }
+      }
+    }
+    """,
+    lazy_deserialization=True,
+    lazy_proxies=True,
+    test_name="LazyNestedObject",
+)
+
+MultipleRootFieldsTestCase = QtGqlTestCase(
+    schema=schemas.object_with_scalar.schema,
+    operations="""
+        query MainQuery {
+          constUser {
+            id
+            name
+            age
+          }
+          user {
+            id
+            name
+            male
+          }
+        }
+        """,
+    test_name="MultipleRootFields",
+)
+
+DeserializeOnlyTestCase = QtGqlTestCase(
+    schema=schemas.object_with_scalar.schema,
+    operations="""
+        query MainQuery {
+          constUser {
+            id
+            name
+            age
+            male
+          }
+        }
+        query UserWithSameIDDiffFields {
+          constUserWithModifiedFields {
+            id
+            name
+            age
+            male
+          }
+        }
+        """,
+    deserialize_only_operations={"UserWithSameIDDiffFields"},
+    test_name="DeserializeOnly",
+)
+
+HeadlessTestCase = QtGqlTestCase(
+    schema=schemas.non_node_union.schema,
+    operations="""
+        query MainQuery($choice: UnionChoice!) {
+          whoAmI(choice: $choice) {
+            ... on Frog {
+              name
+              color
+            }
+            ... on Person {
+              name
+              age
+            }
+          }
+        }
+        """,
+    headless=True,
+    test_name="Headless",
+)
+
 SimpleGarbageCollection = QtGqlTestCase(
     schema=schemas.object_with_scalar.schema,
     operations="""
@@ -402,6 +553,21 @@ ScalarArgumentsTestCase = QtGqlTestCase(
     test_name="ScalarArguments",
 )
 
+ArgsCacheSizeTestCase = QtGqlTestCase(
+    schema=schemas.scalar_arguments.schema,
+    operations=ScalarArgumentsTestCase.operations,
+    args_cache_size=2,
+    test_name="ArgsCacheSize",
+)
+
+ArgsCacheSizePerFieldTestCase = QtGqlTestCase(
+    schema=schemas.scalar_arguments.schema,
+    operations=ScalarArgumentsTestCase.operations,
+    args_cache_size=1,
+    args_cache_sizes={"Query.getContainer": 3},
+    test_name="ArgsCacheSizePerField",
+)
+
 
 OperationErrorTestCase = QtGqlTestCase(
     schema=schemas.operation_error.schema,
@@ -491,6 +657,13 @@ ObjectWithListOfObjectTestCase = QtGqlTestCase(
     test_name="ObjectWithListOfObject",
 )
 
+LazyProxiesTestCase = QtGqlTestCase(
+    schema=schemas.object_with_list_of_object.schema,
+    operations=ObjectWithListOfObjectTestCase.operations,
+    lazy_proxies=True,
+    test_name="LazyProxies",
+)
+
 
 NonNodeInterfaceTestCase = QtGqlTestCase(
     schema=schemas.non_node_interface_field.schema,
@@ -528,6 +701,32 @@ NonNodeInterfaceTestCase = QtGqlTestCase(
     test_name="NonNodeInterface",
 )
 
+# implementations without specific selections share a generic type.
+InterfaceGenericImplementationTestCase = QtGqlTestCase(
+    schema=schemas.non_node_interface_field.schema,
+    operations="""
+    query AnimalQuery($kind: AnimalKind!) {
+      animal(kind: $kind) {
+        kind
+        age
+        id
+      }
+    }
+
+    mutation ChangeAgeMutation($id: ID!, $newAge: Int!) {
+      changeAge(animalId: $id, newAge: $newAge) {
+        age
+        id
+        ... on Person {
+          language
+        }
+        kind
+      }
+    }
+    """,
+    test_name="InterfaceGenericImplementation",
+)
+
 
 NodeInterfaceFieldTestCase = QtGqlTestCase(
     schema=schemas.node_interface_field.schema,
@@ -680,10 +879,21 @@ ListOfNonNodeType = QtGqlTestCase(
     mutation InsertUser($at: Int!, $name: String!) {
       insertUser(at: $at, name: $name)
     }
+
+    mutation RemoveUser($at: Int!) {
+      removeUser(at: $at)
+    }
     """,
     test_name="ListOfNonNodeType",
 )
 
+LazyListOfNonNodeTestCase = QtGqlTestCase(
+    schema=schemas.list_of_non_node.schema,
+    operations=ListOfNonNodeType.operations,
+    lazy_proxies=True,
+    test_name="LazyListOfNonNode",
+)
+
 ListOfUnionTestCase = QtGqlTestCase(
     schema=schemas.list_of_union.schema,
     operations="""
@@ -729,6 +939,20 @@ ListOfUnionTestCase = QtGqlTestCase(
     test_name="ListOfUnion",
 )
 
+TableDrivenNestedObjectTestCase = QtGqlTestCase(
+    schema=schemas.object_with_object.schema,
+    operations=NestedObjectTestCase.operations,
+    table_driven_deserialization=True,
+    test_name="TableDrivenNestedObject",
+)
+
+TableDrivenListOfUnionTestCase = QtGqlTestCase(
+    schema=schemas.list_of_union.schema,
+    operations=ListOfUnionTestCase.operations,
+    table_driven_deserialization=True,
+    test_name="TableDrivenListOfUnion",
+)
+
 ListOfInterfaceTestcase = QtGqlTestCase(
     schema=schemas.list_of_interface.schema,
     operations=ListOfUnionTestCase.operations.replace("pets {", "pets { name"),
@@ -956,6 +1180,17 @@ QmlUsageTestCase = QtGqlTestCase(
     ),
 )
 
+SingleQmlModuleTestCase = QtGqlTestCase(
+    schema=schemas.qml_usage_test.schema,
+    operations=QmlUsageTestCase.operations,
+    single_qml_module=True,
+    test_name="SingleQmlModule",
+    metadata=TestCaseMetadata(
+        should_test_updates=BoolWithReason.false("qml testcase"),
+        should_test_deserialization=BoolWithReason.false("qml testcase"),
+    ),
+)
+
 ListOfScalarTestCase = QtGqlTestCase(
     schema=schemas.list_of_scalar.schema,
     operations="""
@@ -1084,6 +1319,13 @@ PartiallyInitializedNode = QtGqlTestCase(
 
 all_test_cases = [
     ScalarsTestCase,
+    TableDrivenDeserializationTestCase,
+    SkipUnchangedSubtreesTestCase,
+    LazyDeserializationTestCase,
+    LazyNestedObjectTestCase,
+    MultipleRootFieldsTestCase,
+    DeserializeOnlyTestCase,
+    HeadlessTestCase,
     SimpleGarbageCollection,
     GqlOverHttpAsEnvTestCase,
     OptionalScalarsTestCase,
@@ -1095,22 +1337,30 @@ all_test_cases = [
     NestedObjectTestCase,
     OptionalNestedObjectTestCase,
     ObjectWithListOfObjectTestCase,
+    LazyProxiesTestCase,
     ScalarArgumentsTestCase,
+    ArgsCacheSizeTestCase,
+    ArgsCacheSizePerFieldTestCase,
     EnumTestCase,
     RootScalarTestCase,
     NonNodeTypeTestCase,
     InputTypeOperationVariableTestCase,
     NonNodeInterfaceTestCase,
+    InterfaceGenericImplementationTestCase,
     NodeInterfaceFieldTestCase,
     NonNodeUnionTestCase,
     ListOfNonNodeType,
+    LazyListOfNonNodeTestCase,
     ListOfUnionTestCase,
+    TableDrivenNestedObjectTestCase,
+    TableDrivenListOfUnionTestCase,
     ListOfInterfaceTestcase,
     FragmentTestCase,
     FragmentsOnInterfaceTestCase,
     FragmentWithOperationVariable,
     NodeUnionTestCase,
     QmlUsageTestCase,
+    SingleQmlModuleTestCase,
     ListOfScalarTestCase,
     ListOfScalarArgumentTestCase,
     ListOfScalarInInputObjectTestCase,
@@ -1124,6 +1374,13 @@ all_test_cases = [
 
 implemented_testcases = [
     ScalarsTestCase,
+    TableDrivenDeserializationTestCase,
+    SkipUnchangedSubtreesTestCase,
+    LazyDeserializationTestCase,
+    LazyNestedObjectTestCase,
+    MultipleRootFieldsTestCase,
+    DeserializeOnlyTestCase,
+    HeadlessTestCase,
     SimpleGarbageCollection,
     GqlOverHttpAsEnvTestCase,
     NoIdOnQueryTestCase,
@@ -1135,22 +1392,30 @@ implemented_testcases = [
     NestedObjectTestCase,
     OptionalNestedObjectTestCase,
     ObjectWithListOfObjectTestCase,
+    LazyProxiesTestCase,
     EnumTestCase,
     NonNodeInterfaceTestCase,
+    InterfaceGenericImplementationTestCase,
     ScalarArgumentsTestCase,
+    ArgsCacheSizeTestCase,
+    ArgsCacheSizePerFieldTestCase,
     RootScalarTestCase,
     NonNodeTypeTestCase,
     InputTypeOperationVariableTestCase,
     NodeInterfaceFieldTestCase,
     NonNodeUnionTestCase,
     ListOfNonNodeType,
+    LazyListOfNonNodeTestCase,
     ListOfUnionTestCase,
+    TableDrivenNestedObjectTestCase,
+    TableDrivenListOfUnionTestCase,
     ListOfInterfaceTestcase,
     FragmentTestCase,
     FragmentsOnInterfaceTestCase,
     FragmentWithOperationVariable,
     NodeUnionTestCase,
     QmlUsageTestCase,
+    SingleQmlModuleTestCase,
     ListOfScalarTestCase,
     ListOfScalarArgumentTestCase,
     ListOfScalarInInputObjectTestCase,
@@ -52,3 +52,75 @@ TEST_CASE("Test custom scalar by hand implementation") {
     REQUIRE(s.get_value().toStdString() == "just value");
   }
 }
+
+struct CustomStringTraits {
+  using value_type = QString;
+  using qt_type = QString;
+
+  static const QString &GRAPHQL_NAME() {
+    static QString ret = "CustomStringScalar";
+    return ret;
+  }
+  static QString deserialize(const QJsonValue &raw_data) {
+    return raw_data.toString();
+  }
+  static QJsonValue serialize(const QString &value) { return {value}; }
+  static QString to_qt(const QString &value) {
+    return QString("Decoration-") + value;
+  }
+};
+
+using CustomStringValue =
+    qtgql::customscalars::ScalarValue<CustomStringTraits>;
+
+TEST_CASE("Test value semantic custom scalar") {
+  SECTION("from json") {
+    auto s = CustomStringValue::from_json({"initial"});
+    REQUIRE(s.to_qt() == "Decoration-initial");
+    REQUIRE(s.GRAPHQL_NAME() == "CustomStringScalar");
+    REQUIRE(s.raw_equals({"initial"}));
+    REQUIRE_FALSE(s.raw_equals({"second"}));
+    REQUIRE(s != CustomStringValue::from_json({"second"}));
+  }
+  SECTION("to_json") {
+    auto s = CustomStringValue("initial");
+    REQUIRE(s.serialize() == QJsonValue("initial"));
+    REQUIRE(s == CustomStringValue::from_json({"initial"}));
+  }
+  SECTION("get_value") {
+    auto s = CustomStringValue("just value");
+    REQUIRE(s.get_value().toStdString() == "just value");
+  }
+}
+
+// extends a provided scalar through `CustomScalarABC`.
+class ShortDateScalar : public qtgql::customscalars::DateScalar {
+public:
+  using qtgql::customscalars::DateScalar::DateScalar;
+
+  const QString &to_qt() override {
+    if (m_should_update) {
+      m_cached_to_qt = m_value.toString("dd.MM");
+      m_should_update = false;
+    }
+    return m_cached_to_qt;
+  }
+};
+
+TEST_CASE("Test provided scalars as CustomScalarABC") {
+  std::shared_ptr<qtgql::customscalars::CustomScalarABC<QDate, QString>> s =
+      std::make_shared<ShortDateScalar>();
+  s->deserialize({"2023-05-17"});
+  REQUIRE(s->get_value() == QDate(2023, 5, 17));
+  REQUIRE(s->to_qt() == "17.05");
+  REQUIRE(s->GRAPHQL_NAME() == "Date");
+  REQUIRE(s->serialize() == QJsonValue("2023-05-17"));
+  auto provided = qtgql::customscalars::DateScalar(QDate(2023, 5, 17));
+  REQUIRE(provided.to_qt() ==
+          qtgql::customscalars::DateValue(QDate(2023, 5, 17)).to_qt());
+  auto decimal = qtgql::customscalars::DecimalScalar();
+  decimal.deserialize({"1.5"});
+  REQUIRE(decimal.to_qt() == "1.5");
+  REQUIRE(decimal.serialize() ==
+          qtgql::customscalars::DecimalValue::from_json({"1.5"}).serialize());
+}
@@ -1,5 +1,6 @@
 #include "testframework.hpp"
 #include "testutils.hpp"
+#include <QPointer>
 #include <qtgql/bases/bases.hpp>
 using namespace qtgql;
 
@@ -87,15 +88,63 @@ TEST_CASE("ListModelABC modifications and operations") {
     REQUIRE(model_with_data.last() == new_obj);
   }
   SECTION("test replace") {
-
+    QSignalSpy changed_spy(&model_with_data, &ModelType::dataChanged);
     auto before_count = model_with_data.rowCount();
     model_with_data.replace(model_with_data.rowCount() - 1, new_obj);
-    insert_spy.validate();
+    REQUIRE(changed_spy.count() == 1);
+    REQUIRE(p_pre_insert.isEmpty());
     auto after_count = model_with_data.rowCount();
     REQUIRE(before_count == after_count);
     REQUIRE(model_with_data.last() == new_obj);
   }
 
+  SECTION("test remove rows removes only the given rows") {
+    REQUIRE(model_with_data.removeRows(2, 3));
+    REQUIRE(p_pre_remove.count() == 1);
+    REQUIRE(p_pre_remove.first().at(1).toInt() == 2);
+    REQUIRE(p_pre_remove.first().at(2).toInt() == 4);
+    REQUIRE(model_with_data.rowCount() == 7);
+  }
+
+  SECTION("test append range notifies once") {
+    std::vector<QObject *> elements;
+    for (int i = 0; i < 100; i++) {
+      elements.emplace_back(new QObject(&parent_cleaner));
+    }
+    QSignalSpy count_spy(&model_with_data, &ModelType::countChanged);
+    model_with_data.append_range(elements);
+    REQUIRE(p_pre_insert.count() == 1);
+    REQUIRE(p_pre_insert.first().at(1).toInt() == 10);
+    REQUIRE(p_pre_insert.first().at(2).toInt() == 109);
+    REQUIRE(count_spy.count() == 1);
+    REQUIRE(model_with_data.rowCount() == 110);
+    REQUIRE(model_with_data.last() == elements.back());
+  }
+  SECTION("test insert range") {
+    model_with_data.insert_range(1, {new_obj, new_obj});
+    insert_spy.validate();
+    REQUIRE(model_with_data.rowCount() == 12);
+    REQUIRE(model_with_data.get(0) == init_vec[0]);
+    REQUIRE(model_with_data.get(2) == new_obj);
+    REQUIRE(model_with_data.get(3) == init_vec[1]);
+  }
+  SECTION("test assign changes only what differs") {
+    QSignalSpy changed_spy(&model_with_data, &ModelType::dataChanged);
+    auto elements = init_vec;
+    elements[3] = new_obj;
+    elements.push_back(new_obj);
+    model_with_data.assign(elements);
+    REQUIRE(changed_spy.count() == 1);
+    REQUIRE(changed_spy.first().at(0).value<QModelIndex>().row() == 3);
+    REQUIRE(changed_spy.first().at(1).value<QModelIndex>().row() == 3);
+    REQUIRE(p_pre_insert.count() == 1);
+    REQUIRE(p_pre_remove.isEmpty());
+    REQUIRE(model_with_data.rowCount() == 11);
+    model_with_data.assign({init_vec[0]});
+    REQUIRE(p_pre_remove.count() == 1);
+    REQUIRE(model_with_data.rowCount() == 1);
+  }
+
   SECTION("test current index prop") {
     bool ok = false;
     REQUIRE(model_with_data.property("currentIndex").toInt(&ok) == 0);
@@ -111,3 +160,175 @@ TEST_CASE("ListModelABC modifications and operations") {
     REQUIRE(ok);
   }
 }
+
+TEST_CASE("ListModelABC of bool") {
+  // `std::vector<bool>` elements are proxies, they are returned by value.
+  auto model = bases::ListModelABC<bool>(nullptr, {true, false, true});
+  REQUIRE(model.get(0));
+  REQUIRE(!model.get(1));
+  REQUIRE(model.first());
+  REQUIRE(model.last());
+  auto res = model.data(model.index(1), bases::ListModelABC<bool>::DATA_ROLE);
+  REQUIRE(res.typeId() == QMetaType::Bool);
+  REQUIRE(!res.toBool());
+}
+
+TEST_CASE("ListModelABC keyed updates") {
+  test_utils::QCleanerObject parent_cleaner(nullptr);
+  typedef bases::ListModelABC<QObject *> ModelType;
+
+  std::vector<QObject *> objects;
+  for (int i = 0; i < 10; i++) {
+    objects.emplace_back(new QObject(&parent_cleaner));
+  }
+  auto keys_of = [&](const std::vector<int> &indices) {
+    std::vector<ModelType::T_Key> ret;
+    for (auto i : indices) {
+      ret.push_back(objects[i]);
+    }
+    return ret;
+  };
+  auto create = [&](std::size_t) -> QObject * {
+    return new QObject(&parent_cleaner);
+  };
+  std::vector<QObject *> init_vec(objects.begin(), objects.begin() + 8);
+  auto model = ModelType(nullptr, init_vec);
+  model.set_keys(keys_of({0, 1, 2, 3, 4, 5, 6, 7}));
+
+  QSignalSpy inserted(&model, &ModelType::rowsInserted);
+  QSignalSpy removed(&model, &ModelType::rowsRemoved);
+  QSignalSpy moved(&model, &ModelType::rowsMoved);
+  QSignalSpy reset(&model, &ModelType::modelReset);
+
+  SECTION("test insert at the top inserts one row") {
+    model.sync(keys_of({9, 0, 1, 2, 3, 4, 5, 6, 7}), create);
+    REQUIRE(inserted.count() == 1);
+    REQUIRE(inserted.first().at(1).toInt() == 0);
+    REQUIRE(inserted.first().at(2).toInt() == 0);
+    REQUIRE(removed.isEmpty());
+    REQUIRE(moved.isEmpty());
+    REQUIRE(model.rowCount() == 9);
+    REQUIRE(model.get(1) == objects[0]);
+    REQUIRE(model.last() == objects[7]);
+  }
+
+  SECTION("test removes contiguous rows at once") {
+    model.sync(keys_of({0, 1, 5, 6, 7}), create);
+    REQUIRE(removed.count() == 1);
+    REQUIRE(removed.first().at(1).toInt() == 2);
+    REQUIRE(removed.first().at(2).toInt() == 4);
+    REQUIRE(inserted.isEmpty());
+    REQUIRE(model.get(2) == objects[5]);
+  }
+
+  SECTION("test moves keep the elements") {
+    model.sync(keys_of({7, 0, 1, 2, 3, 4, 5, 6}), create);
+    REQUIRE(moved.count() == 1);
+    REQUIRE(inserted.isEmpty());
+    REQUIRE(removed.isEmpty());
+    REQUIRE(model.first() == objects[7]);
+    REQUIRE(model.get(1) == objects[0]);
+  }
+
+  SECTION("test resets above the change ratio") {
+    model.sync(keys_of({8, 9, 0}), create);
+    REQUIRE(reset.count() == 1);
+    REQUIRE(inserted.isEmpty());
+    REQUIRE(removed.isEmpty());
+    REQUIRE(model.rowCount() == 3);
+    REQUIRE(model.last() == objects[0]);
+  }
+
+  SECTION("test resets if the keys are unknown") {
+    auto unkeyed = ModelType(nullptr, init_vec);
+    QSignalSpy unkeyed_reset(&unkeyed, &ModelType::modelReset);
+    unkeyed.sync(keys_of({0, 1, 2, 3, 4, 5, 6, 7}), create);
+    REQUIRE(unkeyed_reset.count() == 1);
+    REQUIRE(unkeyed.rowCount() == 8);
+  }
+
+  SECTION("test elements that aren't reused are deleted") {
+    std::vector<QPointer<QObject>> old(objects.begin(), objects.begin() + 8);
+    // the same node twice, the keys can't be diffed.
+    model.sync(keys_of({0, 0, 1}), create);
+    QCoreApplication::sendPostedEvents(nullptr, QEvent::DeferredDelete);
+    REQUIRE(reset.count() == 1);
+    REQUIRE(model.rowCount() == 3);
+    REQUIRE(std::all_of(old.begin(), old.end(),
+                        [](const auto &element) { return element.isNull(); }));
+    REQUIRE(model.get(0) != model.get(1));
+  }
+
+  SECTION("test sync after pop") {
+    model.pop(2);
+    model.sync(keys_of({0, 1, 3, 4, 5, 6, 7}), create);
+    REQUIRE(reset.isEmpty());
+    REQUIRE(removed.count() == 1); // by `pop`.
+    REQUIRE(inserted.isEmpty());
+    REQUIRE(model.rowCount() == 7);
+    REQUIRE(model.get(2) == objects[3]);
+  }
+
+  SECTION("test sync after remove rows") {
+    model.removeRows(1, 2);
+    model.sync(keys_of({0, 3, 4, 5, 6, 7, 8}), create);
+    REQUIRE(reset.isEmpty());
+    REQUIRE(removed.count() == 1); // by `removeRows`.
+    REQUIRE(inserted.count() == 1);
+    REQUIRE(inserted.first().at(1).toInt() == 6);
+    REQUIRE(model.get(1) == objects[3]);
+  }
+
+  SECTION("test sync after clear") {
+    model.clear();
+    model.sync(keys_of({0, 1}), create);
+    REQUIRE(model.rowCount() == 2);
+    REQUIRE(model.get(0) != objects[0]); // the cleared elements aren't reused.
+  }
+
+  SECTION("test sync after append resets") {
+    // the appended row has no key.
+    model.append(objects[9]);
+    model.sync(keys_of({0, 1, 2, 3, 4, 5, 6, 7}), create);
+    REQUIRE(reset.count() == 1);
+    REQUIRE(model.rowCount() == 8);
+  }
+
+  SECTION("test removed elements are deleted") {
+    QPointer<QObject> removed_element = objects[2];
+    model.sync(keys_of({0, 1, 3, 4, 5, 6, 7}), create);
+    QCoreApplication::sendPostedEvents(nullptr, QEvent::DeferredDelete);
+    REQUIRE(removed_element.isNull());
+    REQUIRE(!QPointer<QObject>(objects[3]).isNull());
+  }
+}
+
+TEST_CASE("ListModelABC truncate") {
+  test_utils::QCleanerObject parent_cleaner(nullptr);
+  typedef bases::ListModelABC<QObject *> ModelType;
+  // elements are created on first access like with `lazy_proxies`.
+  auto model = ModelType(nullptr, 5, [&](std::size_t) -> QObject * {
+    return new QObject(&parent_cleaner);
+  });
+  QPointer<QObject> kept = model.get(1);
+  QPointer<QObject> removed_element = model.get(3);
+  QSignalSpy removed(&model, &ModelType::rowsRemoved);
+
+  SECTION("test removes the rows at once and deletes their elements") {
+    model.truncate(2);
+    QCoreApplication::sendPostedEvents(nullptr, QEvent::DeferredDelete);
+    REQUIRE(model.rowCount() == 2);
+    REQUIRE(removed.count() == 1);
+    REQUIRE(removed.first().at(1).toInt() == 2);
+    REQUIRE(removed.first().at(2).toInt() == 4);
+    REQUIRE(removed_element.isNull());
+    REQUIRE(!kept.isNull());
+    REQUIRE(model.get(1) == kept);
+  }
+
+  SECTION("test nothing to remove") {
+    model.truncate(5);
+    REQUIRE(model.rowCount() == 5);
+    REQUIRE(removed.isEmpty());
+  }
+}